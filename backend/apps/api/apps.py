@@ -1,6 +1,23 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.api'
+
+    def ready(self):
+        from . import name_index, player_ids
+        from .models import PlayerIdInfo
+
+        for signal in (post_save, post_delete):
+            signal.connect(
+                name_index.invalidate,
+                sender=PlayerIdInfo,
+                dispatch_uid=f'player-name-index-{signal is post_save}',
+            )
+            signal.connect(
+                player_ids.invalidate,
+                sender=PlayerIdInfo,
+                dispatch_uid=f'player-id-cache-{signal is post_save}',
+            )
@@ -0,0 +1,213 @@
+"""Benchmark every API route against replayed upstream data.
+
+:func:`run_benchmarks` drives each route in ``apps.api.urls`` through the
+Django test client and reports, per route, throughput, latency percentiles,
+database query counts, peak Python memory and response sizes.  It is meant to
+run in replay mode (see :mod:`apps.api.replay`) so results reflect realistic
+payloads and a controlled upstream latency instead of the network.  Use the
+``benchmark_api`` management command to run it and write the JSON report.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import math
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+
+from . import urls as api_urls
+from .replay import replay_options
+
+# Values substituted for URL parameters.
+DEFAULT_PATH_PARAMS = {
+    "player_id": 592450,
+    "game_pk": 745455,
+    "team_id": 147,
+    "mlbam_team_id": 147,
+    "method_name": "fetch_team",
+}
+
+# Query strings for routes that need them, keyed by URL name.
+DEFAULT_QUERIES = {
+    "api-schedule": "date=2024-07-04",
+    "api-player-search": "q=judge",
+    "api-search": "q=new",
+    "api-player-career-stats": "player_ids=592450,660271,545361",
+    "api-player-splits": "season=2024",
+    "api-player-gamelog": "season=2024",
+    "api-player-statcast-batter": "start_date=2024-04-01&end_date=2024-04-30",
+    "api-player-statcast-pitcher": "start_date=2024-04-01&end_date=2024-04-30",
+    "api-unified-call": "team_id=147",
+}
+
+# Monitoring and introspection routes are not worth benchmarking; POST-only
+# routes cannot be benchmarked with GET requests.
+EXCLUDED_ROUTES = {
+    "api-metrics",
+    "api-upstream-health",
+    "api-endpoints",
+    "api-unified-methods",
+    "api-player-ids",
+}
+
+
+def api_routes(path_params=None, queries=None, only=None):
+    """Return ``[(name, path)]`` for every benchmarkable route."""
+    path_params = {**DEFAULT_PATH_PARAMS, **(path_params or {})}
+    queries = {**DEFAULT_QUERIES, **(queries or {})}
+    routes = []
+    for pattern in api_urls.urlpatterns:
+        if not isinstance(pattern, URLPattern) or not pattern.name:
+            continue
+        if pattern.name in EXCLUDED_ROUTES or (only and pattern.name not in only):
+            continue
+        kwargs = {key: path_params[key] for key in pattern.pattern.converters}
+        path = reverse(pattern.name, kwargs=kwargs)
+        if queries.get(pattern.name):
+            path = f"{path}?{queries[pattern.name]}"
+        routes.append((pattern.name, path))
+    return routes
+
+
+def percentile(values, pct):
+    """Return the ``pct`` percentile of ``values`` (nearest-rank)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _timed_request(path, host):
+    client = Client(raise_request_exception=False, HTTP_HOST=host)
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        response = client.get(path)
+        elapsed = time.perf_counter() - started
+    size = len(response.content) if not response.streaming else None
+    return elapsed, response.status_code, len(queries), size
+
+
+def _pooled_request(path, host):
+    try:
+        return _timed_request(path, host)
+    finally:
+        connections.close_all()
+
+
+def _peak_memory(path, host):
+    tracemalloc.start()
+    try:
+        _timed_request(path, host)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_route(
+    name, path, requests=20, concurrency=1, warmup=1, clear_cache=True, host=None
+):
+    """Benchmark a single route and return its result dict.
+
+    With ``clear_cache`` the cache is emptied first, so the warm-up requests
+    populate it from (replayed) upstream data.
+    """
+    host = host or (settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else "localhost")
+    if clear_cache:
+        cache.clear()
+    for _ in range(warmup):
+        _timed_request(path, host)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples = list(pool.map(lambda _: _pooled_request(path, host), range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = [s[0] * 1000 for s in samples]
+    statuses = {}
+    for _, status, _, _ in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    query_counts = [s[2] for s in samples]
+    sizes = [s[3] for s in samples if s[3] is not None]
+
+    return {
+        "name": name,
+        "path": path,
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": sum(count for status, count in statuses.items() if int(status) >= 400),
+        "status_codes": statuses,
+        "throughput_rps": round(requests / elapsed, 2) if elapsed else None,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies), 2),
+            "p50": round(percentile(latencies, 50), 2),
+            "p95": round(percentile(latencies, 95), 2),
+            "p99": round(percentile(latencies, 99), 2),
+            "max": round(max(latencies), 2),
+        },
+        "db_queries": {"mean": round(statistics.fmean(query_counts), 2), "max": max(query_counts)},
+        "response_bytes": max(sizes) if sizes else None,
+        "peak_memory_bytes": _peak_memory(path, host),
+    }
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=settings.BASE_DIR,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def run_benchmarks(
+    routes, requests=20, concurrency=1, warmup=1, clear_cache=True, progress=None
+):
+    """Benchmark ``routes`` and return the full JSON-serialisable report."""
+    results = []
+    for name, path in routes:
+        result = benchmark_route(name, path, requests, concurrency, warmup, clear_cache)
+        results.append(result)
+        if progress is not None:
+            progress(result)
+    replay = replay_options()
+    return {
+        "meta": {
+            "created": timezone.now().isoformat(),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "replay_mode": replay["MODE"],
+            "replay_latency": replay["LATENCY"],
+            "cache_enabled": getattr(settings, "UNIFIED_CLIENT_CACHE_ENABLED", True),
+            "requests": requests,
+            "concurrency": concurrency,
+            "warmup": warmup,
+            "clear_cache": clear_cache,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current):
+    """Return per-route ``(name, baseline_p95, current_p95, change_pct)`` rows."""
+    before = {r["name"]: r for r in baseline.get("results", [])}
+    rows = []
+    for result in current["results"]:
+        old = before.get(result["name"])
+        if old is None:
+            continue
+        old_p95 = old["latency_ms"]["p95"]
+        new_p95 = result["latency_ms"]["p95"]
+        change = round((new_p95 - old_p95) / old_p95 * 100, 1) if old_p95 else None
+        rows.append((result["name"], old_p95, new_p95, change))
+    return rows
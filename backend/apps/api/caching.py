@@ -0,0 +1,464 @@
+"""Caching proxy around ``UnifiedDataClient``.
+
+Views receive a :class:`CachingClient` from ``require_unified_client``.  Calls
+to methods listed in the cache policy are answered from ``django.core.cache``
+when possible; every other attribute is passed straight through to the
+wrapped client.  The policy maps method names to a time-to-live in seconds
+and can be tuned with the ``UNIFIED_CLIENT_CACHE_TTLS`` setting (a TTL of
+``0`` or ``None`` disables caching for that method).  Caching as a whole is
+toggled with ``UNIFIED_CLIENT_CACHE_ENABLED``.  Concurrent misses for the
+same call are coalesced into a single upstream fetch.
+
+Entries are stored with a soft and a hard expiry (see :func:`cached_fetch`).
+Methods listed in the stale-while-revalidate policy keep serving their last
+value for an extra window after the soft expiry while a background thread
+refreshes it, so requests never wait on those refreshes.  The extra windows
+can be tuned with ``UNIFIED_CLIENT_STALE_TTLS``.
+
+Underneath the cache, :class:`GuardedClient` sends every call through the
+``unified_client`` circuit breaker and keeps the last successful result of
+each cacheable call for ``UPSTREAM_LAST_GOOD_TTL`` seconds.  When the breaker
+is open or the upstream fails, that last known good payload is served and the
+request is marked stale (reported in the ``X-Upstream-Stale`` header).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from inspect import signature
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from .circuit import CircuitOpenError, UNIFIED_CLIENT_UPSTREAM, get_breaker, guarded
+from .client_pool import client_registry
+from .metrics import record_cache, record_upstream_call
+from .request_state import DeadlineExceeded, current_state, deadline_expired
+from .singleflight import coalesce
+
+logger = logging.getLogger(__name__)
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+DEFAULT_CACHE_POLICY = {
+    # Biographical and reference data rarely changes.
+    "fetch_player_info": DAY,
+    "fetch_player_headshot": DAY,
+    "fetch_team": DAY,
+    "fetch_team_spot_url": DAY,
+    "fetch_team_logo_url": DAY,
+    "playerid_reverse_lookup": DAY,
+    # Season aggregates move at most once per game.
+    "fetch_player_stats_career": 6 * HOUR,
+    "fetch_career_stats_for_players": 6 * HOUR,
+    "fetch_statcast_batter_data": 6 * HOUR,
+    "fetch_statcast_pitcher_data": 6 * HOUR,
+    "fetch_batting_splits": HOUR,
+    "fetch_pitching_splits": HOUR,
+    "fetch_batting_leaderboards": HOUR,
+    "fetch_pitching_leaderboards": HOUR,
+    "fetch_player_gamelog": 15 * MINUTE,
+    # Rosters, records and schedules.
+    "fetch_active_roster": HOUR,
+    "fetch_team_record_for_season": 10 * MINUTE,
+    "fetch_recent_schedule_for_team": 5 * MINUTE,
+    "fetch_schedule_for_date_range": MINUTE,
+    # Live data.
+    "fetch_game_live_feed": 10,
+}
+
+# Extra seconds a value may be served stale while it is refreshed in the
+# background.  Methods not listed here expire hard at their TTL.
+DEFAULT_STALE_POLICY = {
+    "fetch_schedule_for_date_range": 10 * MINUTE,
+    "fetch_recent_schedule_for_team": 30 * MINUTE,
+    "fetch_team_record_for_season": HOUR,
+    "fetch_active_roster": 6 * HOUR,
+    "fetch_batting_leaderboards": 6 * HOUR,
+    "fetch_pitching_leaderboards": 6 * HOUR,
+}
+
+DEFAULT_REFRESH_WORKERS = 4
+DEFAULT_LAST_GOOD_TTL = 7 * DAY
+
+CACHE_MODE_DEFAULT = "default"
+CACHE_MODE_BYPASS = "bypass"
+CACHE_MODE_REFRESH = "refresh"
+CACHE_MODE_HEADER = "X-Upstream-Cache"
+
+
+def cache_policy():
+    """Return the effective method → TTL mapping."""
+    policy = dict(DEFAULT_CACHE_POLICY)
+    policy.update(getattr(settings, "UNIFIED_CLIENT_CACHE_TTLS", {}) or {})
+    return policy
+
+
+def stale_policy():
+    """Return the effective method → stale window mapping."""
+    policy = dict(DEFAULT_STALE_POLICY)
+    policy.update(getattr(settings, "UNIFIED_CLIENT_STALE_TTLS", {}) or {})
+    return policy
+
+
+def caching_enabled():
+    return getattr(settings, "UNIFIED_CLIENT_CACHE_ENABLED", True)
+
+
+def _cache_header_allowed(request):
+    if getattr(settings, "UNIFIED_CLIENT_CACHE_HEADER_ENABLED", False):
+        return True
+    if settings.DEBUG:
+        return True
+    user = getattr(request, "user", None)
+    return bool(getattr(user, "is_staff", False))
+
+
+def cache_mode_for_request(request):
+    """Return the cache mode requested through the ``X-Upstream-Cache`` header.
+
+    ``bypass`` skips the cache entirely and ``refresh`` fetches upstream and
+    overwrites the cached entry.  Either one lets a caller force upstream
+    traffic, so the header is only honoured for staff users, when ``DEBUG`` is
+    on, or when ``UNIFIED_CLIENT_CACHE_HEADER_ENABLED`` is set.
+    """
+    mode = (request.headers.get(CACHE_MODE_HEADER) or "").strip().lower()
+    # Check the header first: the staff check loads the session and user.
+    if mode in (CACHE_MODE_BYPASS, CACHE_MODE_REFRESH) and _cache_header_allowed(request):
+        return mode
+    return CACHE_MODE_DEFAULT
+
+
+def make_cache_key(method_name, args=(), kwargs=None, func=None):
+    """Return a deterministic cache key for a client call.
+
+    When ``func`` is given, arguments are bound to its signature first so
+    positional and keyword spellings of the same call share a key.
+    """
+    kwargs = kwargs or {}
+    call_args = {"args": list(args), "kwargs": kwargs}
+    if func is not None:
+        try:
+            bound = signature(func).bind(*args, **kwargs)
+            bound.apply_defaults()
+            call_args = dict(bound.arguments)
+        except (TypeError, ValueError):
+            pass
+    payload = json.dumps(call_args, sort_keys=True, default=str)
+    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    return f"udc:{method_name}:{digest}"
+
+
+def _cache_get(key):
+    try:
+        return cache.get(key)
+    except Exception:  # pragma: no cover - defensive
+        logger.exception("Error reading cache key %s", key)
+        return None
+
+
+def _cache_set(key, value, timeout):
+    try:
+        cache.set(key, value, timeout)
+    except Exception:
+        # Unpicklable results (or a broken backend) should never fail the
+        # request; the value is simply not cached.
+        logger.debug("Unable to cache %s", key, exc_info=True)
+
+
+def _cache_delete(key):
+    try:
+        cache.delete(key)
+    except Exception:  # pragma: no cover - defensive
+        logger.exception("Error deleting cache key %s", key)
+
+
+_refresh_executor = None
+_executor_lock = threading.Lock()
+_refresh_lock = threading.Lock()
+_refreshing = {}
+
+
+def _executor():
+    global _refresh_executor
+    if _refresh_executor is None:
+        with _executor_lock:
+            if _refresh_executor is None:
+                workers = getattr(
+                    settings, "UPSTREAM_REFRESH_WORKERS", DEFAULT_REFRESH_WORKERS
+                )
+                _refresh_executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="cache-refresh"
+                )
+    return _refresh_executor
+
+
+def _store(key, value, ttl, stale_ttl):
+    _cache_set(key, (value, time.time() + ttl), ttl + stale_ttl)
+
+
+def _fetch_and_store(key, fetch, ttl, stale_ttl):
+    value = fetch()
+    if value is not None:
+        _store(key, value, ttl, stale_ttl)
+    return value
+
+
+def _unwrap(entry):
+    return entry[0] if isinstance(entry, tuple) and len(entry) == 2 else None
+
+
+def schedule_refresh(key, fetch, ttl, stale_ttl):
+    """Refresh ``key`` on the background executor unless already refreshing.
+
+    Returns the :class:`~concurrent.futures.Future` of the refresh, or
+    ``None`` when another thread or worker is already refreshing the key.
+    """
+    with _refresh_lock:
+        future = _refreshing.get(key)
+        if future is not None and not future.done():
+            return None
+        # Keep other worker processes from refreshing the same key.
+        try:
+            if not cache.add(f"refreshing:{key}", 1, max(ttl, 1)):
+                return None
+        except Exception:  # pragma: no cover - defensive
+            logger.exception("Error acquiring refresh marker for %s", key)
+
+        def _refresh():
+            try:
+                return _fetch_and_store(key, fetch, ttl, stale_ttl)
+            except Exception:
+                logger.exception("Background refresh failed for %s", key)
+                return None
+            finally:
+                _cache_delete(f"refreshing:{key}")
+                with _refresh_lock:
+                    _refreshing.pop(key, None)
+                connections.close_all()
+
+        future = _executor().submit(_refresh)
+        _refreshing[key] = future
+        return future
+
+
+def cached_fetch(
+    key, fetch, ttl, stale_ttl=0, mode=CACHE_MODE_DEFAULT, refresh=None, name=None
+):
+    """Return the value for ``key``, calling ``fetch`` only when needed.
+
+    Values are stored as ``(value, fresh_until)`` with a hard expiry of
+    ``ttl + stale_ttl`` seconds.  A fresh value is returned directly.  Between
+    the soft and the hard expiry the stale value is returned immediately and
+    ``refresh`` (defaulting to ``fetch``) is scheduled on a background thread.
+    ``refresh`` runs on that thread, so it should not reuse a client owned by
+    the calling thread; see :func:`thread_client`.  A missing value is fetched
+    synchronously, with concurrent misses coalesced into one fetch.  ``name``
+    labels the lookup in the cache metrics (defaults to the key prefix).
+    """
+    name = name or key.split(":", 1)[0]
+    if mode == CACHE_MODE_BYPASS:
+        record_cache(name, "bypass")
+        return fetch()
+    if mode == CACHE_MODE_REFRESH:
+        record_cache(name, "refresh")
+        return coalesce(key, lambda: _fetch_and_store(key, fetch, ttl, stale_ttl))
+
+    entry = _cache_get(key)
+    value = _unwrap(entry)
+    if value is not None:
+        if time.time() >= entry[1]:
+            record_cache(name, "stale")
+            schedule_refresh(key, refresh or fetch, ttl, stale_ttl)
+        else:
+            record_cache(name, "hit")
+        return value
+
+    record_cache(name, "miss")
+    return coalesce(
+        key,
+        lambda: _fetch_and_store(key, fetch, ttl, stale_ttl),
+        check=lambda: _unwrap(_cache_get(key)),
+    )
+
+
+class CachingClient:
+    """Wrap a ``UnifiedDataClient`` and cache calls according to the policy.
+
+    ``client_cls`` is the class ``client`` was obtained with from the
+    :data:`~apps.api.client_pool.client_registry`.  Background refreshes use
+    it to get the refreshing thread's own instance instead of sharing
+    ``client`` across threads.
+    """
+
+    def __init__(
+        self, client, mode=CACHE_MODE_DEFAULT, policy=None, stale=None, client_cls=None
+    ):
+        self._client = client
+        self._client_cls = client_cls
+        self._mode = mode
+        self._policy = cache_policy() if policy is None else policy
+        self._stale = stale_policy() if stale is None else stale
+
+    @property
+    def wrapped(self):
+        """The underlying ``UnifiedDataClient`` instance."""
+        return self._client
+
+    def thread_client(self):
+        """Return the guarded client owned by the current thread."""
+        if self._client_cls is None:
+            return self._client
+        return GuardedClient(client_registry.get(self._client_cls), self._client_cls)
+
+    def for_thread(self):
+        """Return a copy of this proxy around the current thread's client."""
+        return CachingClient(
+            self.thread_client(),
+            mode=self._mode,
+            policy=self._policy,
+            stale=self._stale,
+            client_cls=self._client_cls,
+        )
+
+    def __dir__(self):
+        return dir(self._client)
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        ttl = self._policy.get(name)
+        if not ttl or not callable(attr) or self._mode == CACHE_MODE_BYPASS:
+            return attr
+        stale_ttl = self._stale.get(name) or 0
+
+        @wraps(attr)
+        def _cached(*args, **kwargs):
+            key = make_cache_key(name, args, kwargs, func=attr)
+            return cached_fetch(
+                key,
+                lambda: attr(*args, **kwargs),
+                ttl,
+                stale_ttl,
+                mode=self._mode,
+                refresh=lambda: getattr(self.thread_client(), name)(*args, **kwargs),
+                name=name,
+            )
+
+        return _cached
+
+
+def last_good_ttl():
+    return getattr(settings, "UPSTREAM_LAST_GOOD_TTL", DEFAULT_LAST_GOOD_TTL)
+
+
+def _is_upstream_failure(exc):
+    return isinstance(exc, CircuitOpenError) or get_breaker(
+        UNIFIED_CLIENT_UPSTREAM
+    ).is_failure(exc)
+
+
+class GuardedClient:
+    """Send ``UnifiedDataClient`` calls through the ``unified_client`` breaker.
+
+    Successful results of methods in the cache policy are remembered as the
+    last known good payload.  When a call is rejected by the open breaker or
+    fails with an upstream error, the remembered payload is returned instead
+    and the current request is marked stale.  Other errors propagate.
+
+    Once the request deadline has passed no new upstream call is started:
+    the last known good payload is served if there is one, otherwise
+    :class:`~apps.api.request_state.DeadlineExceeded` is raised.
+    """
+
+    def __init__(self, client, client_cls=None, policy=None):
+        self._client = client
+        self._client_cls = client_cls
+        self._policy = cache_policy() if policy is None else policy
+
+    @property
+    def wrapped(self):
+        """The underlying ``UnifiedDataClient`` instance."""
+        return self._client
+
+    def for_thread(self):
+        """Return a guarded client around the current thread's instance."""
+        if self._client_cls is None:
+            return self
+        return GuardedClient(
+            client_registry.get(self._client_cls), self._client_cls, self._policy
+        )
+
+    def __dir__(self):
+        return dir(self._client)
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        remember = bool(self._policy.get(name))
+
+        def _call(args, kwargs):
+            started = time.monotonic()
+            try:
+                value = attr(*args, **kwargs)
+            except Exception as exc:
+                record_upstream_call(
+                    UNIFIED_CLIENT_UPSTREAM, name, started, error=type(exc).__name__
+                )
+                raise
+            record_upstream_call(UNIFIED_CLIENT_UPSTREAM, name, started, payload=value)
+            return value
+
+        @wraps(attr)
+        def _guarded(*args, **kwargs):
+            key = make_cache_key(name, args, kwargs, func=attr) if remember else None
+            try:
+                if deadline_expired():
+                    raise DeadlineExceeded(f"request deadline exceeded before {name}")
+                value = guarded(UNIFIED_CLIENT_UPSTREAM, lambda: _call(args, kwargs))
+            except Exception as exc:
+                if key is None or not (
+                    isinstance(exc, DeadlineExceeded) or _is_upstream_failure(exc)
+                ):
+                    raise
+                fallback = _cache_get(f"lastgood:{key}")
+                if fallback is None:
+                    raise
+                logger.warning("Serving last known good %s after: %s", name, exc)
+                current_state().mark_stale()
+                return fallback
+            if key is not None and value is not None:
+                _cache_set(f"lastgood:{key}", value, last_good_ttl())
+            return value
+
+        return _guarded
+
+
+def thread_client(client):
+    """Return the client the current thread should use in place of ``client``.
+
+    For a :class:`CachingClient` or :class:`GuardedClient` this is built
+    around the registry instance owned by the current thread; any other
+    client is returned unchanged.
+    """
+    if isinstance(client, CachingClient):
+        return client.thread_client()
+    if isinstance(client, GuardedClient):
+        return client.for_thread()
+    return client
+
+
+def wrap_client(client, request=None, client_cls=None):
+    """Return ``client`` behind the circuit breaker and, when enabled, the cache."""
+    client = GuardedClient(client, client_cls)
+    if not caching_enabled():
+        return client
+    mode = cache_mode_for_request(request) if request is not None else CACHE_MODE_DEFAULT
+    return CachingClient(client, mode=mode, client_cls=client_cls)
@@ -0,0 +1,295 @@
+"""Circuit breakers for upstream services.
+
+Every upstream (``unified_client`` for ``UnifiedDataClient`` calls and the
+host name for direct HTTP calls such as ``statsapi.mlb.com``) gets one
+:class:`CircuitBreaker` shared by all views in the process.  After
+``FAILURE_THRESHOLD`` consecutive failures the breaker opens and calls fail
+immediately with :class:`CircuitOpenError` instead of waiting on a timeout.
+After ``RECOVERY_TIMEOUT`` seconds it lets ``HALF_OPEN_MAX_CALLS`` trial calls
+through; a successful trial closes it again and a failed one re-opens it.
+
+Only exceptions listed in ``FAILURE_EXCEPTIONS`` (network and HTTP errors by
+default) and calls slower than ``SLOW_CALL_SECONDS`` count as failures.  An
+HTTP error carrying a 4xx response is the caller's fault (e.g. an unknown
+player id), so it never trips a breaker, nor does a "not found" raised by
+the client.  Options come from
+the ``UPSTREAM_CIRCUIT_BREAKER`` setting, with per-upstream ``OVERRIDES``::
+
+    UPSTREAM_CIRCUIT_BREAKER = {
+        "FAILURE_THRESHOLD": 5,
+        "RECOVERY_TIMEOUT": 30,
+        "OVERRIDES": {"statsapi.mlb.com": {"FAILURE_THRESHOLD": 10}},
+    }
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from .request_state import current_state
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+UNIFIED_CLIENT_UPSTREAM = "unified_client"
+
+DEFAULT_BREAKER_OPTIONS = {
+    "ENABLED": True,
+    "FAILURE_THRESHOLD": 5,
+    "RECOVERY_TIMEOUT": 30,  # seconds
+    "HALF_OPEN_MAX_CALLS": 1,
+    "SLOW_CALL_SECONDS": None,
+    # Dotted paths; classes that cannot be imported are ignored.
+    "FAILURE_EXCEPTIONS": ("builtins.OSError", "httpx.TransportError"),
+    "OVERRIDES": {},
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose breaker is open."""
+
+    def __init__(self, name, retry_after):
+        super().__init__(f"Upstream {name} is unavailable (circuit open)")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for a single upstream."""
+
+    def __init__(
+        self,
+        name,
+        failure_threshold=5,
+        recovery_timeout=30,
+        half_open_max_calls=1,
+        slow_call_seconds=None,
+        failure_exceptions=(OSError,),
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.slow_call_seconds = slow_call_seconds
+        self.failure_exceptions = tuple(failure_exceptions)
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._trial_calls = 0
+        self._rejected = 0
+        self._opened_count = 0
+
+    def _current_state(self):
+        if (
+            self._state == STATE_OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = STATE_HALF_OPEN
+            self._trial_calls = 0
+        return self._state
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._current_state()
+
+    def _retry_after(self):
+        if self._opened_at is None:
+            return 0
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+
+    def before_call(self):
+        """Raise :class:`CircuitOpenError` unless a call may go upstream now."""
+        with self._lock:
+            state = self._current_state()
+            if state == STATE_CLOSED:
+                return
+            if state == STATE_HALF_OPEN and self._trial_calls < self.half_open_max_calls:
+                self._trial_calls += 1
+                return
+            self._rejected += 1
+            raise CircuitOpenError(self.name, self._retry_after())
+
+    def _open(self):
+        self._state = STATE_OPEN
+        self._opened_at = time.monotonic()
+        self._opened_count += 1
+        logger.warning(
+            "Circuit for upstream %s opened after %s failures", self.name, self._failures
+        )
+
+    def record_success(self):
+        with self._lock:
+            if self._state != STATE_CLOSED:
+                logger.info("Circuit for upstream %s closed", self.name)
+            self._state = STATE_CLOSED
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+                self._open()
+
+    def is_failure(self, exc):
+        if not isinstance(exc, self.failure_exceptions):
+            return False
+        # requests.HTTPError is an OSError; only server errors count.
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+        return status is None or status >= 500
+
+    def _record(self, started, result=None, exc=None, is_failure=None):
+        if exc is not None:
+            failed = self.is_failure(exc)
+        else:
+            failed = (
+                self.slow_call_seconds is not None
+                and time.monotonic() - started > self.slow_call_seconds
+            ) or (is_failure is not None and is_failure(result))
+        if failed:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def call(self, fn, is_failure=None):
+        """Return ``fn()`` through the breaker.
+
+        ``is_failure`` optionally inspects a returned value (e.g. a 5xx
+        response) and returns ``True`` when it should count as a failure.
+        """
+        self.before_call()
+        started = time.monotonic()
+        try:
+            result = fn()
+        except Exception as exc:
+            self._record(started, exc=exc)
+            raise
+        self._record(started, result=result, is_failure=is_failure)
+        return result
+
+    async def acall(self, fn, is_failure=None):
+        """Async counterpart of :meth:`call`; ``fn`` returns an awaitable."""
+        self.before_call()
+        started = time.monotonic()
+        try:
+            result = await fn()
+        except Exception as exc:
+            self._record(started, exc=exc)
+            raise
+        self._record(started, result=result, is_failure=is_failure)
+        return result
+
+    def snapshot(self):
+        """Return the breaker's state for monitoring."""
+        with self._lock:
+            state = self._current_state()
+            return {
+                "name": self.name,
+                "state": state,
+                "consecutive_failures": self._failures,
+                "retry_after": round(self._retry_after(), 1) if state == STATE_OPEN else 0,
+                "times_opened": self._opened_count,
+                "rejected_calls": self._rejected,
+                "failure_threshold": self.failure_threshold,
+                "recovery_timeout": self.recovery_timeout,
+            }
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_options(name=None):
+    """Return the effective options for the upstream ``name``."""
+    options = dict(DEFAULT_BREAKER_OPTIONS)
+    options.update(getattr(settings, "UPSTREAM_CIRCUIT_BREAKER", {}) or {})
+    options.update((options.get("OVERRIDES") or {}).get(name) or {})
+    return options
+
+
+def breakers_enabled():
+    return breaker_options()["ENABLED"]
+
+
+def _import_exceptions(paths):
+    classes = []
+    for path in paths:
+        if not isinstance(path, str):
+            classes.append(path)
+            continue
+        try:
+            classes.append(import_string(path))
+        except ImportError:
+            logger.debug("Ignoring unavailable failure exception %s", path)
+    return tuple(classes)
+
+
+def _build_breaker(name):
+    options = breaker_options(name)
+    return CircuitBreaker(
+        name,
+        failure_threshold=options["FAILURE_THRESHOLD"],
+        recovery_timeout=options["RECOVERY_TIMEOUT"],
+        half_open_max_calls=options["HALF_OPEN_MAX_CALLS"],
+        slow_call_seconds=options["SLOW_CALL_SECONDS"],
+        failure_exceptions=_import_exceptions(options["FAILURE_EXCEPTIONS"]),
+    )
+
+
+def get_breaker(name):
+    """Return the process-wide breaker for the upstream ``name``."""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(name)
+            if breaker is None:
+                breaker = _build_breaker(name)
+                _breakers[name] = breaker
+    return breaker
+
+
+def breaker_states():
+    """Return snapshots of every breaker created so far, sorted by name."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return sorted((b.snapshot() for b in breakers), key=lambda s: s["name"])
+
+
+def reset_breakers():
+    """Forget every breaker (they are rebuilt closed on next use)."""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def guarded(name, fn, is_failure=None):
+    """Call ``fn`` through the breaker for ``name`` when breakers are enabled.
+
+    A rejected call is recorded on the current request's
+    :class:`~apps.api.request_state.UpstreamState`.
+    """
+    if not breakers_enabled():
+        return fn()
+    try:
+        return get_breaker(name).call(fn, is_failure=is_failure)
+    except CircuitOpenError:
+        current_state().mark_circuit_open(name)
+        raise
+
+
+async def guarded_async(name, fn, is_failure=None):
+    """Async counterpart of :func:`guarded`; ``fn`` returns an awaitable."""
+    if not breakers_enabled():
+        return await fn()
+    try:
+        return await get_breaker(name).acall(fn, is_failure=is_failure)
+    except CircuitOpenError:
+        current_state().mark_circuit_open(name)
+        raise
@@ -0,0 +1,112 @@
+"""Process-wide registry of reusable ``UnifiedDataClient`` instances."""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLIENT_MAX_AGE = 60 * 60  # recycle clients hourly
+DEFAULT_CLIENT_MAX_FAILURES = 3  # consecutive failed requests before rebuild
+
+
+class ClientRegistry:
+    """Hand out long-lived client instances, one per worker thread.
+
+    Building a ``UnifiedDataClient`` per request throws away its HTTP sessions
+    and any client-side caches.  The registry builds an instance lazily the
+    first time a thread asks for one and hands the same instance back on later
+    requests.  An instance is rebuilt when it is older than
+    ``UNIFIED_CLIENT_MAX_AGE`` seconds, after ``UNIFIED_CLIENT_MAX_FAILURES``
+    consecutive failures reported through :meth:`report_failure`, when it has
+    been dropped via :meth:`discard`, after :meth:`reset`, or when the client
+    class itself changes (for example when tests patch ``UnifiedDataClient``).
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def _max_age(self):
+        return getattr(settings, "UNIFIED_CLIENT_MAX_AGE", DEFAULT_CLIENT_MAX_AGE)
+
+    def _is_healthy(self, entry, client_cls):
+        if entry is None:
+            return False
+        instance, cls, generation, created = entry
+        if cls is not client_cls or generation != self._generation:
+            return False
+        max_age = self._max_age()
+        if max_age and time.monotonic() - created > max_age:
+            return False
+        return True
+
+    def get(self, client_cls):
+        """Return a ready client instance of ``client_cls`` for this thread."""
+        entry = getattr(self._local, "entry", None)
+        if self._is_healthy(entry, client_cls):
+            return entry[0]
+        if entry is not None:
+            self._close(entry[0])
+        instance = client_cls()
+        self._local.entry = (instance, client_cls, self._generation, time.monotonic())
+        self._local.failures = 0
+        logger.debug("Created %s for thread %s", client_cls, threading.get_ident())
+        return instance
+
+    def report_success(self, instance):
+        """Record a successful request made with ``instance``."""
+        if self._owns(instance):
+            self._local.failures = 0
+
+    def report_failure(self, instance):
+        """Record a failed request; rebuild ``instance`` once it fails too often."""
+        if not self._owns(instance):
+            return
+        self._local.failures = getattr(self._local, "failures", 0) + 1
+        max_failures = getattr(
+            settings, "UNIFIED_CLIENT_MAX_FAILURES", DEFAULT_CLIENT_MAX_FAILURES
+        )
+        if self._local.failures >= max_failures:
+            logger.warning(
+                "Discarding UnifiedDataClient after %s consecutive failures",
+                self._local.failures,
+            )
+            self.discard(instance)
+
+    def _owns(self, instance):
+        entry = getattr(self._local, "entry", None)
+        return entry is not None and entry[0] is instance
+
+    def discard(self, instance):
+        """Drop ``instance`` so the next request on this thread rebuilds it."""
+        if self._owns(instance):
+            self._local.entry = None
+            self._local.failures = 0
+            self._close(instance)
+
+    def reset(self):
+        """Invalidate every pooled instance across all threads."""
+        with self._lock:
+            self._generation += 1
+        self._local.entry = None
+
+    @staticmethod
+    def _close(instance):
+        close = getattr(instance, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:  # pragma: no cover - defensive
+                logger.exception("Error closing UnifiedDataClient")
+
+
+client_registry = ClientRegistry()
+
+
+def reset_unified_clients():
+    """Force every thread to build a fresh ``UnifiedDataClient``."""
+    client_registry.reset()
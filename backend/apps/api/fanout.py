@@ -0,0 +1,121 @@
+"""Run independent upstream fetches concurrently.
+
+Views that need several unrelated upstream calls (splits, leaderboards...)
+hand them to :func:`fan_out` so the request takes as long as the slowest call
+instead of the sum of all of them.  Each branch has its own timeout; a branch
+that fails or times out is reported in :attr:`FanOutResult.errors` while the
+others still return their results, so views can degrade partially.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import contextvars
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+
+from .caching import CachingClient, GuardedClient
+from .request_state import current_state
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FANOUT_WORKERS = 16
+DEFAULT_FANOUT_TIMEOUT = 15  # seconds
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class FanOutResult:
+    """Results and errors of a :func:`fan_out` call, keyed by branch name."""
+
+    def __init__(self):
+        self.results = {}
+        self.errors = {}
+
+    def get(self, name, default=None):
+        return self.results.get(name, default)
+
+    @property
+    def failed(self):
+        """Names of the branches that raised or timed out."""
+        return sorted(self.errors)
+
+    def raise_first(self, *names):
+        """Re-raise the error of the first failed branch among ``names``."""
+        for name in names or self.failed:
+            if name in self.errors:
+                raise self.errors[name]
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                workers = getattr(settings, "UPSTREAM_FANOUT_WORKERS", DEFAULT_FANOUT_WORKERS)
+                _executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="upstream-fanout"
+                )
+    return _executor
+
+
+def _client_for_thread(client):
+    if isinstance(client, (CachingClient, GuardedClient)):
+        return client.for_thread()
+    return client
+
+
+def _run_branch(task, client):
+    try:
+        if client is None:
+            return task()
+        # Pooled clients belong to the thread that borrowed them; use the
+        # worker thread's own instance.
+        return task(_client_for_thread(client))
+    finally:
+        connections.close_all()
+
+
+def fan_out(tasks, client=None, timeouts=None, timeout=None):
+    """Run the callables in ``tasks`` concurrently and collect their results.
+
+    ``tasks`` maps branch names to callables.  When ``client`` is given each
+    callable receives the worker thread's client as its only argument.
+    ``timeouts`` maps branch names to seconds and falls back to ``timeout``
+    or ``UPSTREAM_FANOUT_TIMEOUT``, capped at the time left in the request's
+    deadline.  Timed out branches keep running in the background but their
+    results are discarded.
+    """
+    timeouts = timeouts or {}
+    if timeout is None:
+        timeout = getattr(settings, "UPSTREAM_FANOUT_TIMEOUT", DEFAULT_FANOUT_TIMEOUT)
+
+    executor = _get_executor()
+    state = current_state()
+    deadline_left = state.remaining()
+    started = time.monotonic()
+    futures = {
+        name: executor.submit(contextvars.copy_context().run, _run_branch, task, client)
+        for name, task in tasks.items()
+    }
+
+    result = FanOutResult()
+    for name, future in futures.items():
+        limit = timeouts.get(name, timeout)
+        if deadline_left is not None:
+            limit = min(limit, deadline_left)
+        remaining = started + limit - time.monotonic()
+        try:
+            result.results[name] = future.result(timeout=max(remaining, 0))
+        except FutureTimeoutError:
+            logger.warning("Upstream branch %s timed out", name)
+            if state.expired():
+                state.mark_partial()
+            result.errors[name] = TimeoutError(f"{name} timed out")
+        except Exception as exc:
+            logger.error("Upstream branch %s failed: %s", name, exc)
+            result.errors[name] = exc
+    return result
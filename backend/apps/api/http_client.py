@@ -0,0 +1,300 @@
+"""Shared, pooled HTTP sessions for direct upstream calls.
+
+Views that talk to ``statsapi.mlb.com`` directly should go through :func:`get`
+rather than ``requests.get`` so keep-alive connections are reused between
+requests and transient upstream failures are retried with jittered backoff.
+Behaviour is configured with the ``UPSTREAM_HTTP`` setting, for example::
+
+    UPSTREAM_HTTP = {
+        "POOL_MAXSIZE": 20,
+        "RETRIES": 3,
+        "TIMEOUT": 5,
+        "TIMEOUTS": {"player_splits_monthly": 10},
+        "RETRY_OVERRIDES": {"player_splits_monthly": {"read": 0}},
+    }
+
+``RETRY_OVERRIDES`` adjusts the retry counts (``total``, ``connect``,
+``read``, ``status``) for individual call names; calls with overrides use
+their own pooled session per host.
+
+Calls go through the circuit breaker for their host (see
+:mod:`apps.api.circuit`); 5xx responses and network errors count as failures.
+
+In record and replay mode (see :mod:`apps.api.replay`) responses are written
+to or served from fixture files.
+
+Async views use :func:`async_get`, which shares the same options but runs on
+an ``httpx.AsyncClient`` per event loop.  ``httpx`` is optional; without it
+the call falls back to :func:`get` on a worker thread.
+"""
+
+import asyncio
+import inspect
+import logging
+import random
+import threading
+import time
+import weakref
+from urllib.parse import urlsplit
+
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .circuit import guarded, guarded_async
+from .metrics import record_upstream_call
+from . import replay
+from .request_state import budget
+
+try:  # pragma: no cover - optional dependency
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HTTP_OPTIONS = {
+    "POOL_CONNECTIONS": 4,
+    "POOL_MAXSIZE": 10,
+    "POOL_BLOCK": False,
+    "RETRIES": 2,
+    "BACKOFF_FACTOR": 0.2,
+    "BACKOFF_JITTER": 0.2,
+    "STATUS_FORCELIST": (500, 502, 503, 504),
+    "TIMEOUT": 5,
+    "TIMEOUTS": {},
+    "RETRY_OVERRIDES": {},
+}
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def http_options():
+    """Return ``UPSTREAM_HTTP`` merged over :data:`DEFAULT_HTTP_OPTIONS`."""
+    options = dict(DEFAULT_HTTP_OPTIONS)
+    options.update(getattr(settings, "UPSTREAM_HTTP", {}) or {})
+    return options
+
+
+def timeout_for(name=None):
+    """Return the configured timeout in seconds for the call ``name``."""
+    options = http_options()
+    return (options.get("TIMEOUTS") or {}).get(name, options["TIMEOUT"])
+
+
+def retry_counts_for(name=None):
+    """Return the retry counts used for the call ``name``."""
+    options = http_options()
+    counts = dict.fromkeys(("total", "connect", "read", "status"), options["RETRIES"])
+    counts.update((options.get("RETRY_OVERRIDES") or {}).get(name) or {})
+    return counts
+
+
+def _build_retry(options, name=None):
+    kwargs = {
+        **retry_counts_for(name),
+        "backoff_factor": options["BACKOFF_FACTOR"],
+        "status_forcelist": tuple(options["STATUS_FORCELIST"]),
+        "allowed_methods": frozenset({"GET", "HEAD"}),
+        "raise_on_status": False,
+    }
+    # ``backoff_jitter`` only exists in urllib3 2.x.
+    if "backoff_jitter" in inspect.signature(Retry).parameters:
+        kwargs["backoff_jitter"] = options["BACKOFF_JITTER"]
+    return Retry(**kwargs)
+
+
+def _build_session(name=None):
+    options = http_options()
+    adapter = HTTPAdapter(
+        pool_connections=options["POOL_CONNECTIONS"],
+        pool_maxsize=options["POOL_MAXSIZE"],
+        pool_block=options["POOL_BLOCK"],
+        max_retries=_build_retry(options, name),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session(url, name=None):
+    """Return the shared ``requests.Session`` for the host of ``url``.
+
+    Calls named in ``RETRY_OVERRIDES`` get a separate session so their retry
+    policy does not leak into other calls to the same host.
+    """
+    parts = urlsplit(url)
+    if name not in (http_options().get("RETRY_OVERRIDES") or {}):
+        name = None
+    key = (f"{parts.scheme}://{parts.netloc}", name)
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = _build_session(name)
+                _sessions[key] = session
+    return session
+
+
+def get(url, params=None, timeout=None, name=None, **kwargs):
+    """Issue a pooled ``GET`` request against an upstream host.
+
+    ``timeout`` overrides the configured value; otherwise the timeout is
+    looked up by ``name`` in ``UPSTREAM_HTTP["TIMEOUTS"]`` and falls back to
+    ``UPSTREAM_HTTP["TIMEOUT"]``.  Retries follow ``RETRY_OVERRIDES[name]``.
+    The timeout never exceeds the time left in the request's deadline.
+    """
+    if timeout is None:
+        timeout = timeout_for(name)
+    timeout = budget(timeout)
+    session = get_session(url, name)
+    host = urlsplit(url).netloc
+    mode = replay.replay_mode()
+
+    def _get():
+        started = time.monotonic()
+        try:
+            if mode == replay.MODE_REPLAY:
+                response = replay.replay_response(url, params, name)
+            else:
+                response = session.get(url, params=params, timeout=timeout, **kwargs)
+        except Exception as exc:
+            record_upstream_call(host, name or "", started, error=type(exc).__name__)
+            raise
+        _record_response(host, name, started, response)
+        if mode == replay.MODE_RECORD:
+            replay.record_response(url, params, response)
+        return response
+
+    return guarded(host, _get, is_failure=_is_server_error)
+
+
+def _is_server_error(response):
+    status = getattr(response, "status_code", None)
+    return isinstance(status, int) and status >= 500
+
+
+def _record_response(host, name, started, response):
+    if _is_server_error(response):
+        error = f"http_{response.status_code}"
+        record_upstream_call(host, name or "", started, error=error)
+    else:
+        content = getattr(response, "content", None)
+        if not isinstance(content, (bytes, bytearray)):
+            content = None
+        record_upstream_call(host, name or "", started, payload=content)
+
+
+def reset_sessions():
+    """Close and forget every pooled session."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+def _get_async_client(options):
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=options["POOL_MAXSIZE"] * options["POOL_CONNECTIONS"],
+                max_keepalive_connections=options["POOL_MAXSIZE"],
+            ),
+            follow_redirects=True,
+        )
+        _async_clients[loop] = client
+    return client
+
+
+def _backoff(options, attempt):
+    delay = options["BACKOFF_FACTOR"] * (2 ** attempt)
+    return delay + random.uniform(0, options["BACKOFF_JITTER"])
+
+
+async def async_get(url, params=None, timeout=None, name=None, **kwargs):
+    """Asynchronous counterpart of :func:`get`.
+
+    Timeouts and retry counts follow the same ``UPSTREAM_HTTP`` options.
+    Connect errors, read timeouts and ``STATUS_FORCELIST`` responses are
+    retried with jittered exponential backoff.  The response exposes
+    ``status_code`` and ``json()`` like a ``requests`` response.
+    """
+    if timeout is None:
+        timeout = timeout_for(name)
+    timeout = budget(timeout)
+    mode = replay.replay_mode()
+    if httpx is None and mode != replay.MODE_REPLAY:
+        return await sync_to_async(get, thread_sensitive=False)(
+            url, params=params, timeout=timeout, name=name, **kwargs
+        )
+
+    return await guarded_async(
+        urlsplit(url).netloc,
+        lambda: _async_get_with_retries(url, params, timeout, name, **kwargs),
+        is_failure=_is_server_error,
+    )
+
+
+async def _async_get_with_retries(url, params, timeout, name, **kwargs):
+    host = urlsplit(url).netloc
+    mode = replay.replay_mode()
+    started = time.monotonic()
+    try:
+        if mode == replay.MODE_REPLAY:
+            response = await replay.areplay_response(url, params, name)
+        else:
+            response = await _async_send_with_retries(url, params, timeout, name, **kwargs)
+    except Exception as exc:
+        record_upstream_call(host, name or "", started, error=type(exc).__name__)
+        raise
+    _record_response(host, name, started, response)
+    if mode == replay.MODE_RECORD:
+        replay.record_response(url, params, response)
+    return response
+
+
+async def _async_send_with_retries(url, params, timeout, name, **kwargs):
+    options = http_options()
+    remaining = retry_counts_for(name)
+    client = _get_async_client(options)
+    attempt = 0
+    while True:
+        error = None
+        try:
+            response = await client.get(url, params=params, timeout=timeout, **kwargs)
+        except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
+            kind, error = "connect", exc
+        except httpx.ReadTimeout as exc:
+            kind, error = "read", exc
+        else:
+            if response.status_code not in tuple(options["STATUS_FORCELIST"]):
+                return response
+            kind = "status"
+        if remaining["total"] <= 0 or remaining[kind] <= 0:
+            if error is not None:
+                raise error
+            return response
+        remaining["total"] -= 1
+        remaining[kind] -= 1
+        await asyncio.sleep(_backoff(options, attempt))
+        attempt += 1
+
+
+async def aclose_async_client():
+    """Close the ``httpx.AsyncClient`` of the running event loop, if any."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:  # pragma: no cover - defensive
+        return
+    client = _async_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
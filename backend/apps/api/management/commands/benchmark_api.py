@@ -0,0 +1,81 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from apps.api.benchmark import api_routes, compare, run_benchmarks
+from apps.api.replay import MODE_REPLAY, replay_options
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark every API route against replayed upstream fixtures and "
+        "write throughput, latency percentiles, query counts and peak memory "
+        "per route as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default="benchmark.json", help="JSON report path")
+        parser.add_argument("--route", action="append", dest="routes",
+                            help="URL name to benchmark (repeatable; default: all)")
+        parser.add_argument("--requests", type=int, default=20,
+                            help="Timed requests per route")
+        parser.add_argument("--concurrency", type=int, default=1)
+        parser.add_argument("--warmup", type=int, default=1)
+        parser.add_argument("--latency", type=float,
+                            help="Injected upstream latency in seconds (default: UPSTREAM_REPLAY)")
+        parser.add_argument("--fixtures", help="Fixture directory (default: UPSTREAM_REPLAY['DIR'])")
+        parser.add_argument("--param", action="append", default=[], metavar="NAME=VALUE",
+                            help="URL parameter value, e.g. player_id=660271")
+        parser.add_argument("--warm-cache", action="store_true",
+                            help="Keep the cache between routes instead of clearing it")
+        parser.add_argument("--live", action="store_true",
+                            help="Call the real upstreams instead of replaying fixtures")
+        parser.add_argument("--compare", help="Earlier report to compare p95 latencies with")
+
+    def handle(self, *args, **opts):
+        try:
+            params = dict(item.split("=", 1) for item in opts["param"])
+        except ValueError:
+            raise CommandError("--param values must look like NAME=VALUE")
+        routes = api_routes(path_params=params, only=set(opts["routes"] or ()))
+        if not routes:
+            raise CommandError("No routes to benchmark")
+
+        replay = replay_options()
+        if not opts["live"]:
+            replay["MODE"] = MODE_REPLAY
+        if opts["latency"] is not None:
+            replay["LATENCY"] = opts["latency"]
+        if opts["fixtures"]:
+            replay["DIR"] = opts["fixtures"]
+
+        def progress(result):
+            latency = result["latency_ms"]
+            self.stdout.write(
+                f"{result['name']:<32} {result['throughput_rps']:>8} rps  "
+                f"p50 {latency['p50']:>8} ms  p95 {latency['p95']:>8} ms  "
+                f"p99 {latency['p99']:>8} ms  queries {result['db_queries']['max']:>4}  "
+                f"errors {result['errors']}"
+            )
+
+        with override_settings(UPSTREAM_REPLAY=replay):
+            report = run_benchmarks(
+                routes,
+                requests=opts["requests"],
+                concurrency=opts["concurrency"],
+                warmup=opts["warmup"],
+                clear_cache=not opts["warm_cache"],
+                progress=progress,
+            )
+
+        output = Path(opts["output"])
+        output.write_text(json.dumps(report, indent=2))
+        self.stdout.write(self.style.SUCCESS(f"Wrote {output}"))
+
+        if opts["compare"]:
+            baseline = json.loads(Path(opts["compare"]).read_text())
+            for name, before, after, change in compare(baseline, report):
+                self.stdout.write(f"{name:<32} p95 {before} -> {after} ms ({change:+}%)"
+                                  if change is not None else f"{name:<32} p95 {before} -> {after} ms")
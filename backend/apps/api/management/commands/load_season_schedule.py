@@ -0,0 +1,36 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+
+from apps.api import season_schedule
+from apps.api.schedule_days import schedule_today
+
+
+class Command(BaseCommand):
+    help = (
+        "Store season schedules locally, or refresh the dates around today "
+        "with --recent (see apps.api.season_schedule)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--season", type=int, action="append")
+        parser.add_argument(
+            "--recent", action="store_true",
+            help="Refresh the dates around today instead of whole seasons.",
+        )
+        parser.add_argument("--days-back", type=int, default=1)
+        parser.add_argument("--days-ahead", type=int, default=1)
+
+    def handle(self, *args, **opts):
+        if opts["recent"]:
+            today = schedule_today()
+            start = today - timedelta(days=opts["days_back"])
+            end = today + timedelta(days=opts["days_ahead"])
+            stored = season_schedule.refresh_dates(start, end)
+            self.stdout.write(self.style.SUCCESS(
+                f"Stored {stored} games from {start} to {end}"
+            ))
+            return
+        for season in opts["season"] or [date.today().year]:
+            stored = season_schedule.load_season(season)
+            self.stdout.write(self.style.SUCCESS(f"Stored {stored} games of {season}"))
@@ -0,0 +1,54 @@
+import statistics
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from apps.api.benchmark import percentile
+from apps.api.name_index import build_player_index
+
+DEFAULT_QUERIES = ["a", "jo", "smith", "judge", "aaron ju", "martinez", "ohtani", "acuna"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the player name index (see apps.api.name_index) and report its "
+        "build time, memory footprint and query latency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--query", action="append", dest="queries",
+                            help="Query to time (repeatable; default: a built-in sample)")
+        parser.add_argument("--iterations", type=int, default=1000,
+                            help="Timed runs per query")
+        parser.add_argument("--limit", type=int, default=10, help="Results per query")
+
+    def handle(self, *args, **opts):
+        tracemalloc.start()
+        started = time.perf_counter()
+        index = build_player_index()
+        build_seconds = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        self.stdout.write(
+            f"Indexed {len(index)} players, {len(index.tokens)} tokens in "
+            f"{build_seconds:.2f} s"
+        )
+        self.stdout.write(
+            f"Index size {index.memory_bytes() / 1e6:.1f} MB "
+            f"(peak during build {peak / 1e6:.1f} MB)"
+        )
+
+        for query in opts["queries"] or DEFAULT_QUERIES:
+            samples = []
+            for _ in range(opts["iterations"]):
+                started = time.perf_counter()
+                ids = index.search(query, opts["limit"])
+                samples.append((time.perf_counter() - started) * 1e6)
+            self.stdout.write(
+                f"{query!r:<14} {len(ids):>3} results  "
+                f"mean {statistics.fmean(samples):>8.1f} us  "
+                f"p50 {percentile(samples, 50):>8.1f} us  "
+                f"p99 {percentile(samples, 99):>8.1f} us"
+            )
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from apps.api import player_ids
+
+
+class Command(BaseCommand):
+    help = (
+        "Strip the trailing \".0\" from MLBAM/FanGraphs keys and fill their "
+        "indexed integer columns, e.g. after loading player_id_infos with COPY."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+        parser.add_argument("--all", action="store_true",
+                            help="Recompute every row instead of only missing ones")
+        parser.add_argument("--chunk-size", type=int, default=5000)
+
+    def handle(self, *args, **opts):
+        updated = player_ids.fill_player_keys(
+            using=opts["database"],
+            only_missing=not opts["all"],
+            chunk_size=opts["chunk_size"],
+        )
+        player_ids.invalidate()
+        self.stdout.write(self.style.SUCCESS(f"Normalized keys of {updated} players"))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from apps.api import name_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the normalized player name columns used by prefix search, e.g. "
+        "after loading player_id_infos with COPY."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+        parser.add_argument("--all", action="store_true",
+                            help="Recompute every row instead of only missing ones")
+        parser.add_argument("--chunk-size", type=int, default=5000)
+
+    def handle(self, *args, **opts):
+        updated = name_index.fill_normalized_names(
+            using=opts["database"],
+            only_missing=not opts["all"],
+            chunk_size=opts["chunk_size"],
+        )
+        name_index.invalidate()
+        self.stdout.write(self.style.SUCCESS(f"Normalized {updated} player names"))
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from django.test import Client
+from django.test.utils import override_settings
+
+from apps.api.replay import MODE_RECORD, fixture_dir, replay_options
+
+
+class Command(BaseCommand):
+    help = (
+        "Call API paths against the real upstreams and record every upstream "
+        "response as a replay fixture (see apps.api.replay)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            help="API paths to request, e.g. /api/games/745455/",
+        )
+        parser.add_argument(
+            "--paths-file",
+            help="File with one API path per line (blank lines and # comments ignored)",
+        )
+        parser.add_argument(
+            "--dir",
+            help="Fixture directory (default: UPSTREAM_REPLAY['DIR'])",
+        )
+
+    def handle(self, *args, **opts):
+        paths = list(opts["paths"])
+        if opts["paths_file"]:
+            lines = Path(opts["paths_file"]).read_text().splitlines()
+            paths += [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+        if not paths:
+            raise CommandError("Give at least one API path or --paths-file")
+
+        replay = dict(replay_options(), MODE=MODE_RECORD)
+        if opts["dir"]:
+            replay["DIR"] = opts["dir"]
+        host = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else "localhost"
+
+        # Disable the response cache so every upstream call is made and recorded.
+        with override_settings(UPSTREAM_REPLAY=replay, UNIFIED_CLIENT_CACHE_ENABLED=False):
+            client = Client(HTTP_HOST=host)
+            for path in paths:
+                response = client.get(path)
+                style = self.style.SUCCESS if response.status_code < 400 else self.style.ERROR
+                self.stdout.write(style(f"{response.status_code} {path}"))
+            self.stdout.write(f"Fixtures written to {fixture_dir()}")
@@ -0,0 +1,34 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.api import name_index, ranking
+
+
+class Command(BaseCommand):
+    help = (
+        "Refresh the active flag and last season of players from statsapi and "
+        "recompute their search ranking score (see apps.api.ranking)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--season", type=int, default=date.today().year,
+                            help="Season whose roster defines active players")
+        parser.add_argument("--since", type=int,
+                            help="Also scan seasons from this year to fill last_season "
+                                 "(default: only --season)")
+        parser.add_argument("--scores-only", action="store_true",
+                            help="Only recompute scores from the stored inputs")
+
+    def handle(self, *args, **opts):
+        season = opts["season"]
+        since = opts["since"] or season
+        if since > season:
+            raise CommandError("--since must not be after --season")
+
+        if not opts["scores_only"]:
+            seen = ranking.refresh_activity(range(since, season + 1))
+            self.stdout.write(f"Found {seen} players in seasons {since}-{season}")
+        updated = ranking.recompute_scores()
+        name_index.invalidate()
+        self.stdout.write(self.style.SUCCESS(f"Recomputed search scores for {updated} players"))
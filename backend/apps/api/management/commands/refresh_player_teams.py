@@ -0,0 +1,19 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from apps.api import player_teams
+
+
+class Command(BaseCommand):
+    help = (
+        "Reload the player -> current team table used by player search from "
+        "the season's MLB players (see apps.api.player_teams)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--season", type=int, default=date.today().year)
+
+    def handle(self, *args, **opts):
+        stored = player_teams.refresh_table(opts["season"])
+        self.stdout.write(self.style.SUCCESS(f"Stored current teams for {stored} players"))
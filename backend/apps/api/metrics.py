@@ -0,0 +1,256 @@
+"""In-process metrics for upstream calls, caching and API requests.
+
+Counters and histograms live in this process only and are rendered in the
+Prometheus text format at ``/api/metrics/``.  With several worker processes
+each one reports its own values; scrape every worker (or run a single
+worker while profiling) to get the full picture.
+
+Recorded series:
+
+* ``upstream_calls_total`` / ``upstream_errors_total`` and the
+  ``upstream_call_duration_seconds`` and ``upstream_payload_bytes``
+  histograms, labelled by ``upstream`` and ``method`` (the
+  ``UnifiedDataClient`` method or the name passed to
+  :func:`apps.api.http_client.get`).
+* ``cache_requests_total`` labelled by cached call and ``result``
+  (``hit``, ``stale``, ``miss``, ``bypass`` or ``refresh``).
+* ``http_request_duration_seconds`` labelled by API route, HTTP method and
+  status code.
+* ``upstream_circuit_state`` (0 closed, 1 half-open, 2 open) per breaker.
+
+Payload sizes are estimated from the serialized result; set
+``API_METRICS_PAYLOAD_SIZES = False`` to skip that work.
+"""
+
+from bisect import bisect_left
+import json
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+from .circuit import STATE_HALF_OPEN, STATE_OPEN, breaker_states
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SIZE_BUCKETS = (1_000, 10_000, 100_000, 500_000, 1_000_000, 5_000_000, 20_000_000)
+
+
+def _format_labels(names, values):
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonic counter with a fixed set of label names."""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        return self._values.get(key, 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield self.name, _format_labels(self.labelnames, key), value
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram:
+    """Cumulative histogram with fixed buckets and a fixed set of labels."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DURATION_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def count(self, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        entry = self._values.get(key)
+        return entry[2] if entry else 0
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, (list(e[0]), e[1], e[2])) for key, e in self._values.items())
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    self.labelnames + ("le",), key + (_format_value(bound),)
+                )
+                yield f"{self.name}_bucket", labels, cumulative
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+upstream_calls = Counter(
+    "upstream_calls_total", "Upstream calls made.", ("upstream", "method")
+)
+upstream_errors = Counter(
+    "upstream_errors_total",
+    "Upstream calls that raised or returned a server error.",
+    ("upstream", "method", "error"),
+)
+upstream_duration = Histogram(
+    "upstream_call_duration_seconds",
+    "Wall time of upstream calls.",
+    ("upstream", "method"),
+)
+upstream_payload = Histogram(
+    "upstream_payload_bytes",
+    "Approximate size of upstream payloads.",
+    ("upstream", "method"),
+    buckets=SIZE_BUCKETS,
+)
+cache_requests = Counter(
+    "cache_requests_total", "Cached upstream lookups by result.", ("call", "result")
+)
+request_duration = Histogram(
+    "http_request_duration_seconds",
+    "API request wall time by route.",
+    ("route", "method", "status"),
+)
+circuit_state = Gauge(
+    "upstream_circuit_state",
+    "Circuit breaker state (0 closed, 1 half-open, 2 open).",
+    ("upstream",),
+)
+
+REGISTRY = (
+    upstream_calls,
+    upstream_errors,
+    upstream_duration,
+    upstream_payload,
+    cache_requests,
+    request_duration,
+    circuit_state,
+)
+
+
+def payload_sizes_enabled():
+    return getattr(settings, "API_METRICS_PAYLOAD_SIZES", True)
+
+
+def payload_size(value):
+    """Return an approximate size in bytes of ``value``, or ``None``."""
+    if value is None:
+        return None
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):  # pandas objects
+        try:
+            usage = memory_usage(deep=False)
+            return int(getattr(usage, "sum", lambda: usage)())
+        except Exception:  # pragma: no cover - defensive
+            return None
+    if isinstance(value, (dict, list, tuple)):
+        try:
+            return len(json.dumps(value, default=str))
+        except (TypeError, ValueError):  # pragma: no cover - defensive
+            return None
+    return None
+
+
+def record_upstream_call(upstream, method, started, payload=None, error=None):
+    """Record one upstream call that began at ``time.monotonic()`` ``started``."""
+    upstream_calls.inc(upstream=upstream, method=method)
+    upstream_duration.observe(time.monotonic() - started, upstream=upstream, method=method)
+    if error is not None:
+        upstream_errors.inc(upstream=upstream, method=method, error=error)
+    elif payload is not None and payload_sizes_enabled():
+        size = payload_size(payload)
+        if size is not None:
+            upstream_payload.observe(size, upstream=upstream, method=method)
+
+
+def record_cache(call, result):
+    cache_requests.inc(call=call, result=result)
+
+
+def render():
+    """Return every metric in the Prometheus text exposition format."""
+    levels = {STATE_HALF_OPEN: 1, STATE_OPEN: 2}
+    for snapshot in breaker_states():
+        circuit_state.set(levels.get(snapshot["state"], 0), upstream=snapshot["name"])
+
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, labels, value in metric.samples():
+            lines.append(f"{name}{labels} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def reset():
+    """Clear every metric (used by tests)."""
+    for metric in REGISTRY:
+        metric.reset()
@@ -0,0 +1,121 @@
+"""Middleware for the API app."""
+
+import math
+import time
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.urls import Resolver404, resolve
+from django.utils.decorators import sync_and_async_middleware
+
+from .circuit import get_breaker
+from .metrics import request_duration
+from .request_state import begin_request, current_state, end_request
+
+STALE_HEADER = "X-Upstream-Stale"
+PARTIAL_HEADER = "X-Partial-Response"
+DEADLINE_HEADER = "HTTP_X_REQUEST_DEADLINE"
+
+
+def request_budget(request):
+    """Return the deadline in seconds for ``request``, or ``None``.
+
+    The budget comes from ``API_REQUEST_DEADLINES`` by URL name (falling back
+    to its ``"default"`` entry) and can be lowered or raised per request with
+    an ``X-Request-Deadline`` header, capped at ``API_REQUEST_DEADLINE_MAX``.
+    """
+    deadlines = getattr(settings, "API_REQUEST_DEADLINES", {}) or {}
+    try:
+        name = resolve(request.path_info).url_name
+    except Resolver404:
+        name = None
+    seconds = deadlines.get(name, deadlines.get("default"))
+
+    header = request.META.get(DEADLINE_HEADER)
+    if header:
+        try:
+            requested = float(header)
+        except ValueError:
+            requested = None
+        if requested is not None and requested > 0 and math.isfinite(requested):
+            cap = getattr(settings, "API_REQUEST_DEADLINE_MAX", None)
+            seconds = min(requested, cap) if cap else requested
+    return seconds
+
+
+def _finalize(response):
+    state = current_state()
+    if state.stale:
+        response[STALE_HEADER] = "true"
+    if state.partial:
+        response[PARTIAL_HEADER] = "true"
+    if state.circuit_open and response.status_code == 500:
+        # The view failed because an upstream breaker rejected the call and
+        # no last known good payload existed: report it as unavailable.
+        retry_after = max(
+            get_breaker(name).snapshot()["retry_after"] for name in state.circuit_open
+        )
+        response.status_code = 503
+        response["Retry-After"] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+@sync_and_async_middleware
+def upstream_state_middleware(get_response):
+    """Track upstream degradation per request and report it in headers.
+
+    Responses built from a last known good payload carry
+    ``X-Upstream-Stale: true``; 500 responses caused by an open circuit
+    breaker become ``503`` with a ``Retry-After`` header.  Each request gets
+    the deadline from :func:`request_budget`; responses that skipped upstream
+    work because it ran out carry ``X-Partial-Response: true``.
+    """
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            token = begin_request(request_budget(request))
+            try:
+                return _finalize(await get_response(request))
+            finally:
+                end_request(token)
+
+    else:
+
+        def middleware(request):
+            token = begin_request(request_budget(request))
+            try:
+                return _finalize(get_response(request))
+            finally:
+                end_request(token)
+
+    return middleware
+
+
+def _observe_request(request, response, started):
+    match = getattr(request, "resolver_match", None)
+    route = match.route if match is not None else "unmatched"
+    request_duration.observe(
+        time.monotonic() - started,
+        route=route,
+        method=request.method,
+        status=response.status_code,
+    )
+    return response
+
+
+@sync_and_async_middleware
+def request_metrics_middleware(get_response):
+    """Record the wall time of every request by route (see :mod:`apps.api.metrics`)."""
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            started = time.monotonic()
+            return _observe_request(request, await get_response(request), started)
+
+    else:
+
+        def middleware(request):
+            started = time.monotonic()
+            return _observe_request(request, get_response(request), started)
+
+    return middleware
@@ -0,0 +1,81 @@
+"""Indexes for substring name search (see apps.api.search).
+
+PostgreSQL gets pg_trgm GIN indexes on ``UPPER(name)``, the expression
+Django's ``icontains`` lookup compares, so the existing lookups use them.
+SQLite gets FTS5 trigram shadow tables kept in sync by triggers.  Other
+backends are left alone and keep scanning.
+"""
+
+from django.db import migrations
+
+# (table, name column, FTS5 shadow table, GIN index)
+SEARCH_TABLES = [
+    ("player_id_infos", "name_full", "player_id_infos_fts", "pidinfo_full_trgm_idx"),
+    ("team_id_infos", "full_name", "team_id_infos_fts", "teaminfo_full_trgm_idx"),
+]
+
+SQLITE_FTS_STATEMENTS = [
+    "CREATE VIRTUAL TABLE {fts} USING fts5("
+    "{column}, content='{table}', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+    "INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END",
+    "CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+    "INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); END",
+    "CREATE TRIGGER {fts}_au AFTER UPDATE ON {table} BEGIN "
+    "INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); "
+    "INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END",
+    "INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+]
+
+SQLITE_DROP_STATEMENTS = [
+    "DROP TRIGGER IF EXISTS {fts}_ai",
+    "DROP TRIGGER IF EXISTS {fts}_ad",
+    "DROP TRIGGER IF EXISTS {fts}_au",
+    "DROP TABLE IF EXISTS {fts}",
+]
+
+
+def _sqlite_has_trigram_fts():
+    import sqlite3
+
+    # The FTS5 trigram tokenizer arrived in SQLite 3.34.
+    return sqlite3.sqlite_version_info >= (3, 34, 0)
+
+
+def create_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for table, column, _, index in SEARCH_TABLES:
+            schema_editor.execute(
+                f"CREATE INDEX IF NOT EXISTS {index} ON {table} "
+                f"USING gin (UPPER({column}) gin_trgm_ops)"
+            )
+    elif vendor == "sqlite" and _sqlite_has_trigram_fts():
+        for table, column, fts, _ in SEARCH_TABLES:
+            for statement in SQLITE_FTS_STATEMENTS:
+                schema_editor.execute(
+                    statement.format(table=table, column=column, fts=fts)
+                )
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        for _, _, _, index in SEARCH_TABLES:
+            schema_editor.execute(f"DROP INDEX IF EXISTS {index}")
+    elif vendor == "sqlite":
+        for _, _, fts, _ in SEARCH_TABLES:
+            for statement in SQLITE_DROP_STATEMENTS:
+                schema_editor.execute(statement.format(fts=fts))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0004_halloffamevote"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
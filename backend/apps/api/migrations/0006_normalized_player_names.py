@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:35
+
+from django.db import migrations, models
+
+from apps.api.name_index import fill_normalized_names
+
+
+def populate(apps, schema_editor):
+    PlayerIdInfo = apps.get_model("api", "PlayerIdInfo")
+    fill_normalized_names(PlayerIdInfo, using=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0005_name_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="playeridinfo",
+            name="name_last_normalized",
+            field=models.CharField(db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="playeridinfo",
+            name="name_normalized",
+            field=models.CharField(db_index=True, max_length=200, null=True),
+        ),
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0006_normalized_player_names"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="playeridinfo",
+            name="active",
+            field=models.BooleanField(null=True),
+        ),
+        migrations.AddField(
+            model_name="playeridinfo",
+            name="last_season",
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name="playeridinfo",
+            name="search_hits",
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name="playeridinfo",
+            name="search_score",
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddIndex(
+            model_name="playeridinfo",
+            index=models.Index(
+                models.OrderBy(
+                    models.functions.Coalesce("search_score", 0), descending=True
+                ),
+                models.F("name_full"),
+                name="pidinfo_rank_idx",
+            ),
+        ),
+    ]
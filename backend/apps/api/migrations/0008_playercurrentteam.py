@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0007_player_search_ranking"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlayerCurrentTeam",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("player_mlbam_id", models.IntegerField(unique=True)),
+                ("team_mlbam_id", models.IntegerField(null=True)),
+                ("team_name", models.CharField(max_length=100, null=True)),
+                ("updated_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "player_current_teams",
+            },
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:44
+
+from django.db import migrations, models
+
+from apps.api.player_ids import fill_player_keys
+
+
+def populate(apps, schema_editor):
+    PlayerIdInfo = apps.get_model("api", "PlayerIdInfo")
+    fill_player_keys(PlayerIdInfo, using=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    # The backfill commits chunk by chunk instead of holding one long
+    # transaction over the whole table.
+    atomic = False
+
+    dependencies = [
+        ("api", "0008_playercurrentteam"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="playeridinfo",
+            name="fangraphs_id",
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name="playeridinfo",
+            name="mlbam_id",
+            field=models.IntegerField(null=True),
+        ),
+        migrations.RunPython(populate, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="playeridinfo",
+            index=models.Index(
+                condition=models.Q(("fangraphs_id__isnull", False)),
+                fields=["fangraphs_id"],
+                name="pidinfo_fangraphs_id_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="playeridinfo",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("mlbam_id__isnull", False)),
+                fields=("mlbam_id",),
+                name="pidinfo_mlbam_id_uniq",
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0009_player_integer_keys"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="halloffamevote",
+            index=models.Index(
+                fields=["inducted", "category", "bbref_id", "year"],
+                name="hofvote_player_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="playeridinfo",
+            index=models.Index(fields=["key_bbref"], name="pidinfo_bbref_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="playeridinfo",
+            index=models.Index(fields=["key_retro"], name="pidinfo_retro_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="teamidinfo",
+            index=models.Index(
+                fields=["mlbam_team_id", "active_to"], name="teaminfo_mlbam_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="venue",
+            index=models.Index(fields=["mlbam_id"], name="venue_mlbam_idx"),
+        ),
+    ]
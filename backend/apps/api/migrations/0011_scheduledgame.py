@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0010_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScheduledGame",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("game_pk", models.IntegerField()),
+                ("game_date", models.DateField()),
+                ("season", models.IntegerField()),
+                ("game_datetime", models.DateTimeField(null=True)),
+                ("home_team_id", models.IntegerField(null=True)),
+                ("away_team_id", models.IntegerField(null=True)),
+                ("venue_id", models.IntegerField(null=True)),
+                ("status", models.CharField(max_length=20)),
+                ("detailed_state", models.CharField(max_length=50, null=True)),
+                ("home_score", models.IntegerField(null=True)),
+                ("away_score", models.IntegerField(null=True)),
+                ("payload", models.JSONField()),
+                ("updated_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "scheduled_games",
+                "indexes": [
+                    models.Index(fields=["game_date"], name="schedgame_date_idx"),
+                    models.Index(fields=["home_team_id", "game_date"], name="schedgame_home_idx"),
+                    models.Index(fields=["away_team_id", "game_date"], name="schedgame_away_idx"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("game_pk", "game_date"), name="schedgame_pk_date_uniq"
+                    ),
+                ],
+            },
+        ),
+    ]
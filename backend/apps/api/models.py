@@ -1,6 +1,9 @@
 from django.db import models
-from django.db.models import F, Value
-from django.db.models.functions import Concat
+from django.db.models import F, Q, Value
+from django.db.models.functions import Coalesce, Concat
+
+from .name_index import normalized_player_names
+from .player_ids import clean_key, parse_int_key
 
 
 class PlayerIdInfo(models.Model):
@@ -23,14 +26,61 @@ class PlayerIdInfo(models.Model):
         output_field=models.CharField(max_length=200),
         db_persist=True,
     )
+    # normalize_name() of the full and last names, for indexed prefix search.
+    # Filled in by save() and, after bulk loads, by normalize_player_names.
+    name_normalized = models.CharField(max_length=200, null=True, db_index=True)
+    name_last_normalized = models.CharField(max_length=100, null=True, db_index=True)
+    # Search ranking inputs and score, refreshed by refresh_player_ranking
+    # (see apps.api.ranking).
+    active = models.BooleanField(null=True)
+    last_season = models.IntegerField(null=True)
+    search_hits = models.IntegerField(null=True)
+    search_score = models.IntegerField(null=True)
+    # Integer forms of key_mlbam and key_fangraphs for indexed lookups. Filled
+    # in by save() and, after bulk loads, by normalize_player_keys.
+    mlbam_id = models.IntegerField(null=True)
+    fangraphs_id = models.IntegerField(null=True)
 
     class Meta:
         db_table = 'player_id_infos'
+        constraints = [
+            models.UniqueConstraint(
+                fields=["mlbam_id"],
+                condition=Q(mlbam_id__isnull=False),
+                name="pidinfo_mlbam_id_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["name_full"], name="pidinfo_full_idx"),
+            models.Index(fields=["name_last"], name="pidinfo_last_idx"),
+            models.Index(
+                Coalesce("search_score", 0).desc(), F("name_full"),
+                name="pidinfo_rank_idx",
+            ),
+            models.Index(
+                fields=["fangraphs_id"],
+                condition=Q(fangraphs_id__isnull=False),
+                name="pidinfo_fangraphs_id_idx",
+            ),
+            # bbref/retro lookups: Hall of Fame enrichment and the id resolver.
+            models.Index(fields=["key_bbref"], name="pidinfo_bbref_idx"),
+            models.Index(fields=["key_retro"], name="pidinfo_retro_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - simple convenience method
         """Return the player's full name for admin displays."""
         return self.name_full or ""
 
+    def save(self, *args, **kwargs):
+        self.name_normalized, self.name_last_normalized = normalized_player_names(
+            self.name_first, self.name_last
+        )
+        self.key_mlbam = clean_key(self.key_mlbam)
+        self.key_fangraphs = clean_key(self.key_fangraphs)
+        self.mlbam_id = parse_int_key(self.key_mlbam)
+        self.fangraphs_id = parse_int_key(self.key_fangraphs)
+        super().save(*args, **kwargs)
+
 
 class TeamIdInfo(models.Model):
     mlbam_team_id = models.IntegerField(null=True)
@@ -49,6 +99,11 @@ class TeamIdInfo(models.Model):
 
     class Meta:
         db_table = 'team_id_infos'
+        indexes = [
+            # team_info looks up the current row (active_to IS NULL) of a
+            # team, team_leaders any row of it; one index serves both.
+            models.Index(fields=["mlbam_team_id", "active_to"], name="teaminfo_mlbam_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - simple convenience method
         """Return the team's full name for admin displays."""
@@ -64,6 +119,9 @@ class Venue(models.Model):
 
     class Meta:
         db_table = 'venues'
+        indexes = [
+            models.Index(fields=["mlbam_id"], name="venue_mlbam_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - simple convenience method
         """Return the venue name for admin displays."""
@@ -83,7 +141,90 @@ class HallOfFameVote(models.Model):
 
     class Meta:
         db_table = 'hall_of_fame_votes'
+        indexes = [
+            # hall_of_fame_players groups inducted players by bbref_id and
+            # looks up each one's latest vote by year.
+            models.Index(
+                fields=["inducted", "category", "bbref_id", "year"],
+                name="hofvote_player_idx",
+            ),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - simple convenience method
         """Return the player's bbref id and year for admin displays."""
         return f"{self.bbref_id or ''} ({self.year})"
+
+
+class PlayerCurrentTeam(models.Model):
+    """A player's current MLB team, refreshed in bulk by refresh_player_teams."""
+
+    player_mlbam_id = models.IntegerField(unique=True)
+    team_mlbam_id = models.IntegerField(null=True)
+    team_name = models.CharField(max_length=100, null=True)
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'player_current_teams'
+
+    def __str__(self) -> str:  # pragma: no cover - simple convenience method
+        """Return the player id and team name for admin displays."""
+        return f"{self.player_mlbam_id}: {self.team_name or ''}"
+
+
+class ScheduledGame(models.Model):
+    """A game of the season schedule, loaded by load_season_schedule.
+
+    A postponed game is listed on its original and its new date, so rows are
+    unique per ``(game_pk, game_date)``.
+    """
+
+    game_pk = models.IntegerField()
+    game_date = models.DateField()
+    season = models.IntegerField()
+    game_datetime = models.DateTimeField(null=True)
+    home_team_id = models.IntegerField(null=True)
+    away_team_id = models.IntegerField(null=True)
+    venue_id = models.IntegerField(null=True)
+    # statsapi abstractGameState: Preview, Live or Final.
+    status = models.CharField(max_length=20)
+    detailed_state = models.CharField(max_length=50, null=True)
+    home_score = models.IntegerField(null=True)
+    away_score = models.IntegerField(null=True)
+    # The upstream schedule entry, served as is.
+    payload = models.JSONField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'scheduled_games'
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game_pk", "game_date"], name="schedgame_pk_date_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["game_date"], name="schedgame_date_idx"),
+            models.Index(fields=["home_team_id", "game_date"], name="schedgame_home_idx"),
+            models.Index(fields=["away_team_id", "game_date"], name="schedgame_away_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - simple convenience method
+        """Return the game pk and date for admin displays."""
+        return f"{self.game_pk} ({self.game_date})"
+
+
+class DataVersion(models.Model):
+    """Version stamp of data that worker processes keep in memory.
+
+    The process that changes the data bumps the stamp; the others compare it
+    with the version they loaded (see ``apps.api.name_index``).
+    """
+
+    name = models.CharField(max_length=100, primary_key=True)
+    version = models.BigIntegerField()
+
+    class Meta:
+        db_table = 'data_versions'
+
+    def __str__(self) -> str:  # pragma: no cover - simple convenience method
+        """Return the name and version for admin displays."""
+        return f"{self.name}: {self.version}"
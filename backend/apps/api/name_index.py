@@ -0,0 +1,355 @@
+"""In-process name index for player search autocomplete.
+
+``player_search`` used to run ``name_full__icontains`` on every keystroke,
+which scans the whole Chadwick people table.  :class:`PlayerNameIndex` holds
+the normalized first/last name tokens of every player in compact sorted
+arrays instead and answers token-prefix queries without touching the
+database:
+
+* ``tokens`` is the sorted list of distinct tokens,
+* ``offsets``/``postings`` list, per token, the ranks of the players that
+  carry it.  Because tokens are sorted, every token starting with a prefix
+  is a contiguous range and so are its postings,
+* ranks are positions in ``ids`` (players ordered by ``search_score``, see
+  :mod:`apps.api.ranking`, then full name),
+* ``names`` holds every player's normalized full name, one per rank,
+* one- and two-letter prefixes match a large share of all players, so their
+  first :data:`SHORT_PREFIX_RESULTS` results are precomputed.
+
+A query matches a player when every query token is a prefix of one of the
+player's tokens ("jud aar" finds "Aaron Judge").  Names are compared after
+:func:`normalize_name`.  Like :func:`apps.api.search.player_prefix_search`,
+players whose full name starts with the query come first, then the others;
+each group is in rank order.
+
+The index is built on first use (or at startup, see
+:func:`warm_in_background`) and rebuilt in the background when
+:func:`invalidate` bumps its version; saves and deletes of ``PlayerIdInfo``
+do so automatically, bulk loads must call it.  The version is a
+:class:`~apps.api.models.DataVersion` row, read at most every
+``VERSION_CHECK_SECONDS``, so every worker process notices the change soon
+after, whatever cache backend is configured.
+"""
+
+from array import array
+from bisect import bisect_left
+import heapq
+import logging
+import re
+import sys
+import threading
+import time
+import unicodedata
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_OPTIONS = {
+    "ENABLED": True,
+    "WARM_ON_STARTUP": False,
+    "VERSION_CHECK_SECONDS": 5,
+}
+
+VERSION_NAME = "player-name-index"
+
+SHORT_PREFIX_LENGTH = 2
+SHORT_PREFIX_RESULTS = 50
+
+_DROPPED = re.compile(r"['.\u2019]")
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+_INITIALS = re.compile(r"\b([a-z]) (?=[a-z]\b)")
+
+
+def index_options():
+    """Return ``PLAYER_NAME_INDEX`` merged over :data:`DEFAULT_INDEX_OPTIONS`."""
+    options = dict(DEFAULT_INDEX_OPTIONS)
+    options.update(getattr(settings, "PLAYER_NAME_INDEX", {}) or {})
+    return options
+
+
+def normalize_name(text):
+    """Casefold ``text``, strip accents and collapse punctuation.
+
+    Periods and apostrophes are dropped, other punctuation becomes a space
+    and runs of initials are joined, so ``"J. D. Martínez"`` and
+    ``"J.D. Martinez"`` both become ``"jd martinez"`` and ``"O'Neill"``
+    becomes ``"oneill"``.
+    """
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", str(text).casefold())
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    collapsed = _NON_ALNUM.sub(" ", _DROPPED.sub("", stripped)).strip()
+    return _INITIALS.sub(r"\1", collapsed)
+
+
+def normalized_player_names(first, last):
+    """Return ``(name_normalized, name_last_normalized)`` for a player."""
+    full = normalize_name(f"{first or ''} {last or ''}")
+    return full or None, normalize_name(last) or None
+
+
+def name_tokens(*parts):
+    """Return the distinct normalized tokens of the given name parts."""
+    tokens = []
+    for part in parts:
+        for token in normalize_name(part).split():
+            if token not in tokens:
+                tokens.append(token)
+    return tokens
+
+
+class PlayerNameIndex:
+    """Immutable token-prefix index over player names."""
+
+    def __init__(self, ids, tokens, offsets, postings, names="", name_offsets=None):
+        self.ids = ids
+        self.tokens = tokens
+        self.offsets = offsets
+        self.postings = postings
+        # Normalized names are ASCII, so one string stores them compactly.
+        self.names = names
+        self.name_offsets = name_offsets if name_offsets is not None else array("I", [0])
+        self.short = {}
+        prefixes = {token[:n] for token in tokens for n in range(1, SHORT_PREFIX_LENGTH + 1)}
+        for prefix in prefixes:
+            ranks = self._best(prefix, set(self._prefix_ranks(prefix)), SHORT_PREFIX_RESULTS)
+            self.short[prefix] = array("I", ranks)
+
+    @classmethod
+    def build(cls, rows):
+        """Build an index from ``(id, name_first, name_last)`` rows.
+
+        Rows must already be ordered by relevance; their order is the rank
+        used to order results.
+        """
+        ids = array("q")
+        by_token = {}
+        names = []
+        name_offsets = array("I", [0])
+        for rank, (pk, first, last) in enumerate(rows):
+            ids.append(pk)
+            for token in name_tokens(first, last):
+                by_token.setdefault(token, []).append(rank)
+            name = normalized_player_names(first, last)[0] or ""
+            names.append(name)
+            name_offsets.append(name_offsets[-1] + len(name))
+
+        tokens = sorted(by_token)
+        offsets = array("I", [0])
+        postings = array("I")
+        for token in tokens:
+            postings.extend(by_token[token])
+            offsets.append(len(postings))
+        return cls(ids, tokens, offsets, postings, "".join(names), name_offsets)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _prefix_ranks(self, prefix):
+        lo = bisect_left(self.tokens, prefix)
+        hi = bisect_left(self.tokens, prefix + "\uffff", lo)
+        return self.postings[self.offsets[lo]:self.offsets[hi]]
+
+    def _name_starts_with(self, rank, prefix):
+        start = self.name_offsets[rank]
+        return self.names.startswith(prefix, start, self.name_offsets[rank + 1])
+
+    def _best(self, normalized, ranks, limit):
+        """Return the ``limit`` best of ``ranks``, full-name prefixes first."""
+        return heapq.nsmallest(
+            limit, ranks, key=lambda rank: (not self._name_starts_with(rank, normalized), rank)
+        )
+
+    def search(self, query, limit=10):
+        """Return up to ``limit`` player ids matching ``query``, best first."""
+        normalized = normalize_name(query)
+        terms = sorted(set(normalized.split()), key=len, reverse=True)
+        if not terms:
+            return []
+        if len(terms) == 1 and terms[0] in self.short and limit <= SHORT_PREFIX_RESULTS:
+            return [self.ids[rank] for rank in self.short[terms[0]][:limit]]
+        # Longer prefixes select fewer players; start from the narrowest.
+        ranks = self._prefix_ranks(terms[0])
+        if len(terms) > 1:
+            matched = set(ranks)
+            for term in terms[1:]:
+                matched.intersection_update(self._prefix_ranks(term))
+                if not matched:
+                    return []
+            ranks = matched
+        return [self.ids[rank] for rank in self._best(normalized, set(ranks), limit)]
+
+    def memory_bytes(self):
+        """Approximate memory held by the index structures."""
+        return (
+            sys.getsizeof(self.ids)
+            + sys.getsizeof(self.offsets)
+            + sys.getsizeof(self.postings)
+            + sys.getsizeof(self.tokens)
+            + sum(sys.getsizeof(token) for token in self.tokens)
+            + sys.getsizeof(self.names)
+            + sys.getsizeof(self.name_offsets)
+            + sys.getsizeof(self.short)
+            + sum(sys.getsizeof(ranks) for ranks in self.short.values())
+        )
+
+
+def build_player_index():
+    """Build a :class:`PlayerNameIndex` from every ``PlayerIdInfo`` row."""
+    from .models import PlayerIdInfo
+    from .ranking import rank_ordering
+
+    rows = (
+        PlayerIdInfo.objects
+        .order_by(*rank_ordering(), "id")
+        .values_list("id", "name_first", "name_last")
+        .iterator(chunk_size=5000)
+    )
+    return PlayerNameIndex.build(rows)
+
+
+def fill_normalized_names(model=None, using="default", only_missing=True, chunk_size=5000):
+    """Fill ``name_normalized``/``name_last_normalized`` in bulk.
+
+    Bulk loads (``COPY``) bypass ``PlayerIdInfo.save``; run this afterwards.
+    Returns the number of rows updated.
+    """
+    if model is None:
+        from .models import PlayerIdInfo as model
+
+    queryset = model.objects.using(using).order_by("id")
+    if only_missing:
+        queryset = queryset.filter(name_normalized__isnull=True)
+    updated = 0
+    last_id = 0
+    while True:
+        batch = list(
+            queryset.filter(id__gt=last_id).only("id", "name_first", "name_last")[:chunk_size]
+        )
+        if not batch:
+            return updated
+        for row in batch:
+            row.name_normalized, row.name_last_normalized = normalized_player_names(
+                row.name_first, row.name_last
+            )
+        model.objects.using(using).bulk_update(
+            batch, ["name_normalized", "name_last_normalized"]
+        )
+        updated += len(batch)
+        last_id = batch[-1].id
+
+
+_index = None
+_index_version = None
+_lock = threading.Lock()
+_rebuilding = False
+_known_version = None
+_checked_at = None
+
+
+def _current_version():
+    global _known_version, _checked_at
+    from .models import DataVersion
+
+    now = time.monotonic()
+    if _checked_at is not None and now - _checked_at < index_options()["VERSION_CHECK_SECONDS"]:
+        return _known_version
+    try:
+        version = (
+            DataVersion.objects.filter(name=VERSION_NAME)
+            .values_list("version", flat=True)
+            .first()
+        ) or 0
+    except Exception:  # pragma: no cover - defensive
+        logger.exception("Error reading the %s version", VERSION_NAME)
+        return _index_version
+    _known_version, _checked_at = version, now
+    return version
+
+
+def _rebuild(version):
+    global _index, _index_version, _rebuilding
+    try:
+        index = build_player_index()
+        with _lock:
+            _index, _index_version = index, version
+    except Exception:
+        logger.exception("Error building the player name index")
+    finally:
+        _rebuilding = False
+        connections.close_all()
+
+
+def _warm():
+    try:
+        get_player_index()
+    except Exception:
+        logger.exception("Error building the player name index")
+    finally:
+        connections.close_all()
+
+
+def _rebuild_in_background(version):
+    global _rebuilding
+    with _lock:
+        if _rebuilding:
+            return
+        _rebuilding = True
+    threading.Thread(
+        target=_rebuild, args=(version,), name="player-name-index", daemon=True
+    ).start()
+
+
+def get_player_index():
+    """Return the current index, building it if needed.
+
+    The first call builds the index synchronously.  After an
+    :func:`invalidate`, the previous index keeps serving while a new one is
+    built in the background.
+    """
+    global _index, _index_version
+    version = _current_version()
+    if _index is None:
+        with _lock:
+            if _index is None:
+                _index, _index_version = build_player_index(), version
+        return _index
+    if version != _index_version:
+        _rebuild_in_background(version)
+    return _index
+
+
+def search_player_ids(query, limit=10):
+    """Return matching player ids, or ``None`` when the index is disabled."""
+    if not index_options()["ENABLED"]:
+        return None
+    return get_player_index().search(query, limit)
+
+
+def invalidate(**kwargs):
+    """Mark the index out of date in every process (usable as a signal receiver)."""
+    global _checked_at
+    from .models import DataVersion
+
+    DataVersion.objects.update_or_create(
+        name=VERSION_NAME, defaults={"version": time.time_ns()}
+    )
+    # This process notices at once; the others on their next check.
+    _checked_at = None
+
+
+def reset():
+    """Drop this process's index (used by tests)."""
+    global _index, _index_version, _known_version, _checked_at
+    with _lock:
+        _index = _index_version = _known_version = _checked_at = None
+
+
+def warm_in_background():
+    """Build the index in a background thread when ``WARM_ON_STARTUP`` is set."""
+    options = index_options()
+    if options["ENABLED"] and options["WARM_ON_STARTUP"]:
+        threading.Thread(target=_warm, name="player-name-index", daemon=True).start()
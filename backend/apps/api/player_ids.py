@@ -0,0 +1,297 @@
+"""Resolve any player id to the canonical MLBAM id.
+
+Player endpoints accept either the internal ``PlayerIdInfo`` primary key or
+an MLBAM id, and other data sources identify players by their
+Baseball-Reference, FanGraphs or Retrosheet keys.  :func:`resolve_mlbam_ids`
+maps a batch of such ids to MLBAM ids with a single query;
+:func:`resolve_mlbam_id` does the same for one id.
+
+Without a ``key_type`` a numeric id is looked up as an internal id and, if
+no row has it, taken to already be an MLBAM id; any other id is looked up as
+a bbref or retro key.  MLBAM and FanGraphs ids are matched on the indexed
+integer ``mlbam_id``/``fangraphs_id`` columns (see :func:`fill_player_keys`).
+
+Answers are kept in a bounded per-process LRU of ``PLAYER_ID_CACHE_SIZE``
+entries, cleared whenever a ``PlayerIdInfo`` row is saved or deleted.
+"""
+
+from collections import OrderedDict
+import threading
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import Q
+
+DEFAULT_CACHE_SIZE = 10000
+
+# Key types accepted by the resolver and the PlayerIdInfo column of each.
+KEY_FIELDS = {
+    "internal": "id",
+    "mlbam": "mlbam_id",
+    "bbref": "key_bbref",
+    "fangraphs": "fangraphs_id",
+    "retro": "key_retro",
+}
+
+# Columns returned for each player by translate_ids().
+TRANSLATED_KEYS = ("id", "mlbam_id", "key_bbref", "key_fangraphs", "key_retro", "name_full")
+
+# Numeric keys outside the signed 64-bit range cannot be stored or queried.
+MAX_INT_KEY = 2**63 - 1
+
+_MISSING = object()
+
+
+def clean_key(value):
+    """Return a player key as a string without the ``.0`` left by CSV float parsing."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    if value.endswith(".0"):
+        value = value[:-2]
+    return value or None
+
+
+def _is_int_key(value):
+    # str.isdigit() also accepts non-ASCII digits such as "²" that int() rejects.
+    return (
+        value.isascii() and value.isdigit()
+        and len(value) <= len(str(MAX_INT_KEY)) and int(value) <= MAX_INT_KEY
+    )
+
+
+def parse_int_key(value):
+    """Return a numeric player key as an ``int``, or ``None`` if it is not one.
+
+    Only ASCII digits within the signed 64-bit range count as numeric.
+    """
+    value = clean_key(value)
+    if value is None or not _is_int_key(value):
+        return None
+    return int(value)
+
+
+def _normalize(value, key_type):
+    if key_type in (None, "internal", "mlbam", "fangraphs"):
+        return clean_key(value)
+    return str(value).strip() or None
+
+
+class _LRU:
+    """A small thread-safe LRU mapping."""
+
+    def __init__(self):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is not _MISSING:
+                self._data.move_to_end(key)
+            return value
+
+    def put_many(self, items, size):
+        if size <= 0:
+            return
+        with self._lock:
+            for key, value in items:
+                self._data[key] = value
+                self._data.move_to_end(key)
+            while len(self._data) > size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+_cache = _LRU()
+
+
+def _cache_size():
+    return getattr(settings, "PLAYER_ID_CACHE_SIZE", DEFAULT_CACHE_SIZE)
+
+
+def _key_query(values, key_type):
+    """Return ``(filter, columns)`` matching ``values`` of ``key_type``.
+
+    A row matches a value when one of ``columns``, as a string, equals it.
+    """
+    numbers = [int(value) for value in values if _is_int_key(value)]
+    others = [value for value in values if not _is_int_key(value)]
+    if key_type is None:
+        query = Q(pk__in=numbers) | Q(key_bbref__in=others) | Q(key_retro__in=others)
+        columns = ("id", "key_bbref", "key_retro")
+    elif key_type in ("internal", "mlbam"):
+        field = KEY_FIELDS[key_type]
+        query = Q(**{f"{field}__in": numbers})
+        columns = (field,)
+    elif key_type == "fangraphs":
+        # Minor leaguers have non-numeric FanGraphs ids such as "sa3011918".
+        query = Q(fangraphs_id__in=numbers) | Q(key_fangraphs__in=others)
+        columns = ("fangraphs_id", "key_fangraphs")
+    else:
+        field = KEY_FIELDS[key_type]
+        query = Q(**{f"{field}__in": values})
+        columns = (field,)
+    return query, columns
+
+
+def _lookup(values, key_type):
+    """Query the MLBAM ids of ``values``; returns ``{value: mlbam or None}``."""
+    from .models import PlayerIdInfo
+
+    query, columns = _key_query(values, key_type)
+    found = {}
+    for mlbam, *keys in PlayerIdInfo.objects.filter(query).values_list("mlbam_id", *columns):
+        if mlbam is None:
+            continue
+        for key in keys:
+            if key is not None:
+                found.setdefault(str(key), str(mlbam))
+
+    resolved = {}
+    for value in values:
+        mlbam = found.get(value)
+        if mlbam is None and key_type is None and _is_int_key(value):
+            # Not an internal id, so the caller passed an MLBAM id.
+            mlbam = value
+        resolved[value] = mlbam
+    return resolved
+
+
+def resolve_mlbam_ids(values, key_type=None):
+    """Return ``{str(value): mlbam_id}`` for every id in ``values``.
+
+    ``key_type`` is one of :data:`KEY_FIELDS`; without it ids are matched as
+    described in the module docstring.  Unknown ids map to ``None``.  Cache
+    misses are answered with one query.
+    """
+    if key_type is not None and key_type not in KEY_FIELDS:
+        raise ValueError(f"Unknown player id type: {key_type}")
+    tag = key_type or "auto"
+    resolved, missing = {}, []
+    for value in values:
+        value = _normalize(value, key_type)
+        if not value or value in resolved:
+            continue
+        cached = _cache.get((tag, value))
+        if cached is _MISSING:
+            missing.append(value)
+            resolved[value] = None
+        else:
+            resolved[value] = cached
+    if missing:
+        looked_up = _lookup(missing, key_type)
+        resolved.update(looked_up)
+        _cache.put_many(
+            (((tag, value), mlbam) for value, mlbam in looked_up.items()),
+            _cache_size(),
+        )
+    return resolved
+
+
+def resolve_mlbam_id(value, key_type=None):
+    """Return the MLBAM id of a single player id, or ``None`` if unknown."""
+    return resolve_mlbam_ids([value], key_type).get(_normalize(value, key_type))
+
+
+async def aresolve_mlbam_id(value, key_type=None):
+    """Async :func:`resolve_mlbam_id`; cache hits do not leave the event loop."""
+    cached = _cache.get((key_type or "auto", _normalize(value, key_type)))
+    if cached is not _MISSING:
+        return cached
+    return await sync_to_async(resolve_mlbam_id)(value, key_type)
+
+
+def translate_ids(values, key_type, chunk_size=1000):
+    """Yield ``(value, keys)`` for every distinct id in ``values``.
+
+    ``keys`` maps ``id`` (internal), ``mlbam``, ``bbref``, ``fangraphs``,
+    ``retro`` and ``name_full`` of the player, or is ``None`` for unknown ids.  Ids are looked up ``chunk_size`` at a
+    time with one indexed ``IN`` query per chunk, in input order.
+    """
+    from .models import PlayerIdInfo
+
+    if key_type not in KEY_FIELDS:
+        raise ValueError(f"Unknown player id type: {key_type}")
+    values = list(dict.fromkeys(
+        value for value in (_normalize(value, key_type) for value in values) if value
+    ))
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start + chunk_size]
+        query, columns = _key_query(chunk, key_type)
+        found = {}
+        for row in PlayerIdInfo.objects.filter(query).order_by("id").values(
+            *dict.fromkeys(TRANSLATED_KEYS + columns)
+        ):
+            keys = {
+                "id": row["id"],
+                "mlbam": str(row["mlbam_id"]) if row["mlbam_id"] is not None else None,
+                "bbref": row["key_bbref"],
+                "fangraphs": row["key_fangraphs"],
+                "retro": row["key_retro"],
+                "name_full": row["name_full"],
+            }
+            for column in columns:
+                if row[column] is not None:
+                    found.setdefault(str(row[column]), keys)
+        for value in chunk:
+            yield value, found.get(value)
+
+
+def fill_player_keys(model=None, using="default", only_missing=True, chunk_size=5000):
+    """Normalize ``key_mlbam``/``key_fangraphs`` and fill their integer columns.
+
+    Rows are updated in ``chunk_size`` batches, each in its own short
+    statement, so a backfill never holds the table for long.  Bulk loads
+    (``COPY``) bypass ``PlayerIdInfo.save``; run this afterwards.  A row whose
+    MLBAM id already belongs to another row keeps ``mlbam_id`` empty so the
+    unique index holds.  Returns the number of rows updated.
+    """
+    if model is None:
+        from .models import PlayerIdInfo as model
+
+    queryset = model.objects.using(using).order_by("id")
+    if only_missing:
+        queryset = queryset.filter(
+            Q(mlbam_id__isnull=True, key_mlbam__isnull=False)
+            | Q(fangraphs_id__isnull=True, key_fangraphs__isnull=False)
+        )
+    updated = 0
+    last_id = 0
+    while True:
+        batch = list(
+            queryset.filter(id__gt=last_id)
+            .only("id", "key_mlbam", "key_fangraphs", "mlbam_id")[:chunk_size]
+        )
+        if not batch:
+            return updated
+        parsed = {row.id: parse_int_key(row.key_mlbam) for row in batch}
+        taken = dict(
+            model.objects.using(using)
+            .filter(mlbam_id__in={key for key in parsed.values() if key is not None})
+            .values_list("mlbam_id", "id")
+        )
+        for row in batch:
+            row.key_mlbam = clean_key(row.key_mlbam)
+            row.key_fangraphs = clean_key(row.key_fangraphs)
+            row.fangraphs_id = parse_int_key(row.key_fangraphs)
+            mlbam_id = parsed[row.id]
+            if mlbam_id is not None and taken.setdefault(mlbam_id, row.id) != row.id:
+                mlbam_id = None
+            row.mlbam_id = mlbam_id
+        model.objects.using(using).bulk_update(
+            batch, ["key_mlbam", "key_fangraphs", "mlbam_id", "fangraphs_id"]
+        )
+        updated += len(batch)
+        last_id = batch[-1].id
+
+
+def invalidate(**kwargs):
+    """Forget every cached answer; connected to ``PlayerIdInfo`` saves and deletes."""
+    _cache.clear()
@@ -0,0 +1,178 @@
+"""Current team of each player, answered from the database.
+
+Player search labels every result with the player's current team.  That used
+to cost a synchronous statsapi ``people?hydrate=currentTeam`` call per
+search; now :func:`current_teams` reads the ``player_current_teams`` table,
+which the ``refresh_player_teams`` command fills in bulk from the season's
+MLB players.
+
+Players missing from the table, or whose row is older than
+``PLAYER_TEAM_OVERLAY["STALE_AFTER"]``, are looked up in a background thread
+and kept in the cache for ``PLAYER_TEAM_OVERLAY["TTL"]`` seconds.  That
+short-lived overlay takes precedence over the table, so the next search for
+the same players shows fresh teams without ever waiting on upstream.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import logging
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from . import http_client
+from .ranking import SEASON_PLAYERS_URL
+
+logger = logging.getLogger(__name__)
+
+PEOPLE_URL = "https://statsapi.mlb.com/api/v1/people"
+TEAMS_URL = "https://statsapi.mlb.com/api/v1/teams"
+
+DEFAULT_OVERLAY_OPTIONS = {
+    "ENABLED": True,
+    "TTL": 10 * 60,
+    "STALE_AFTER": 24 * 60 * 60,
+}
+
+# statsapi accepts many personIds per call; keep URLs reasonably short.
+PEOPLE_BATCH_SIZE = 50
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="player-teams")
+_pending = set()
+_pending_lock = threading.Lock()
+
+
+def overlay_options():
+    """Return ``PLAYER_TEAM_OVERLAY`` merged over :data:`DEFAULT_OVERLAY_OPTIONS`."""
+    options = dict(DEFAULT_OVERLAY_OPTIONS)
+    options.update(getattr(settings, "PLAYER_TEAM_OVERLAY", {}) or {})
+    return options
+
+
+def _overlay_key(mlbam_id):
+    return f"player-team:{mlbam_id}"
+
+
+def current_teams(mlbam_ids):
+    """Return ``{mlbam_id: team_name}`` for the given ids without calling upstream.
+
+    Ids are strings as in ``PlayerIdInfo.key_mlbam``.  Players without a
+    known team map to ``None``.
+    """
+    from .models import PlayerCurrentTeam
+
+    ids = {int(mlbam_id) for mlbam_id in mlbam_ids if str(mlbam_id).isdigit()}
+    if not ids:
+        return {}
+
+    options = overlay_options()
+    stale_before = timezone.now() - timedelta(seconds=options["STALE_AFTER"])
+    teams, refresh = {}, set(ids)
+    for player_id, team_name, updated_at in (
+        PlayerCurrentTeam.objects
+        .filter(player_mlbam_id__in=ids)
+        .values_list("player_mlbam_id", "team_name", "updated_at")
+    ):
+        teams[player_id] = team_name
+        if updated_at >= stale_before:
+            refresh.discard(player_id)
+
+    if options["ENABLED"]:
+        overlay = cache.get_many([_overlay_key(player_id) for player_id in ids])
+        for player_id in ids:
+            key = _overlay_key(player_id)
+            if key in overlay:
+                teams[player_id] = overlay[key] or None
+                refresh.discard(player_id)
+        if refresh:
+            _schedule_overlay_refresh(refresh)
+
+    return {str(player_id): teams.get(player_id) for player_id in ids}
+
+
+def _schedule_overlay_refresh(ids):
+    with _pending_lock:
+        ids = set(ids) - _pending
+        _pending.update(ids)
+    if ids:
+        _executor.submit(_refresh_in_background, sorted(ids))
+
+
+def _refresh_in_background(ids):
+    try:
+        refresh_overlay(ids)
+    except Exception:
+        logger.exception("Error refreshing current teams for %s", ids)
+    finally:
+        with _pending_lock:
+            _pending.difference_update(ids)
+
+
+def refresh_overlay(ids):
+    """Fetch the current teams of ``ids`` from statsapi into the cache overlay."""
+    ttl = overlay_options()["TTL"]
+    for start in range(0, len(ids), PEOPLE_BATCH_SIZE):
+        batch = ids[start:start + PEOPLE_BATCH_SIZE]
+        response = http_client.get(
+            PEOPLE_URL,
+            params={"personIds": ",".join(map(str, batch)), "hydrate": "currentTeam"},
+            name="player_team_overlay",
+        )
+        response.raise_for_status()
+        found = {
+            int(person["id"]): (person.get("currentTeam") or {}).get("name") or ""
+            for person in response.json().get("people") or []
+        }
+        # Cache "" for players without a team so they are not fetched again.
+        cache.set_many(
+            {_overlay_key(player_id): found.get(player_id, "") for player_id in batch},
+            ttl,
+        )
+
+
+def _team_names(season):
+    response = http_client.get(
+        TEAMS_URL, params={"sportId": 1, "season": season}, name="season_teams"
+    )
+    response.raise_for_status()
+    return {team["id"]: team.get("name") for team in response.json().get("teams") or []}
+
+
+def refresh_table(season):
+    """Replace ``player_current_teams`` with the current teams of ``season``'s players.
+
+    Returns the number of rows stored.
+    """
+    from .models import PlayerCurrentTeam
+
+    response = http_client.get(
+        SEASON_PLAYERS_URL, params={"season": season}, name="season_players"
+    )
+    response.raise_for_status()
+    names = _team_names(season)
+    now = timezone.now()
+    rows = []
+    for person in response.json().get("people") or []:
+        if person.get("id") is None:
+            continue
+        team_id = (person.get("currentTeam") or {}).get("id")
+        rows.append(PlayerCurrentTeam(
+            player_mlbam_id=int(person["id"]),
+            team_mlbam_id=team_id,
+            team_name=names.get(team_id),
+            updated_at=now,
+        ))
+
+    with transaction.atomic():
+        PlayerCurrentTeam.objects.bulk_create(
+            rows,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["player_mlbam_id"],
+            update_fields=["team_mlbam_id", "team_name", "updated_at"],
+        )
+        PlayerCurrentTeam.objects.filter(updated_at__lt=now).delete()
+    return len(rows)
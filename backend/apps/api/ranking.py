@@ -0,0 +1,189 @@
+"""Precomputed relevance score for player search.
+
+``PlayerIdInfo.search_score`` orders search results after prefix matching so
+that "Smith" lists active stars before long-retired players.  It combines:
+
+* ``active`` - on an MLB roster in the latest refreshed season,
+* ``last_season`` - the last season the player appeared in MLB,
+* ``search_hits`` - how often the player's page was requested.
+
+The ``refresh_player_ranking`` command refreshes the first two from statsapi
+and recomputes every score with one ``UPDATE``; weights come from
+``PLAYER_SEARCH_RANKING``.  Page views are counted in memory by
+:func:`record_view` and written in batches from a background thread, so
+tracking adds no query to requests.
+"""
+
+from collections import Counter
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Case, F, IntegerField, Q, Value, When
+from django.db.models.functions import Coalesce
+
+from . import http_client
+
+logger = logging.getLogger(__name__)
+
+SEASON_PLAYERS_URL = "https://statsapi.mlb.com/api/v1/sports/1/players"
+
+DEFAULT_RANKING_OPTIONS = {
+    "ACTIVE_WEIGHT": 100000,
+    "SEASON_WEIGHT": 100,
+    "POPULARITY_WEIGHT": 1,
+    "TRACK_POPULARITY": True,
+    "FLUSH_INTERVAL": 60,  # seconds between popularity writes
+    "FLUSH_SIZE": 500,  # players with pending views that force a write
+}
+
+# Scores count seasons from here so they stay small.
+FIRST_SEASON = 1871
+
+
+def ranking_options():
+    """Return ``PLAYER_SEARCH_RANKING`` merged over :data:`DEFAULT_RANKING_OPTIONS`."""
+    options = dict(DEFAULT_RANKING_OPTIONS)
+    options.update(getattr(settings, "PLAYER_SEARCH_RANKING", {}) or {})
+    return options
+
+
+def _chunks(items, size=500):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def fetch_season_players(season):
+    """Return ``{mlbam_id: active}`` for every player of an MLB ``season``."""
+    response = http_client.get(
+        SEASON_PLAYERS_URL, params={"season": season}, name="season_players"
+    )
+    response.raise_for_status()
+    return {
+        int(person["id"]): bool(person.get("active"))
+        for person in response.json().get("people") or []
+        if person.get("id") is not None
+    }
+
+
+def refresh_activity(seasons):
+    """Update ``active`` and ``last_season`` from the given seasons' players.
+
+    ``active`` reflects the latest season only.  Returns the number of
+    players seen.
+    """
+    from .models import PlayerIdInfo
+
+    seasons = sorted(seasons)
+    last_seen = {}
+    active = set()
+    for season in seasons:
+        players = fetch_season_players(season)
+        for mlbam_id in players:
+            last_seen[mlbam_id] = season
+        if season == seasons[-1]:
+            active = {mlbam_id for mlbam_id, is_active in players.items() if is_active}
+
+    PlayerIdInfo.objects.filter(active=True).update(active=False)
+    for mlbam_ids in _chunks(active):
+        PlayerIdInfo.objects.filter(mlbam_id__in=mlbam_ids).update(active=True)
+
+    by_season = {}
+    for mlbam_id, season in last_seen.items():
+        by_season.setdefault(season, []).append(mlbam_id)
+    for season, mlbam_ids in by_season.items():
+        for chunk in _chunks(mlbam_ids):
+            PlayerIdInfo.objects.filter(
+                Q(last_season__isnull=True) | Q(last_season__lt=season),
+                mlbam_id__in=chunk,
+            ).update(last_season=season)
+    return len(last_seen)
+
+
+def rank_ordering():
+    """Return the ``order_by`` arguments for best-ranked players first.
+
+    Matches the ``pidinfo_rank_idx`` index, which serves the full scan that
+    builds the player name index; unscored players rank as 0.
+    """
+    return (Coalesce("search_score", 0).desc(), "name_full")
+
+
+def score_expression(options=None):
+    """Return the SQL expression computing ``search_score`` from a row."""
+    options = options or ranking_options()
+    active = Case(
+        When(active=True, then=Value(options["ACTIVE_WEIGHT"])),
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+    season = Case(
+        When(
+            last_season__isnull=False,
+            then=(F("last_season") - FIRST_SEASON + 1) * options["SEASON_WEIGHT"],
+        ),
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+    hits = Coalesce(F("search_hits"), 0) * options["POPULARITY_WEIGHT"]
+    return active + season + hits
+
+
+def recompute_scores():
+    """Recompute ``search_score`` for every player; returns the row count."""
+    from .models import PlayerIdInfo
+
+    flush_views()
+    return PlayerIdInfo.objects.update(search_score=score_expression())
+
+
+_views = Counter()
+_views_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def record_view(mlbam_id):
+    """Count a request for a player's page towards their popularity."""
+    options = ranking_options()
+    if not options["TRACK_POPULARITY"]:
+        return
+    with _views_lock:
+        _views[int(mlbam_id)] += 1
+        due = (
+            len(_views) >= options["FLUSH_SIZE"]
+            or time.monotonic() - _last_flush >= options["FLUSH_INTERVAL"]
+        )
+    if due:
+        threading.Thread(target=_flush_in_background, name="player-views", daemon=True).start()
+
+
+def _flush_in_background():
+    try:
+        flush_views()
+    finally:
+        connections.close_all()
+
+
+def flush_views():
+    """Write pending page views to ``search_hits``."""
+    global _last_flush
+    from .models import PlayerIdInfo
+
+    with _views_lock:
+        pending = dict(_views)
+        _views.clear()
+        _last_flush = time.monotonic()
+    by_count = {}
+    for mlbam_id, count in pending.items():
+        by_count.setdefault(count, []).append(mlbam_id)
+    try:
+        for count, mlbam_ids in by_count.items():
+            for chunk in _chunks(mlbam_ids):
+                PlayerIdInfo.objects.filter(mlbam_id__in=chunk).update(
+                    search_hits=Coalesce(F("search_hits"), 0) + count
+                )
+    except Exception:  # pragma: no cover - defensive
+        logger.exception("Error writing player popularity counts")
@@ -0,0 +1,251 @@
+"""Record real upstream responses and replay them offline.
+
+``UPSTREAM_REPLAY["MODE"]`` selects how upstream traffic is handled:
+
+``off``
+    Talk to the real upstreams (default).
+``record``
+    Talk to the real upstreams and write every ``UnifiedDataClient`` result
+    and every :func:`apps.api.http_client.get` response to fixture files
+    under ``UPSTREAM_REPLAY["DIR"]``.
+``replay``
+    Never touch the network.  ``UnifiedDataClient`` is replaced by
+    :class:`ReplayClient` and HTTP requests are answered from the recorded
+    fixtures after an injected delay, so whole API requests can be
+    benchmarked and load-tested offline with realistic payloads.  Calls
+    without a fixture raise :class:`FixtureMissing`.
+
+The injected delay is ``LATENCY`` seconds plus up to ``LATENCY_JITTER``
+seconds, and can be set per method or HTTP call name in
+``LATENCY_OVERRIDES``.  The mode can also be set with the
+``DJANGO_UPSTREAM_REPLAY`` environment variable.
+
+Client results are pickled (they include pandas objects), so only replay
+fixtures you recorded yourself.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import pickle
+import random
+import threading
+import time
+from pathlib import Path
+
+import requests
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+MODE_OFF = "off"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+DEFAULT_REPLAY_OPTIONS = {
+    "MODE": MODE_OFF,
+    "DIR": "upstream_fixtures",
+    "LATENCY": 0.05,
+    "LATENCY_JITTER": 0.0,
+    "LATENCY_OVERRIDES": {},
+}
+
+
+class FixtureMissing(LookupError):
+    """Raised in replay mode for a call that was never recorded."""
+
+
+def replay_options():
+    """Return ``UPSTREAM_REPLAY`` merged over :data:`DEFAULT_REPLAY_OPTIONS`."""
+    options = dict(DEFAULT_REPLAY_OPTIONS)
+    options.update(getattr(settings, "UPSTREAM_REPLAY", {}) or {})
+    return options
+
+
+def replay_mode():
+    return replay_options()["MODE"] or MODE_OFF
+
+
+def fixture_dir():
+    path = Path(replay_options()["DIR"])
+    if not path.is_absolute():
+        path = Path(settings.BASE_DIR) / path
+    return path
+
+
+def latency_for(name):
+    options = replay_options()
+    base = (options.get("LATENCY_OVERRIDES") or {}).get(name, options["LATENCY"])
+    return base + random.uniform(0, options["LATENCY_JITTER"] or 0)
+
+
+def _digest(payload):
+    text = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def call_fixture_path(method_name, args=(), kwargs=None):
+    """Return the fixture file for a ``UnifiedDataClient`` call."""
+    digest = _digest({"args": list(args), "kwargs": kwargs or {}})
+    return fixture_dir() / "client" / method_name / f"{digest}.pickle"
+
+
+def http_fixture_path(url, params=None):
+    """Return the fixture file for an HTTP ``GET``."""
+    return fixture_dir() / "http" / f"{_digest({'url': url, 'params': params or {}})}.json"
+
+
+def _write(path, data, binary=True):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    if binary:
+        tmp.write_bytes(data)
+    else:
+        tmp.write_text(data, encoding="utf-8")
+    tmp.replace(path)
+
+
+def record_call(method_name, args, kwargs, result):
+    try:
+        data = pickle.dumps(result)
+    except Exception:
+        logger.warning("Not recording unpicklable result of %s", method_name)
+        return
+    _write(call_fixture_path(method_name, args, kwargs), data)
+
+
+def load_call(method_name, args, kwargs):
+    path = call_fixture_path(method_name, args, kwargs)
+    try:
+        return pickle.loads(path.read_bytes())
+    except FileNotFoundError:
+        raise FixtureMissing(f"No recorded {method_name} call at {path}") from None
+
+
+class RecordingClient:
+    """Pass calls through to a real client and record their results."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def __dir__(self):
+        return dir(self._client)
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        def _recorded(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            record_call(name, args, kwargs, result)
+            return result
+
+        return _recorded
+
+
+class ReplayClient:
+    """Stand-in for ``UnifiedDataClient`` that serves recorded results."""
+
+    def close(self):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def _replayed(*args, **kwargs):
+            result = load_call(name, args, kwargs)
+            time.sleep(latency_for(name))
+            return result
+
+        _replayed.__name__ = name
+        return _replayed
+
+
+_recording_factories = {}
+_recording_lock = threading.Lock()
+
+
+def _recording_factory(client_cls):
+    with _recording_lock:
+        factory = _recording_factories.get(client_cls)
+        if factory is None:
+
+            def factory(*args, **kwargs):
+                return RecordingClient(client_cls(*args, **kwargs))
+
+            # One stable factory per class keeps pooled instances reusable.
+            _recording_factories[client_cls] = factory
+        return factory
+
+
+def client_class(client_cls):
+    """Return the factory views should instantiate in place of ``client_cls``."""
+    mode = replay_mode()
+    if mode == MODE_REPLAY:
+        return ReplayClient
+    if mode == MODE_RECORD and client_cls is not None:
+        if client_cls in _recording_factories.values():
+            return client_cls
+        return _recording_factory(client_cls)
+    return client_cls
+
+
+class ReplayResponse:
+    """Minimal ``requests.Response`` look-alike for replayed HTTP calls."""
+
+    def __init__(self, url, status_code, headers, content):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} for {self.url}", response=self)
+
+
+def record_response(url, params, response):
+    payload = {
+        "url": url,
+        "status_code": response.status_code,
+        "headers": {"Content-Type": response.headers.get("Content-Type", "")},
+        "body": response.content.decode("utf-8", errors="replace"),
+    }
+    _write(http_fixture_path(url, params), json.dumps(payload), binary=False)
+
+
+def _load_response(url, params):
+    path = http_fixture_path(url, params)
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise FixtureMissing(f"No recorded response for {url} at {path}") from None
+    return ReplayResponse(
+        url, payload["status_code"], payload["headers"], payload["body"].encode("utf-8")
+    )
+
+
+def replay_response(url, params=None, name=None):
+    response = _load_response(url, params)
+    time.sleep(latency_for(name))
+    return response
+
+
+async def areplay_response(url, params=None, name=None):
+    response = _load_response(url, params)
+    await asyncio.sleep(latency_for(name))
+    return response
@@ -0,0 +1,98 @@
+"""Per-request record of how upstream data was obtained.
+
+:func:`~apps.api.middleware.upstream_state_middleware` starts a fresh
+:class:`UpstreamState` for every request.  Code that talks to upstream marks
+it (for example when a last known good payload is served instead of fresh
+data) and the middleware turns those marks into response headers.  The state
+object is shared by reference, so marks made on fan-out or refresh threads
+running in a copied context are visible to the request.
+
+The state also carries the request's deadline.  Upstream calls only get the
+time left until it (see :func:`budget`); once it has passed, remaining
+enrichment is skipped or served from cache and the response is marked
+partial.
+"""
+
+import contextvars
+import threading
+import time
+
+
+class DeadlineExceeded(Exception):
+    """Raised instead of starting an upstream call after the request deadline."""
+
+
+class UpstreamState:
+    """Mutable upstream flags for one request."""
+
+    def __init__(self, budget=None):
+        self._lock = threading.Lock()
+        self.stale = False
+        self.partial = False
+        self.circuit_open = set()
+        self.deadline = time.monotonic() + budget if budget is not None else None
+
+    def remaining(self):
+        """Seconds left until the deadline, or ``None`` without a deadline."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def expired(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def mark_partial(self):
+        self.partial = True
+
+    def mark_stale(self):
+        self.stale = True
+
+    def mark_circuit_open(self, name):
+        with self._lock:
+            self.circuit_open.add(name)
+
+
+_state = contextvars.ContextVar("upstream_state", default=None)
+
+
+def begin_request(budget=None):
+    """Install a fresh :class:`UpstreamState`; returns a token for :func:`end_request`.
+
+    ``budget`` is the request's deadline in seconds from now.
+    """
+    return _state.set(UpstreamState(budget))
+
+
+def end_request(token):
+    _state.reset(token)
+
+
+def current_state():
+    """Return the current request's state, or a throwaway one outside requests."""
+    state = _state.get()
+    return state if state is not None else UpstreamState()
+
+
+def budget(timeout):
+    """Return ``timeout`` capped at the time left in the current request.
+
+    Raises :class:`DeadlineExceeded` (and marks the response partial) when
+    the deadline has already passed.
+    """
+    state = current_state()
+    remaining = state.remaining()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        state.mark_partial()
+        raise DeadlineExceeded("request deadline exceeded")
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def deadline_expired():
+    """Return ``True`` (and mark the response partial) once the deadline passed."""
+    state = current_state()
+    if state.expired():
+        state.mark_partial()
+        return True
+    return False
@@ -0,0 +1,139 @@
+"""Per-day cache for schedule date ranges.
+
+``/api/schedule/`` serves any ``start_date``..``end_date`` range from one
+cache entry per day.  Only days missing from the cache are fetched, with a
+single ``fetch_schedule_for_date_range`` call spanning them, and each fetched
+day is cached for as long as it can still change:
+
+* past days whose games are all final never change again (``FINAL_TTL``),
+* past days with unfinished (e.g. suspended) games use ``PAST_TTL``,
+* today uses a short ``TODAY_TTL`` while games are played,
+* future days use ``FUTURE_TTL``, enough for rare postponements.
+
+Days are MLB schedule dates in US Eastern time.  Timings come from the
+``SCHEDULE_DAY_CACHE`` setting.
+"""
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.core.cache import cache
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+DEFAULT_DAY_CACHE_OPTIONS = {
+    "ENABLED": True,
+    "FINAL_TTL": 30 * DAY,
+    "PAST_TTL": 10 * MINUTE,
+    "TODAY_TTL": MINUTE,
+    "FUTURE_TTL": HOUR,
+    "MAX_DAYS": 62,
+}
+
+SCHEDULE_TIME_ZONE = ZoneInfo("America/New_York")
+
+
+def day_cache_options():
+    """Return ``SCHEDULE_DAY_CACHE`` merged over :data:`DEFAULT_DAY_CACHE_OPTIONS`."""
+    options = dict(DEFAULT_DAY_CACHE_OPTIONS)
+    options.update(getattr(settings, "SCHEDULE_DAY_CACHE", {}) or {})
+    return options
+
+
+def _parse_date(value, name):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {name} format") from None
+
+
+def parse_schedule_range(params):
+    """Return ``(start, end)`` dates from ``date`` or ``start_date``/``end_date``.
+
+    Raises ``ValueError`` with a client-facing message for missing, malformed
+    or oversized ranges.
+    """
+    if params.get("date"):
+        day = _parse_date(params["date"], "date")
+        return day, day
+    start_param, end_param = params.get("start_date"), params.get("end_date")
+    if not start_param:
+        raise ValueError("date or start_date parameter is required")
+    start = _parse_date(start_param, "start_date")
+    end = _parse_date(end_param, "end_date") if end_param else start
+    if end < start:
+        raise ValueError("end_date must not be before start_date")
+    max_days = day_cache_options()["MAX_DAYS"]
+    if (end - start).days + 1 > max_days:
+        raise ValueError(f"Date ranges are limited to {max_days} days")
+    return start, end
+
+
+def _dates(start, end):
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+def _day_key(day):
+    return f"schedule-day:{day.isoformat()}"
+
+
+def schedule_today():
+    """Return today's date on the MLB schedule."""
+    return datetime.now(SCHEDULE_TIME_ZONE).date()
+
+
+def _is_final(entry):
+    return all(
+        (game.get("status") or {}).get("abstractGameState") == "Final"
+        for game in entry.get("games", [])
+    )
+
+
+def day_ttl(day, entry, options=None, today=None):
+    """Return how long the schedule ``entry`` of ``day`` may be cached."""
+    options = options or day_cache_options()
+    today = today or schedule_today()
+    if day > today:
+        return options["FUTURE_TTL"]
+    if day == today:
+        return options["TODAY_TTL"]
+    return options["FINAL_TTL"] if _is_final(entry) else options["PAST_TTL"]
+
+
+def schedule_for_range(client, start, end):
+    """Return the schedule days from ``start`` to ``end`` like the upstream call.
+
+    Days without games are left out, matching
+    ``fetch_schedule_for_date_range``.
+    """
+    days = _dates(start, end)
+    options = day_cache_options()
+    entries = {}
+    if options["ENABLED"]:
+        cached = cache.get_many([_day_key(day) for day in days])
+        entries = {day: cached[_day_key(day)] for day in days if _day_key(day) in cached}
+
+    missing = [day for day in days if day not in entries]
+    if missing:
+        span = _dates(missing[0], missing[-1])
+        fetched = client.fetch_schedule_for_date_range(span[0], span[-1]) or []
+        by_date = {}
+        for entry in fetched:
+            entry_date = entry.get("date") or (span[0].isoformat() if len(span) == 1 else None)
+            by_date[entry_date] = entry
+        today = schedule_today()
+        by_ttl = {}
+        for day in span:
+            # Cache days without games as empty entries so they are not refetched.
+            entry = by_date.get(day.isoformat()) or {}
+            entries[day] = entry
+            ttl = day_ttl(day, entry, options, today)
+            by_ttl.setdefault(ttl, {})[_day_key(day)] = entry
+        if options["ENABLED"]:
+            for ttl, values in by_ttl.items():
+                cache.set_many(values, ttl)
+
+    return [entries[day] for day in days if entries[day]]
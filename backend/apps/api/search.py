@@ -0,0 +1,97 @@
+"""Backend-aware substring search over name columns.
+
+``icontains`` on its own scans the whole table.  Migration
+``0005_name_search_indexes`` adds indexes that :func:`name_search` uses:
+
+* PostgreSQL: pg_trgm GIN indexes on ``UPPER(name)``, which is exactly what
+  Django's ``icontains`` compares, so the lookup is used as is.
+* SQLite: FTS5 trigram shadow tables; matching row ids are selected with
+  ``MATCH`` and the lookup is still applied to the candidates.
+
+Queries shorter than a trigram cannot use either index and fall back to a
+plain ``icontains``.
+
+Player names also have normalized columns (see
+:func:`apps.api.name_index.normalize_name`); :func:`player_prefix_search`
+matches their prefixes through ordinary B-tree indexes and is accent- and
+punctuation-insensitive.
+"""
+
+from django.db import connections
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.expressions import RawSQL
+
+from .name_index import normalize_name
+from .ranking import rank_ordering
+
+MIN_INDEXED_LENGTH = 3
+
+# FTS5 shadow tables by (db table, column), see migration 0005.
+SQLITE_FTS_TABLES = {
+    ("player_id_infos", "name_full"): "player_id_infos_fts",
+    ("team_id_infos", "full_name"): "team_id_infos_fts",
+}
+
+_fts_available = {}
+
+
+def _has_table(connection, table):
+    key = (connection.alias, table)
+    if key not in _fts_available:
+        with connection.cursor() as cursor:
+            _fts_available[key] = table in connection.introspection.table_names(cursor)
+    return _fts_available[key]
+
+
+def _fts_phrase(query):
+    return '"' + query.replace('"', '""') + '"'
+
+
+def name_search(queryset, field, query):
+    """Filter ``queryset`` to rows whose ``field`` contains ``query``.
+
+    Matching is case-insensitive like ``icontains``; ordering is left to the
+    caller.
+    """
+    queryset = queryset.filter(**{f"{field}__icontains": query})
+    if len(query) < MIN_INDEXED_LENGTH:
+        return queryset
+
+    connection = connections[queryset.db]
+    if connection.vendor == "sqlite":
+        column = queryset.model._meta.get_field(field).column
+        fts = SQLITE_FTS_TABLES.get((queryset.model._meta.db_table, column))
+        if fts and _has_table(connection, fts):
+            queryset = queryset.filter(
+                pk__in=RawSQL(
+                    f"SELECT rowid FROM {fts} WHERE {fts} MATCH %s",
+                    [_fts_phrase(query)],
+                )
+            )
+    return queryset
+
+
+def player_prefix_search(queryset, query):
+    """Filter players whose normalized full or last name starts with ``query``.
+
+    Results are ranked like :class:`apps.api.name_index.PlayerNameIndex`:
+    full-name prefix matches first, then by ``search_score`` (see
+    :mod:`apps.api.ranking`), name and id.  The name indexes select the
+    matches, which are then sorted; the leading ``CASE`` keeps
+    ``pidinfo_rank_idx`` from serving this ``ORDER BY``.
+    """
+    normalized = normalize_name(query)
+    if not normalized:
+        return queryset.none()
+    return queryset.filter(
+        Q(name_normalized__startswith=normalized)
+        | Q(name_last_normalized__startswith=normalized)
+    ).order_by(
+        Case(
+            When(name_normalized__startswith=normalized, then=Value(0)),
+            default=Value(1),
+            output_field=IntegerField(),
+        ),
+        *rank_ordering(),
+        "id",
+    )
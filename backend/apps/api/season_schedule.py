@@ -0,0 +1,225 @@
+"""Season schedules served from the ``scheduled_games`` table.
+
+The season calendar rarely changes, so ``load_season_schedule`` stores every
+game of a season locally and refreshes recent dates incrementally (run it
+with ``--recent`` from cron while games are played).  The schedule, team
+recent schedule and game prediction endpoints are then answered with indexed
+queries on that table.
+
+Upstream is only consulted for days with a game that may be in progress:
+one marked ``Live``, or a ``Preview`` whose start time has passed since the
+last refresh.  Those days go through the per-day cache of
+:mod:`apps.api.schedule_days`.  Dates in seasons that were never loaded are
+served from upstream as before.
+"""
+
+from datetime import date
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from . import http_client
+from .schedule_days import schedule_for_range, schedule_today
+
+SCHEDULE_URL = "https://statsapi.mlb.com/api/v1/schedule"
+
+RECENT_GAMES = 5
+
+FINAL = "Final"
+LIVE = "Live"
+PREVIEW = "Preview"
+
+
+def fetch_schedule_days(**params):
+    """Return the statsapi schedule ``dates`` for the given query parameters."""
+    response = http_client.get(
+        SCHEDULE_URL, params={"sportId": 1, **params}, name="season_schedule"
+    )
+    response.raise_for_status()
+    return response.json().get("dates") or []
+
+
+def _score(side):
+    score = side.get("score")
+    return score if isinstance(score, int) else None
+
+
+def _row(game, game_date, now):
+    from .models import ScheduledGame
+
+    teams = game.get("teams") or {}
+    home, away = teams.get("home") or {}, teams.get("away") or {}
+    status = game.get("status") or {}
+    return ScheduledGame(
+        game_pk=game["gamePk"],
+        game_date=game_date,
+        season=int(game.get("season") or game_date.year),
+        game_datetime=parse_datetime(game["gameDate"]) if game.get("gameDate") else None,
+        home_team_id=(home.get("team") or {}).get("id"),
+        away_team_id=(away.get("team") or {}).get("id"),
+        venue_id=(game.get("venue") or {}).get("id"),
+        status=status.get("abstractGameState") or PREVIEW,
+        detailed_state=status.get("detailedState"),
+        home_score=_score(home),
+        away_score=_score(away),
+        payload=game,
+        updated_at=now,
+    )
+
+
+def store_days(days, start, end):
+    """Replace the stored games from ``start`` to ``end`` with schedule ``days``.
+
+    Returns the number of games stored.
+    """
+    from .models import ScheduledGame
+
+    now = timezone.now()
+    rows = [
+        _row(game, date.fromisoformat(day["date"]), now)
+        for day in days
+        for game in day.get("games") or []
+        if game.get("gamePk") is not None
+    ]
+    with transaction.atomic():
+        ScheduledGame.objects.bulk_create(
+            rows,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["game_pk", "game_date"],
+            update_fields=[
+                "season", "game_datetime", "home_team_id", "away_team_id", "venue_id",
+                "status", "detailed_state", "home_score", "away_score", "payload",
+                "updated_at",
+            ],
+        )
+        # Games no longer listed on these dates were moved or cancelled.
+        ScheduledGame.objects.filter(
+            game_date__range=(start, end), updated_at__lt=now
+        ).delete()
+    return len(rows)
+
+
+def load_season(season):
+    """Store every game of ``season``; returns the number of games stored."""
+    days = fetch_schedule_days(season=season)
+    return store_days(days, date(season, 1, 1), date(season, 12, 31))
+
+
+def refresh_dates(start, end):
+    """Refresh the stored games from ``start`` to ``end``."""
+    days = fetch_schedule_days(startDate=start.isoformat(), endDate=end.isoformat())
+    return store_days(days, start, end)
+
+
+def season_loaded(season):
+    from .models import ScheduledGame
+
+    return ScheduledGame.objects.filter(
+        game_date__range=(date(season, 1, 1), date(season, 12, 31))
+    ).exists()
+
+
+def _may_be_live(status, game_datetime, now):
+    if status == LIVE:
+        return True
+    return status == PREVIEW and game_datetime is not None and game_datetime <= now
+
+
+def _schedule_day(game_date, games):
+    return {"date": game_date.isoformat(), "totalGames": len(games), "games": games}
+
+
+def get_schedule(client, start, end):
+    """Return the schedule days from ``start`` to ``end``.
+
+    Stored days are served from the table; days with a game that may be in
+    progress and dates of seasons that were never loaded come from upstream.
+    """
+    from .models import ScheduledGame
+
+    if not all(season_loaded(season) for season in range(start.year, end.year + 1)):
+        return schedule_for_range(client, start, end)
+
+    now = timezone.now()
+    days, live = {}, set()
+    for game_date, status, game_datetime, payload in (
+        ScheduledGame.objects.filter(game_date__range=(start, end))
+        .order_by("game_date", "game_datetime", "game_pk")
+        .values_list("game_date", "status", "game_datetime", "payload")
+    ):
+        days.setdefault(game_date, []).append(payload)
+        if _may_be_live(status, game_datetime, now):
+            live.add(game_date)
+
+    schedule = {game_date: _schedule_day(game_date, games) for game_date, games in days.items()}
+    if live:
+        fresh = schedule_for_range(client, min(live), max(live))
+        for day in fresh:
+            game_date = date.fromisoformat(day["date"])
+            if game_date in live:
+                schedule[game_date] = day
+    return [schedule[game_date] for game_date in sorted(schedule)]
+
+
+def _schedule_dates(rows):
+    dates = {}
+    for game_date, payload in rows:
+        dates.setdefault(game_date, []).append(payload)
+    return [_schedule_day(game_date, games) for game_date, games in dates.items()]
+
+
+def recent_schedule(team_id, today=None):
+    """Return a team's previous and next games like statsapi, or ``None``.
+
+    ``None`` means the stored schedule cannot answer: the current season was
+    never loaded, the team has no stored games, or one of them may be in
+    progress.
+    """
+    from .models import ScheduledGame
+
+    today = today or schedule_today()
+    if not season_loaded(today.year):
+        return None
+
+    games = ScheduledGame.objects.filter(Q(home_team_id=team_id) | Q(away_team_id=team_id))
+    done = Q(game_date__lt=today) | Q(game_date=today, status=FINAL)
+    fields = ("game_date", "game_datetime", "status", "payload")
+    previous = list(
+        games.filter(done).order_by("-game_date", "-game_datetime").values_list(*fields)
+        [:RECENT_GAMES]
+    )[::-1]
+    upcoming = list(
+        games.filter(game_date__gte=today).exclude(status=FINAL)
+        .order_by("game_date", "game_datetime").values_list(*fields)[:RECENT_GAMES]
+    )
+    if not previous and not upcoming:
+        return None
+    now = timezone.now()
+    if any(_may_be_live(status, start, now) for _, start, status, _ in previous + upcoming):
+        return None
+
+    return {
+        "id": team_id,
+        "previousGameSchedule": {
+            "dates": _schedule_dates((row[0], row[3]) for row in previous)
+        },
+        "nextGameSchedule": {
+            "dates": _schedule_dates((row[0], row[3]) for row in upcoming)
+        },
+    }
+
+
+def game_teams(game_pk):
+    """Return ``(home_team_id, away_team_id)`` of a stored game, or ``None``."""
+    from .models import ScheduledGame
+
+    return (
+        ScheduledGame.objects.filter(game_pk=game_pk)
+        .order_by("-game_date")
+        .values_list("home_team_id", "away_team_id")
+        .first()
+    )
+
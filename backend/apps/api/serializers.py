@@ -1,4 +1,7 @@
+from django.conf import settings
 from rest_framework import serializers
+
+from .player_ids import KEY_FIELDS, parse_int_key
 # This module defines Django REST Framework serializers that serve as the API contract
 # for the Baseball Data Lab backend. They validate input payloads and shape output
 # representations for players, teams, league leaders, and related entities.
@@ -129,6 +132,29 @@ Fields:
 """
 
 
+# SearchQuerySerializer
+"""
+Validates the query parameters for the combined search endpoint.
+
+Fields:
+- q (str): Free-text search term.
+- types (str, optional): Comma-separated subset of "players", "teams", "venues".
+- limit (int, optional): Results per type (1-25, default 5).
+- cursor (str, optional): Opaque cursor from a previous response's "next" value.
+"""
+
+
+# SearchResponseSerializer
+"""
+Grouped results of the combined search endpoint.
+
+Fields:
+- players / teams / venues (object, optional): One group per requested type,
+  each with "results" (ranked entries) and "next" (cursor for the next page of
+  that type, or null).
+"""
+
+
 # NewsItemSerializer
 """
 Represents a short-form news item or article reference.
@@ -208,3 +234,74 @@ class TeamInfoSerializer(serializers.Serializer):
 class NewsItemSerializer(serializers.Serializer):
     title = serializers.CharField()
     url = serializers.CharField()
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField()
+    types = serializers.CharField(required=False)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=25)
+    cursor = serializers.CharField(required=False)
+
+
+class VenueSearchResultSerializer(serializers.Serializer):
+    mlbam_id = serializers.IntegerField(allow_null=True)
+    name = serializers.CharField()
+
+
+class PlayerSearchGroupSerializer(serializers.Serializer):
+    results = PlayerSearchResultSerializer(many=True)
+    next = serializers.CharField(allow_null=True)
+
+
+class TeamSearchGroupSerializer(serializers.Serializer):
+    results = TeamSearchResultSerializer(many=True)
+    next = serializers.CharField(allow_null=True)
+
+
+class VenueSearchGroupSerializer(serializers.Serializer):
+    results = VenueSearchResultSerializer(many=True)
+    next = serializers.CharField(allow_null=True)
+
+
+class SearchResponseSerializer(serializers.Serializer):
+    players = PlayerSearchGroupSerializer(required=False)
+    teams = TeamSearchGroupSerializer(required=False)
+    venues = VenueSearchGroupSerializer(required=False)
+
+
+class PlayerIdTranslateSerializer(serializers.Serializer):
+    key_type = serializers.ChoiceField(
+        choices=list(KEY_FIELDS)
+    )
+    ids = serializers.ListField(child=serializers.CharField(), allow_empty=False)
+
+    def validate_ids(self, value):
+        limit = getattr(settings, 'PLAYER_ID_TRANSLATE_MAX_IDS', 10000)
+        if len(value) > limit:
+            raise serializers.ValidationError(f'At most {limit} ids per request.')
+        return value
+
+    def validate(self, attrs):
+        # Reject malformed numeric ids here: once the response streams, an
+        # error can only truncate it.
+        if attrs['key_type'] in ('internal', 'mlbam'):
+            invalid = [value for value in attrs['ids'] if parse_int_key(value) is None]
+            if invalid:
+                raise serializers.ValidationError(
+                    {'ids': [f'Not a valid {attrs["key_type"]} id: {value}' for value in invalid[:10]]}
+                )
+        return attrs
+
+
+class PlayerKeysSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    mlbam = serializers.CharField(allow_null=True)
+    bbref = serializers.CharField(allow_null=True)
+    fangraphs = serializers.CharField(allow_null=True)
+    retro = serializers.CharField(allow_null=True)
+    name_full = serializers.CharField(allow_null=True)
+
+
+class PlayerIdTranslateResponseSerializer(serializers.Serializer):
+    key_type = serializers.CharField()
+    results = serializers.DictField(child=PlayerKeysSerializer(allow_null=True))
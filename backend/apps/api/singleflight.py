@@ -0,0 +1,129 @@
+"""Coalesce identical concurrent upstream fetches.
+
+When a popular cache entry expires every request that misses would normally
+call upstream at the same time.  :func:`coalesce` lets the first caller for a
+key perform the fetch while concurrent callers in the same process wait for
+its result.  With ``UPSTREAM_SINGLE_FLIGHT_DISTRIBUTED`` enabled the leader
+also takes a short lock in the cache backend so other worker processes wait
+for the value to appear in the cache instead of fetching it themselves.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOCK_TIMEOUT = 30  # seconds a cross-worker lock may be held
+DEFAULT_WAIT_TIMEOUT = 15  # seconds a follower waits before fetching itself
+POLL_INTERVAL = 0.05
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Run at most one in-flight call per key within this process.
+
+    Every caller that joins an in-flight call receives the same result object
+    (or exception), so results must be treated as read-only or copied.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, check=None):
+        """Return ``fn()``, sharing the result with concurrent callers of ``key``.
+
+        ``check`` is an optional callable returning an already available value
+        (typically a cache lookup).  It is used by the cross-worker lock to
+        pick up the value stored by a leader in another process.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            if call.event.wait(_wait_timeout()):
+                if call.error is not None:
+                    raise call.error
+                return call.result
+            logger.warning("Timed out waiting for in-flight call %s", key)
+            return fn()
+
+        try:
+            call.result = _run_with_distributed_lock(key, fn, check)
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def in_flight(self, key):
+        with self._lock:
+            return key in self._calls
+
+
+def _wait_timeout():
+    return getattr(settings, "UPSTREAM_SINGLE_FLIGHT_WAIT", DEFAULT_WAIT_TIMEOUT)
+
+
+def _distributed_enabled():
+    return getattr(settings, "UPSTREAM_SINGLE_FLIGHT_DISTRIBUTED", False)
+
+
+def _run_with_distributed_lock(key, fn, check):
+    if not _distributed_enabled() or check is None:
+        return fn()
+
+    lock_key = f"singleflight:{key}"
+    lock_timeout = getattr(
+        settings, "UPSTREAM_SINGLE_FLIGHT_LOCK_TIMEOUT", DEFAULT_LOCK_TIMEOUT
+    )
+    try:
+        acquired = cache.add(lock_key, 1, lock_timeout)
+    except Exception:  # pragma: no cover - defensive
+        logger.exception("Error acquiring single-flight lock %s", lock_key)
+        return fn()
+
+    if acquired:
+        try:
+            return fn()
+        finally:
+            cache.delete(lock_key)
+
+    # Another worker holds the lock: wait for it to publish the value.
+    deadline = time.monotonic() + _wait_timeout()
+    while time.monotonic() < deadline:
+        value = check()
+        if value is not None:
+            return value
+        if cache.get(lock_key) is None:
+            break
+        time.sleep(POLL_INTERVAL)
+    value = check()
+    return value if value is not None else fn()
+
+
+default_flight = SingleFlight()
+
+
+def coalesce(key, fn, check=None):
+    """Run ``fn`` through the process-wide :class:`SingleFlight`."""
+    return default_flight.do(key, fn, check=check)
@@ -0,0 +1,84 @@
+"""Team logo URLs without upstream client calls.
+
+Team "spot" logos are static images addressed by team id and pixel size, so
+schedule and game views look them up in a ``{team_id: url}`` map per size
+instead of calling ``UnifiedDataClient.fetch_team_spot_url`` for both teams
+of every game.  The map is built once per process from ``TeamIdInfo`` and
+``TEAM_LOGO_URL_TEMPLATE``; teams missing from it (All-Star or minor-league
+clubs) are added on first use.
+"""
+
+import threading
+
+from django.conf import settings
+
+# The URL UnifiedDataClient.fetch_team_spot_url returns.
+DEFAULT_URL_TEMPLATE = "https://midfield.mlbstatic.com/v1/team/{team_id}/spots/{size}"
+DEFAULT_SIZE = 32
+
+_maps = {}
+_lock = threading.Lock()
+
+
+def _template():
+    return getattr(settings, "TEAM_LOGO_URL_TEMPLATE", DEFAULT_URL_TEMPLATE)
+
+
+def _build(size):
+    from .models import TeamIdInfo
+
+    template = _template()
+    team_ids = (
+        TeamIdInfo.objects.filter(mlbam_team_id__isnull=False)
+        .values_list("mlbam_team_id", flat=True)
+        .distinct()
+    )
+    return {team_id: template.format(team_id=team_id, size=size) for team_id in team_ids}
+
+
+def logo_urls(size=DEFAULT_SIZE):
+    """Return the ``{team_id: logo_url}`` map for ``size``, building it once."""
+    urls = _maps.get(size)
+    if urls is None:
+        with _lock:
+            urls = _maps.get(size)
+            if urls is None:
+                urls = _maps[size] = _build(size)
+    return urls
+
+
+def team_logo_url(team_id, size=DEFAULT_SIZE):
+    """Return the logo URL of a team, or ``None`` without a team id."""
+    if not team_id:
+        return None
+    urls = logo_urls(size)
+    url = urls.get(team_id)
+    if url is None:
+        url = urls.setdefault(team_id, _template().format(team_id=team_id, size=size))
+    return url
+
+
+def attach_schedule_logos(schedule_data, size=DEFAULT_SIZE):
+    """Add a ``logo_url`` to both teams of every game in a schedule."""
+    for day in schedule_data:
+        for game in day.get("games", []):
+            teams = game.get("teams", {})
+            for side in ("home", "away"):
+                team = teams.get(side, {}).get("team")
+                if team and team.get("id"):
+                    team["logo_url"] = team_logo_url(team["id"], size)
+
+
+def attach_game_logos(data, size=DEFAULT_SIZE):
+    """Add a ``logo_url`` to both teams of a live game feed."""
+    teams = data.get("gameData", {}).get("teams", {})
+    for side in ("home", "away"):
+        team = teams.get(side)
+        if team and team.get("id"):
+            team["logo_url"] = team_logo_url(team["id"], size)
+
+
+def reset():
+    """Drop the built maps, e.g. after reloading ``team_id_infos``."""
+    with _lock:
+        _maps.clear()
@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+from django.test import AsyncRequestFactory, TestCase
+
+from apps.api.models import PlayerIdInfo
+from apps.api.utils import AsyncUnifiedClient
+from apps.api.views import async_views
+
+
+class AsyncApiViewTests(TestCase):
+    def setUp(self):
+        self.factory = AsyncRequestFactory()
+        PlayerIdInfo.objects.create(
+            id=1, key_mlbam='123', name_first='Test', name_last='Player'
+        )
+
+    @patch('apps.api.views.UnifiedDataClient')
+    async def test_player_info(self, mock_client_cls):
+        mock_client_cls.return_value.fetch_player_info.return_value = {
+            'fullName': 'Test Player',
+            'currentTeam': {'id': 147, 'name': 'New York Yankees'},
+            'birthCity': 'Tampa',
+            'birthCountry': 'USA',
+        }
+
+        request = self.factory.get('/api/players/1/')
+        response = await async_views.player_info(request, player_id=1)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertJSONEqual(response.content, {
+            'team_id': 147,
+            'team_name': 'New York Yankees',
+            'position': None,
+            'name': 'Test Player',
+            'full_name': None,
+            'birth_date': None,
+            'birth_place': 'Tampa, USA',
+            'height': None,
+            'weight': None,
+            'bat_side': None,
+            'throw_side': None,
+            'draft': None,
+            'mlb_debut_date': None,
+        })
+
+    @patch('apps.api.views.players.http_client.get')
+    @patch('apps.api.views.UnifiedDataClient')
+    async def test_player_splits_degrades_like_sync_view(self, mock_client_cls, mock_get):
+        mock_client = mock_client_cls.return_value
+        mock_client.fetch_batting_splits.return_value = [{'split': {'code': 'h'}}]
+        mock_client.fetch_pitching_splits.side_effect = RuntimeError('boom')
+        mock_get.return_value.json.return_value = {
+            'people': [{'stats': [{
+                'group': {'displayName': 'hitting'},
+                'splits': [{'month': 6}, {'month': 4}],
+            }]}]
+        }
+
+        request = self.factory.get('/api/players/1/splits/?season=2025')
+        response = await async_views.player_splits(request, player_id=1)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertJSONEqual(response.content, {
+            'batting': [{'split': {'code': 'h'}}],
+            'pitching': None,
+            'monthly': {'batting': [{'month': 4}, {'month': 6}], 'pitching': []},
+            'unavailable': ['pitching'],
+        })
+        mock_client.fetch_batting_splits.assert_called_once_with(123, 2025)
+
+    @patch('apps.api.views.UnifiedDataClient')
+    async def test_schedule_requires_date(self, mock_client_cls):
+        request = self.factory.get('/api/schedule/')
+        response = await async_views.schedule(request)
+        self.assertEqual(response.status_code, 400)
+        mock_client_cls.return_value.fetch_schedule_for_date_range.assert_not_called()
+
+    @patch('apps.api.utils.connections')
+    @patch('apps.api.views.UnifiedDataClient')
+    async def test_client_threads_close_their_db_connections(self, mock_client_cls, mock_connections):
+        client = AsyncUnifiedClient(mock_client_cls)
+
+        await client.run(lambda c: None)
+
+        mock_connections.close_all.assert_called_once_with()
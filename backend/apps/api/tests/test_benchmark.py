@@ -0,0 +1,46 @@
+import tempfile
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from apps.api.benchmark import api_routes, percentile, run_benchmarks
+from apps.api.client_pool import reset_unified_clients
+
+
+class BenchmarkTests(TestCase):
+    def test_routes_cover_api_urls(self):
+        routes = dict(api_routes())
+        self.assertEqual(routes['api-player-info'], '/api/players/592450/')
+        self.assertEqual(routes['api-schedule'], '/api/schedule/?date=2024-07-04')
+        self.assertIn('api-hall-of-fame-search', routes)
+        self.assertNotIn('api-metrics', routes)
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([7], 95), 7)
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_report_against_replayed_fixtures(self, mock_client_cls):
+        mock_client_cls.return_value.fetch_player_info.return_value = {'fullName': 'A'}
+        reset_unified_clients()
+        self.addCleanup(reset_unified_clients)
+        routes = [('api-player-info', '/api/players/592450/')]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with override_settings(UPSTREAM_REPLAY={'MODE': 'record', 'DIR': tmp}):
+                run_benchmarks(routes, requests=1)
+            with override_settings(
+                UPSTREAM_REPLAY={'MODE': 'replay', 'DIR': tmp, 'LATENCY': 0}
+            ):
+                report = run_benchmarks(routes, requests=5, concurrency=2)
+
+        result = report['results'][0]
+        self.assertEqual(report['meta']['replay_mode'], 'replay')
+        self.assertEqual(result['status_codes'], {'200': 5})
+        self.assertEqual(result['errors'], 0)
+        for key in ('p50', 'p95', 'p99'):
+            self.assertIn(key, result['latency_ms'])
+        self.assertGreater(result['peak_memory_bytes'], 0)
+        self.assertEqual(result['db_queries']['max'], 0)
@@ -0,0 +1,177 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase, Client, RequestFactory, override_settings
+from django.utils.functional import SimpleLazyObject
+
+from apps.api.caching import (
+    CACHE_MODE_BYPASS,
+    CACHE_MODE_DEFAULT,
+    CACHE_MODE_REFRESH,
+    CachingClient,
+    cache_mode_for_request,
+    cached_fetch,
+    make_cache_key,
+    schedule_refresh,
+)
+from apps.api.client_pool import client_registry
+
+
+class CachingClientTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_policy_methods_are_cached(self):
+        raw = MagicMock()
+        raw.fetch_player_info.return_value = {'id': 1}
+        client = CachingClient(raw, policy={'fetch_player_info': 60})
+
+        self.assertEqual(client.fetch_player_info(1), {'id': 1})
+        self.assertEqual(client.fetch_player_info(1), {'id': 1})
+        client.fetch_player_info(2)
+        self.assertEqual(raw.fetch_player_info.call_count, 2)
+
+    def test_methods_outside_policy_pass_through(self):
+        raw = MagicMock()
+        raw.fetch_game_live_feed.return_value = {'live': True}
+        client = CachingClient(raw, policy={})
+        client.fetch_game_live_feed(1)
+        client.fetch_game_live_feed(1)
+        self.assertEqual(raw.fetch_game_live_feed.call_count, 2)
+
+    def test_bypass_and_refresh_modes(self):
+        raw = MagicMock()
+        raw.fetch_team.side_effect = [{'v': 1}, {'v': 2}, {'v': 3}]
+        policy = {'fetch_team': 60}
+
+        self.assertEqual(CachingClient(raw, policy=policy).fetch_team(1), {'v': 1})
+        bypass = CachingClient(raw, mode=CACHE_MODE_BYPASS, policy=policy)
+        self.assertEqual(bypass.fetch_team(1), {'v': 2})
+        self.assertEqual(CachingClient(raw, policy=policy).fetch_team(1), {'v': 1})
+        refresh = CachingClient(raw, mode=CACHE_MODE_REFRESH, policy=policy)
+        self.assertEqual(refresh.fetch_team(1), {'v': 3})
+        self.assertEqual(CachingClient(raw, policy=policy).fetch_team(1), {'v': 3})
+
+    def test_cache_key_is_argument_based(self):
+        def fetch(team_id, season=2025):
+            return None
+
+        self.assertEqual(
+            make_cache_key('fetch', (1,), {}, func=fetch),
+            make_cache_key('fetch', (), {'team_id': 1, 'season': 2025}, func=fetch),
+        )
+        self.assertNotEqual(
+            make_cache_key('fetch', (1,), {}, func=fetch),
+            make_cache_key('fetch', (1, 2024), {}, func=fetch),
+        )
+
+
+@override_settings(UNIFIED_CLIENT_CACHE_ENABLED=True)
+class CachedViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_roster_served_from_cache(self, mock_client_cls):
+        mock_client = mock_client_cls.return_value
+        mock_client.fetch_active_roster.return_value = {'roster': []}
+
+        client = Client()
+        client.get('/api/teams/555/roster/')
+        client.get('/api/teams/555/roster/')
+        self.assertEqual(mock_client.fetch_active_roster.call_count, 1)
+
+        with self.settings(UNIFIED_CLIENT_CACHE_HEADER_ENABLED=True):
+            client.get('/api/teams/555/roster/', HTTP_X_UPSTREAM_CACHE='refresh')
+        self.assertEqual(mock_client.fetch_active_roster.call_count, 2)
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_cache_header_ignored_for_anonymous_callers(self, mock_client_cls):
+        mock_client = mock_client_cls.return_value
+        mock_client.fetch_active_roster.return_value = {'roster': []}
+
+        client = Client()
+        client.get('/api/teams/555/roster/')
+        client.get('/api/teams/555/roster/', HTTP_X_UPSTREAM_CACHE='refresh')
+        client.get('/api/teams/555/roster/', HTTP_X_UPSTREAM_CACHE='bypass')
+        self.assertEqual(mock_client.fetch_active_roster.call_count, 1)
+
+    def test_requests_without_cache_header_skip_the_user_lookup(self):
+        request = RequestFactory().get('/api/teams/555/roster/')
+        request.user = SimpleLazyObject(lambda: self.fail('user loaded'))
+        self.assertEqual(cache_mode_for_request(request), CACHE_MODE_DEFAULT)
+
+
+class StaleWhileRevalidateTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_fresh_value_is_served_without_fetch(self):
+        fetch = MagicMock(return_value='fresh')
+        self.assertEqual(cached_fetch('swr:k', fetch, 60, 60), 'fresh')
+        self.assertEqual(cached_fetch('swr:k', fetch, 60, 60), 'fresh')
+        fetch.assert_called_once_with()
+
+    def test_stale_value_served_while_refreshing(self):
+        cache.set('swr:k', ('old', time.time() - 1), 120)
+        fetch = MagicMock(return_value='new')
+
+        with patch('apps.api.caching.schedule_refresh', wraps=schedule_refresh) as refresh:
+            self.assertEqual(cached_fetch('swr:k', fetch, 60, 60), 'old')
+        self.assertEqual(refresh.call_count, 1)
+
+        # Wait for the background refresh to land in the cache.
+        deadline = time.time() + 2
+        while cache.get('swr:k')[0] != 'new' and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(cached_fetch('swr:k', fetch, 60, 60), 'new')
+        fetch.assert_called_once_with()
+
+    def test_schedule_refresh_deduplicates(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_fetch():
+            started.set()
+            release.wait(2)
+            return 'v'
+
+        first = schedule_refresh('swr:dup', slow_fetch, 60, 60)
+        started.wait(2)
+        second = schedule_refresh('swr:dup', slow_fetch, 60, 60)
+        release.set()
+        self.assertIsNotNone(first)
+        self.assertIsNone(second)
+        self.assertEqual(first.result(2), 'v')
+        self.assertEqual(cache.get('swr:dup')[0], 'v')
+
+    def test_background_refresh_uses_refreshing_threads_client(self):
+        instances = []
+
+        def build():
+            instance = MagicMock()
+            instance.fetch_active_roster.return_value = {'roster': len(instances)}
+            instances.append(instance)
+            return instance
+
+        client_cls = MagicMock(side_effect=build)
+        client_registry.reset()
+        owner = client_registry.get(client_cls)
+        client = CachingClient(
+            owner, policy={'fetch_active_roster': 60},
+            stale={'fetch_active_roster': 60}, client_cls=client_cls,
+        )
+        key = make_cache_key('fetch_active_roster', (555, 2025), {},
+                             func=owner.fetch_active_roster)
+        cache.set(key, ({'roster': 'old'}, time.time() - 1), 120)
+
+        self.assertEqual(client.fetch_active_roster(555, 2025), {'roster': 'old'})
+        deadline = time.time() + 2
+        while cache.get(key)[0] == {'roster': 'old'} and time.time() < deadline:
+            time.sleep(0.01)
+
+        owner.fetch_active_roster.assert_not_called()
+        self.assertEqual(len(instances), 2)
+        instances[1].fetch_active_roster.assert_called_once_with(555, 2025)
@@ -0,0 +1,142 @@
+from unittest.mock import patch
+
+import requests
+from django.core.cache import cache
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+
+from apps.api.circuit import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    get_breaker,
+    reset_breakers,
+)
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    def _fail(self, breaker):
+        def boom():
+            raise ConnectionError('down')
+
+        with self.assertRaises(ConnectionError):
+            breaker.call(boom)
+
+    def test_opens_after_threshold_and_fails_fast(self):
+        breaker = CircuitBreaker('up', failure_threshold=2, recovery_timeout=60)
+        self._fail(breaker)
+        self.assertEqual(breaker.state, STATE_CLOSED)
+        self._fail(breaker)
+        self.assertEqual(breaker.state, STATE_OPEN)
+
+        with self.assertRaises(CircuitOpenError):
+            breaker.call(lambda: self.fail('upstream must not be called'))
+        self.assertEqual(breaker.snapshot()['rejected_calls'], 1)
+
+    def test_half_open_trial_closes_or_reopens(self):
+        breaker = CircuitBreaker('up', failure_threshold=1, recovery_timeout=0)
+        self._fail(breaker)
+        self.assertEqual(breaker.state, STATE_HALF_OPEN)
+        self._fail(breaker)
+        self.assertEqual(breaker._state, STATE_OPEN)
+
+        self.assertEqual(breaker.call(lambda: 'ok'), 'ok')
+        self.assertEqual(breaker.state, STATE_CLOSED)
+
+    def test_client_errors_do_not_count(self):
+        breaker = CircuitBreaker('up', failure_threshold=1)
+
+        def not_found():
+            raise ValueError('team not found')
+
+        with self.assertRaises(ValueError):
+            breaker.call(not_found)
+        self.assertEqual(breaker.state, STATE_CLOSED)
+
+    def test_http_client_errors_do_not_count(self):
+        breaker = CircuitBreaker('up', failure_threshold=1)
+
+        def status(code):
+            def fetch():
+                response = requests.Response()
+                response.status_code = code
+                raise requests.HTTPError(f'{code}', response=response)
+            return fetch
+
+        for _ in range(3):
+            with self.assertRaises(requests.HTTPError):
+                breaker.call(status(404))
+        self.assertEqual(breaker.state, STATE_CLOSED)
+
+        with self.assertRaises(requests.HTTPError):
+            breaker.call(status(502))
+        self.assertEqual(breaker.state, STATE_OPEN)
+
+    def test_failed_results_count(self):
+        breaker = CircuitBreaker('up', failure_threshold=1)
+        breaker.call(lambda: 503, is_failure=lambda status: status >= 500)
+        self.assertEqual(breaker.state, STATE_OPEN)
+
+
+@override_settings(
+    UPSTREAM_CIRCUIT_BREAKER={'FAILURE_THRESHOLD': 2, 'RECOVERY_TIMEOUT': 60},
+)
+class DegradedModeApiTests(TestCase):
+    def setUp(self):
+        reset_breakers()
+        cache.clear()
+
+    def tearDown(self):
+        reset_breakers()
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_serves_last_good_payload_when_upstream_fails(self, mock_client_cls):
+        mock_client = mock_client_cls.return_value
+        mock_client.fetch_player_info.return_value = {'fullName': 'Test Player'}
+
+        first = Client().get('/api/players/1/')
+        self.assertEqual(first.status_code, 200)
+        self.assertNotIn('X-Upstream-Stale', first)
+
+        mock_client.fetch_player_info.side_effect = ConnectionError('timed out')
+        for _ in range(3):
+            response = Client().get('/api/players/1/')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['X-Upstream-Stale'], 'true')
+            self.assertEqual(response.json()['name'], 'Test Player')
+
+        # The breaker opened after two failures; the third request failed fast.
+        self.assertEqual(mock_client.fetch_player_info.call_count, 3)
+        self.assertEqual(get_breaker('unified_client').state, STATE_OPEN)
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_not_found_responses_leave_the_breaker_closed(self, mock_client_cls):
+        response = requests.Response()
+        response.status_code = 404
+        mock_client = mock_client_cls.return_value
+        mock_client.fetch_player_info.side_effect = requests.HTTPError(
+            '404 Client Error', response=response
+        )
+
+        for _ in range(3):
+            self.assertNotEqual(Client().get('/api/players/1/').status_code, 503)
+
+        self.assertEqual(mock_client.fetch_player_info.call_count, 3)
+        self.assertEqual(get_breaker('unified_client').state, STATE_CLOSED)
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_open_circuit_without_fallback_is_503(self, mock_client_cls):
+        mock_client = mock_client_cls.return_value
+        mock_client.fetch_player_info.side_effect = ConnectionError('timed out')
+        Client().get('/api/players/1/')
+        Client().get('/api/players/1/')
+
+        response = Client().get('/api/players/2/')
+        self.assertEqual(response.status_code, 503)
+        self.assertGreaterEqual(int(response['Retry-After']), 1)
+        self.assertEqual(mock_client.fetch_player_info.call_count, 2)
+
+        health = Client().get('/api/health/upstreams/')
+        self.assertEqual(health.status_code, 503)
+        self.assertEqual(health.json()['breakers'][0]['state'], STATE_OPEN)
@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase, Client, override_settings
+
+from apps.api.client_pool import ClientRegistry, client_registry
+
+
+class ClientRegistryTests(TestCase):
+    def test_reuses_instance_for_same_class(self):
+        registry = ClientRegistry()
+        client_cls = MagicMock()
+        first = registry.get(client_cls)
+        second = registry.get(client_cls)
+        self.assertIs(first, second)
+        client_cls.assert_called_once_with()
+
+    def test_rebuilds_when_class_changes(self):
+        registry = ClientRegistry()
+        first = registry.get(MagicMock())
+        second = registry.get(MagicMock())
+        self.assertIsNot(first, second)
+
+    def test_discard_and_reset_rebuild_instance(self):
+        registry = ClientRegistry()
+        client_cls = MagicMock(side_effect=lambda: MagicMock())
+        first = registry.get(client_cls)
+        registry.discard(first)
+        second = registry.get(client_cls)
+        self.assertIsNot(first, second)
+        first.close.assert_called_once_with()
+
+        registry.reset()
+        self.assertIsNot(registry.get(client_cls), second)
+
+    @override_settings(UNIFIED_CLIENT_MAX_FAILURES=2)
+    def test_consecutive_failures_rebuild_instance(self):
+        registry = ClientRegistry()
+        client_cls = MagicMock(side_effect=lambda: MagicMock())
+        first = registry.get(client_cls)
+        registry.report_failure(first)
+        registry.report_success(first)
+        registry.report_failure(first)
+        self.assertIs(registry.get(client_cls), first)
+        registry.report_failure(first)
+        self.assertIsNot(registry.get(client_cls), first)
+
+    @override_settings(UNIFIED_CLIENT_MAX_AGE=-1)
+    def test_rebuilds_expired_instance(self):
+        registry = ClientRegistry()
+        client_cls = MagicMock(side_effect=lambda: MagicMock())
+        self.assertIsNot(registry.get(client_cls), registry.get(client_cls))
+
+
+class RequireUnifiedClientPoolingTests(TestCase):
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_client_shared_across_requests(self, mock_client_cls):
+        client_registry.reset()
+        mock_client = mock_client_cls.return_value
+        mock_client.fetch_team_logo_url.return_value = 'logo-url'
+
+        client = Client()
+        client.get('/api/teams/555/logo/')
+        client.get('/api/teams/556/logo/')
+
+        mock_client_cls.assert_called_once_with()
+        self.assertEqual(mock_client.fetch_team_logo_url.call_count, 2)
+
+    @override_settings(UNIFIED_CLIENT_MAX_FAILURES=2)
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_client_discarded_after_failing_responses(self, mock_client_cls):
+        client_registry.reset()
+        mock_client_cls.side_effect = lambda: MagicMock(
+            fetch_team_record_for_season=MagicMock(side_effect=RuntimeError('down'))
+        )
+
+        client = Client()
+        self.assertEqual(client.get('/api/teams/555/record/').status_code, 500)
+        self.assertEqual(mock_client_cls.call_count, 1)
+        self.assertEqual(client.get('/api/teams/555/record/').status_code, 500)
+        client.get('/api/teams/555/record/')
+        self.assertEqual(mock_client_cls.call_count, 2)
+
+    @override_settings(UNIFIED_CLIENT_MAX_FAILURES=1)
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_team_info_reports_failures(self, mock_client_cls):
+        from apps.api.models import TeamIdInfo
+
+        client_registry.reset()
+        TeamIdInfo.objects.create(full_name='Red Sox', mlbam_team_id=111)
+        mock_client_cls.side_effect = lambda: MagicMock(
+            fetch_team=MagicMock(side_effect=RuntimeError('down'))
+        )
+
+        client = Client()
+        self.assertEqual(client.get('/api/teams/111/').status_code, 200)
+        client.get('/api/teams/111/')
+        self.assertEqual(mock_client_cls.call_count, 2)
@@ -0,0 +1,38 @@
+import time
+from unittest.mock import MagicMock
+
+from django.test import SimpleTestCase
+
+from apps.api.fanout import fan_out
+
+
+class FanOutTests(SimpleTestCase):
+    def test_branches_run_concurrently(self):
+        def slow(value):
+            return lambda: (time.sleep(0.2), value)[1]
+
+        started = time.monotonic()
+        result = fan_out({'a': slow(1), 'b': slow(2), 'c': slow(3)})
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(result.results, {'a': 1, 'b': 2, 'c': 3})
+        self.assertEqual(result.failed, [])
+
+    def test_per_branch_timeout_and_errors(self):
+        def boom():
+            raise ValueError('bad')
+
+        result = fan_out(
+            {'fast': lambda: 'ok', 'slow': lambda: time.sleep(1), 'bad': boom},
+            timeouts={'slow': 0.1},
+        )
+        self.assertEqual(result.get('fast'), 'ok')
+        self.assertEqual(result.failed, ['bad', 'slow'])
+        self.assertIsInstance(result.errors['slow'], TimeoutError)
+        with self.assertRaises(ValueError):
+            result.raise_first('bad')
+
+    def test_tasks_receive_client(self):
+        client = MagicMock()
+        client.fetch_team.return_value = {'id': 1}
+        result = fan_out({'team': lambda c: c.fetch_team(1)}, client=client)
+        self.assertEqual(result.get('team'), {'id': 1})
@@ -26,13 +26,17 @@ class GameDataApiTests(TestCase):
                 }
             }
         }
-        mock_client.fetch_team_spot_url.return_value = 'logo-url'
         client = Client()
         response = client.get('/api/games/123/')
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertEqual(data['gameData']['teams']['home']['name'], 'Home')
         self.assertEqual(data['gameData']['teams']['away']['score'], 3)
+        self.assertEqual(
+            data['gameData']['teams']['away']['logo_url'],
+            'https://midfield.mlbstatic.com/v1/team/2/spots/32',
+        )
+        mock_client.fetch_team_spot_url.assert_not_called()
         # self.assertEqual(
         #     data['liveData']['boxscore']['info'][0]['label'],
         #     'Att',
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase, Client
 from unittest.mock import patch
 
@@ -7,6 +8,7 @@ from apps.api.models import HallOfFameVote, PlayerIdInfo
 class HallOfFamePlayersApiTests(TestCase):
     def setUp(self):
         self.client = Client(HTTP_HOST='localhost')
+        cache.clear()
 
     @patch('apps.api.views.UnifiedDataClient')
     def test_returns_inducted_players_with_mlbam_ids(self, mock_client_cls):
@@ -57,3 +59,31 @@ class HallOfFamePlayersApiTests(TestCase):
             },
             players,
         )
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_skips_enrichment_once_deadline_passes(self, mock_client_cls):
+        mock_client = mock_client_cls.return_value
+        HallOfFameVote.objects.create(bbref_id='ruthba01', year=1936, voted_by='BBWAA', inducted=True, category='Player')
+        PlayerIdInfo.objects.create(
+            key_bbref='ruthba01', key_mlbam='12345', name_first='Babe', name_last='Ruth'
+        )
+
+        response = self.client.get(
+            '/api/players/halloffame/', HTTP_X_REQUEST_DEADLINE='0.000001'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Partial-Response'], 'true')
+        data = response.json()
+        self.assertTrue(data['partial'])
+        self.assertEqual(data['players'][0]['name'], 'Babe Ruth')
+        self.assertIsNone(data['players'][0]['position'])
+        mock_client.fetch_player_info.assert_not_called()
+
+        # Skipped players are not cached, so the next request enriches them.
+        mock_client.fetch_player_info.return_value = {
+            'primaryPosition': {'name': 'Outfielder'}
+        }
+        response = self.client.get('/api/players/halloffame/')
+        self.assertNotIn('X-Partial-Response', response)
+        self.assertEqual(response.json()['players'][0]['position'], 'Outfielder')
@@ -0,0 +1,97 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.api import http_client
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    """Answer 503 for the first ``failures`` requests, then 200."""
+
+    failures = 0
+    delay = 0
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        if self.delay:
+            time.sleep(self.delay)
+        status = 503 if type(self).hits <= self.failures else 200
+        body = b'{"ok": true}'
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client gave up after its read timeout
+
+    def log_message(self, *args):
+        pass
+
+
+class HttpClientTests(SimpleTestCase):
+    def tearDown(self):
+        http_client.reset_sessions()
+
+    def test_session_shared_per_host(self):
+        first = http_client.get_session('https://statsapi.mlb.com/api/v1/people')
+        second = http_client.get_session('https://statsapi.mlb.com/api/v1/teams')
+        other = http_client.get_session('https://img.mlbstatic.com/x.png')
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_adapter_is_bounded_and_retries(self):
+        session = http_client.get_session('https://statsapi.mlb.com/')
+        adapter = session.get_adapter('https://statsapi.mlb.com/')
+        self.assertEqual(adapter._pool_maxsize, http_client.http_options()['POOL_MAXSIZE'])
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+
+    @override_settings(UPSTREAM_HTTP={'TIMEOUT': 3, 'TIMEOUTS': {'slow': 9}})
+    def test_named_timeouts(self):
+        self.assertEqual(http_client.timeout_for('slow'), 9)
+        self.assertEqual(http_client.timeout_for('other'), 3)
+        with patch('requests.Session.get') as mock_get:
+            http_client.get('https://statsapi.mlb.com/api/v1/people', name='slow')
+            http_client.get('https://statsapi.mlb.com/api/v1/people', timeout=1)
+        self.assertEqual(mock_get.call_args_list[0].kwargs['timeout'], 9)
+        self.assertEqual(mock_get.call_args_list[1].kwargs['timeout'], 1)
+
+
+@override_settings(UPSTREAM_HTTP={
+    'RETRIES': 2,
+    'BACKOFF_FACTOR': 0,
+    'BACKOFF_JITTER': 0,
+    'TIMEOUT': 0.2,
+    'RETRY_OVERRIDES': {'autocomplete': {'read': 0}},
+})
+class HttpClientRetryTests(SimpleTestCase):
+    def setUp(self):
+        handler = type('Handler', (_FlakyHandler,), {'hits': 0})
+        self.handler = handler
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{self.server.server_port}/api/v1/people'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        http_client.reset_sessions()
+
+    def test_503_is_retried_by_mounted_adapter(self):
+        self.handler.failures = 1
+        resp = http_client.get(self.url)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self.handler.hits, 2)
+
+    def test_read_timeouts_not_retried_for_overridden_call(self):
+        self.handler.delay = 0.5
+        with self.assertRaises(Exception):
+            http_client.get(self.url, name='autocomplete')
+        self.assertEqual(self.handler.hits, 1)
+        self.assertEqual(http_client.retry_counts_for('autocomplete')['read'], 0)
+        self.assertEqual(http_client.retry_counts_for('other')['read'], 2)
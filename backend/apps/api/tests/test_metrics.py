@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+
+from apps.api import http_client, metrics
+from apps.api.circuit import reset_breakers
+
+
+class HistogramTests(SimpleTestCase):
+    def test_render_is_cumulative(self):
+        histogram = metrics.Histogram('t_seconds', 'Test.', ('method',), buckets=(1, 5))
+        histogram.observe(0.5, method='a')
+        histogram.observe(3, method='a')
+        histogram.observe(9, method='a')
+
+        lines = [f'{n}{l} {metrics._format_value(v)}' for n, l, v in histogram.samples()]
+        self.assertEqual(lines, [
+            't_seconds_bucket{method="a",le="1"} 1',
+            't_seconds_bucket{method="a",le="5"} 2',
+            't_seconds_bucket{method="a",le="+Inf"} 3',
+            't_seconds_sum{method="a"} 12.5',
+            't_seconds_count{method="a"} 3',
+        ])
+
+
+class MetricsEndpointTests(TestCase):
+    def setUp(self):
+        metrics.reset()
+        reset_breakers()
+        cache.clear()
+
+    def tearDown(self):
+        http_client.reset_sessions()
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_upstream_and_request_metrics(self, mock_client_cls):
+        mock_client_cls.return_value.fetch_player_info.return_value = {'fullName': 'A'}
+        Client().get('/api/players/1/')
+
+        body = Client().get('/api/metrics/').content.decode()
+        self.assertIn(
+            'upstream_calls_total{upstream="unified_client",method="fetch_player_info"} 1',
+            body,
+        )
+        self.assertIn(
+            'upstream_payload_bytes_count{upstream="unified_client",method="fetch_player_info"} 1',
+            body,
+        )
+        self.assertIn(
+            'http_request_duration_seconds_count'
+            '{route="api/players/<int:player_id>/",method="GET",status="200"} 1',
+            body,
+        )
+
+    @override_settings(UNIFIED_CLIENT_CACHE_ENABLED=True)
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_cache_hits_and_misses(self, mock_client_cls):
+        mock_client_cls.return_value.fetch_player_info.return_value = {'fullName': 'A'}
+        Client().get('/api/players/1/')
+        Client().get('/api/players/1/')
+
+        self.assertEqual(metrics.cache_requests.value(call='fetch_player_info', result='miss'), 1)
+        self.assertEqual(metrics.cache_requests.value(call='fetch_player_info', result='hit'), 1)
+        self.assertEqual(
+            metrics.upstream_calls.value(upstream='unified_client', method='fetch_player_info'), 1
+        )
+
+    def test_raw_http_server_errors_are_counted(self):
+        with patch('requests.Session.get') as mock_get:
+            mock_get.return_value.status_code = 503
+            http_client.get('https://statsapi.mlb.com/api/v1/people', name='player_search')
+
+        self.assertEqual(
+            metrics.upstream_errors.value(
+                upstream='statsapi.mlb.com', method='player_search', error='http_503'
+            ),
+            1,
+        )
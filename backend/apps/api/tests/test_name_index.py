@@ -0,0 +1,88 @@
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+
+from apps.api import name_index
+from apps.api.models import DataVersion, PlayerIdInfo
+from apps.api.name_index import PlayerNameIndex, normalize_name
+
+
+class PlayerNameIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = PlayerNameIndex.build([
+            (3, 'Aaron', 'Judge'),
+            (1, 'Ronald', 'Acuña'),
+            (4, 'J.D.', 'Martinez'),
+            (2, 'Judge', 'Jones'),
+        ])
+
+    def test_normalize_name(self):
+        self.assertEqual(normalize_name('J. D. Martínez'), 'jd martinez')
+        self.assertEqual(normalize_name("O'Neill"), 'oneill')
+        self.assertEqual(normalize_name('  ACUÑA '), 'acuna')
+
+    def test_token_prefix_matches_in_rank_order(self):
+        self.assertEqual(self.index.search('aaron'), [3])
+        self.assertEqual(self.index.search('mart'), [4])
+
+    def test_full_name_prefixes_rank_first(self):
+        # "Judge Jones" starts with the query; "Aaron Judge" only has a token.
+        self.assertEqual(self.index.search('jud'), [2, 3])
+        self.assertEqual(self.index.search('jud', limit=1), [2])
+        self.assertEqual(self.index.search('judge j'), [2, 3])
+        # Each group keeps rank order: "jd martinez" and "judge jones" first.
+        self.assertEqual(self.index.search('j'), [4, 2, 3])
+        self.assertEqual(self.index.search('acuna'), [1])
+        self.assertEqual(self.index.search('jd mart'), [4])
+
+    def test_every_term_must_match(self):
+        self.assertEqual(self.index.search('judge aar'), [3])
+        self.assertEqual(self.index.search('judge smith'), [])
+        self.assertEqual(self.index.search('udg'), [])
+        self.assertEqual(self.index.search(' . '), [])
+
+
+@override_settings(PLAYER_NAME_INDEX={'ENABLED': True})
+class PlayerSearchIndexApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        name_index.reset()
+        self.addCleanup(name_index.reset)
+
+    def test_player_search_uses_index(self):
+        PlayerIdInfo.objects.create(key_mlbam='1', name_first='Ronald', name_last='Acuña')
+        PlayerIdInfo.objects.create(key_mlbam='2', name_first='Ronald', name_last='Reagan')
+
+        with self.assertNumQueries(4):  # index version, index build, result rows, teams
+            data = Client().get('/api/players/', {'q': 'acuna'}).json()
+        self.assertEqual([p['key_mlbam'] for p in data], ['1'])
+
+        with self.assertNumQueries(2):
+            data = Client().get('/api/players/', {'q': 'ron'}).json()
+        self.assertEqual([p['key_mlbam'] for p in data], ['1', '2'])
+
+    def _version(self):
+        return DataVersion.objects.filter(name=name_index.VERSION_NAME).first()
+
+    def test_saves_invalidate_the_index(self):
+        self.assertIsNone(self._version())
+        PlayerIdInfo.objects.create(key_mlbam='1', name_first='Test', name_last='Player')
+        version = self._version().version
+        PlayerIdInfo.objects.filter(key_mlbam='1').delete()
+        self.assertGreater(self._version().version, version)
+
+    @override_settings(PLAYER_NAME_INDEX={'ENABLED': True, 'VERSION_CHECK_SECONDS': 60})
+    @patch('apps.api.name_index._rebuild_in_background')
+    def test_other_processes_notice_a_new_version(self, rebuild):
+        index = name_index.get_player_index()
+        # Another process bumps the version in the shared database.
+        DataVersion.objects.create(name=name_index.VERSION_NAME, version=42)
+
+        self.assertIs(name_index.get_player_index(), index)
+        rebuild.assert_not_called()
+
+        with patch('apps.api.name_index.time.monotonic', return_value=time.monotonic() + 61):
+            self.assertIs(name_index.get_player_index(), index)
+        rebuild.assert_called_once_with(42)
@@ -0,0 +1,68 @@
+import json
+
+from django.test import Client, TestCase, override_settings
+
+from apps.api.models import PlayerIdInfo
+
+
+class PlayerIdTranslateApiTests(TestCase):
+    def setUp(self):
+        self.judge = PlayerIdInfo.objects.create(
+            key_mlbam='592450', key_bbref='judgeaa01', key_fangraphs='15640',
+            key_retro='judga001', name_first='Aaron', name_last='Judge',
+        )
+        PlayerIdInfo.objects.create(
+            key_mlbam='660271', key_bbref='ohtansh01', name_first='Shohei', name_last='Ohtani',
+        )
+
+    def _post(self, payload):
+        return Client().post(
+            '/api/players/ids/', json.dumps(payload), content_type='application/json'
+        )
+
+    def test_translates_bbref_ids_in_order(self):
+        with self.assertNumQueries(1):
+            response = self._post({
+                'key_type': 'bbref', 'ids': ['ohtansh01', 'nobody01', 'judgeaa01'],
+            })
+            body = json.loads(b''.join(response.streaming_content))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body['key_type'], 'bbref')
+        self.assertEqual(list(body['results']), ['ohtansh01', 'nobody01', 'judgeaa01'])
+        self.assertIsNone(body['results']['nobody01'])
+        self.assertEqual(body['results']['judgeaa01'], {
+            'id': self.judge.id, 'mlbam': '592450', 'bbref': 'judgeaa01',
+            'fangraphs': '15640', 'retro': 'judga001', 'name_full': 'Aaron Judge',
+        })
+
+    def test_large_batches_use_chunked_queries(self):
+        ids = [str(600000 + i) for i in range(2500)] + ['592450.0']
+        with self.assertNumQueries(3):
+            response = self._post({'key_type': 'mlbam', 'ids': ids})
+            body = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(len(body['results']), 2501)
+        self.assertEqual(body['results']['592450']['bbref'], 'judgeaa01')
+
+    @override_settings(PLAYER_ID_TRANSLATE_MAX_IDS=2)
+    def test_rejects_invalid_requests(self):
+        self.assertEqual(self._post({'key_type': 'espn', 'ids': ['1']}).status_code, 400)
+        self.assertEqual(self._post({'key_type': 'mlbam', 'ids': []}).status_code, 400)
+        self.assertEqual(
+            self._post({'key_type': 'mlbam', 'ids': ['1', '2', '3']}).status_code, 400
+        )
+
+    def test_rejects_malformed_numeric_ids_before_streaming(self):
+        for key_type, value in [('mlbam', '²'), ('internal', '9' * 30), ('mlbam', 'judgeaa01')]:
+            response = self._post({'key_type': key_type, 'ids': ['592450', value]})
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('ids', response.json())
+
+    def test_non_numeric_fangraphs_ids_are_unknown(self):
+        response = self._post({'key_type': 'fangraphs', 'ids': ['²', '9' * 30, '15640']})
+        body = json.loads(b''.join(response.streaming_content))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(body['results']['²'])
+        self.assertIsNone(body['results']['9' * 30])
+        self.assertEqual(body['results']['15640']['mlbam'], '592450')
@@ -0,0 +1,99 @@
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.test import Client, TestCase, override_settings
+
+from apps.api import player_ids
+from apps.api.models import PlayerIdInfo
+from apps.api.player_ids import (
+    aresolve_mlbam_id, fill_player_keys, resolve_mlbam_id, resolve_mlbam_ids,
+)
+
+
+@override_settings(PLAYER_ID_CACHE_SIZE=100)
+class PlayerIdResolverTests(TestCase):
+    def setUp(self):
+        PlayerIdInfo.objects.create(
+            id=1, key_mlbam='592450.0', key_bbref='judgeaa01',
+            key_fangraphs='15640', key_retro='judga001',
+        )
+        PlayerIdInfo.objects.create(id=2, key_mlbam='660271', key_bbref='ohtansh01')
+        player_ids.invalidate()
+        self.addCleanup(player_ids.invalidate)
+
+    def test_resolves_every_key_type(self):
+        self.assertEqual(resolve_mlbam_id(1), '592450')
+        self.assertEqual(resolve_mlbam_id('judgeaa01'), '592450')
+        self.assertEqual(resolve_mlbam_id('judga001'), '592450')
+        self.assertEqual(resolve_mlbam_id('15640', 'fangraphs'), '592450')
+        self.assertEqual(resolve_mlbam_id('592450', 'mlbam'), '592450')
+        self.assertEqual(resolve_mlbam_id(2, 'internal'), '660271')
+
+    def test_unknown_ids(self):
+        # Unknown numeric ids are taken to be MLBAM ids already.
+        self.assertEqual(resolve_mlbam_id('545361'), '545361')
+        self.assertEqual(resolve_mlbam_id('545361.0'), '545361')
+        self.assertIsNone(resolve_mlbam_id('nobody01'))
+        self.assertIsNone(resolve_mlbam_id('545361', 'mlbam'))
+        self.assertIsNone(resolve_mlbam_id('²'))
+        self.assertIsNone(resolve_mlbam_id('9' * 30, 'internal'))
+        with self.assertRaises(ValueError):
+            resolve_mlbam_id(1, 'espn')
+
+    def test_batch_is_one_query_then_cached(self):
+        with self.assertNumQueries(1):
+            resolved = resolve_mlbam_ids([1, '2', 'ohtansh01', '545361', 'nobody01'])
+        self.assertEqual(resolved, {
+            '1': '592450', '2': '660271', 'ohtansh01': '660271',
+            '545361': '545361', 'nobody01': None,
+        })
+        with self.assertNumQueries(0):
+            self.assertEqual(resolve_mlbam_id('ohtansh01'), '660271')
+            self.assertEqual(async_to_sync(aresolve_mlbam_id)(1), '592450')
+
+    def test_saves_clear_the_cache(self):
+        self.assertEqual(resolve_mlbam_id(3), '3')
+        PlayerIdInfo.objects.create(id=3, key_mlbam='543037')
+        self.assertEqual(resolve_mlbam_id(3), '543037')
+
+    @override_settings(PLAYER_ID_CACHE_SIZE=2)
+    def test_cache_is_bounded(self):
+        resolve_mlbam_ids([1, 2, 3])
+        self.assertEqual(len(player_ids._cache), 2)
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_player_endpoint_resolves_once(self, mock_client_cls):
+        mock_client_cls.return_value.fetch_player_stats_career.return_value = {}
+        with self.assertNumQueries(1):
+            Client().get('/api/players/1/stats/')
+        with self.assertNumQueries(0):
+            Client().get('/api/players/1/stats/')
+        mock_client_cls.return_value.fetch_player_stats_career.assert_called_with(592450)
+
+
+class FillPlayerKeysTests(TestCase):
+    def test_bulk_loaded_rows_are_normalized(self):
+        PlayerIdInfo.objects.bulk_create([
+            PlayerIdInfo(key_mlbam='660271.0', key_fangraphs='19755.0'),
+            PlayerIdInfo(key_mlbam='660271', key_fangraphs='sa3011918'),
+            PlayerIdInfo(key_mlbam=None, key_fangraphs=None),
+        ])
+
+        self.assertEqual(fill_player_keys(chunk_size=1), 2)
+        rows = list(
+            PlayerIdInfo.objects.order_by('id')
+            .values_list('key_mlbam', 'mlbam_id', 'key_fangraphs', 'fangraphs_id')
+        )
+        self.assertEqual(rows, [
+            ('660271', 660271, '19755', 19755),
+            # The duplicate MLBAM id stays out of the unique index.
+            ('660271', None, 'sa3011918', None),
+            (None, None, None, None),
+        ])
+        self.assertEqual(resolve_mlbam_id('sa3011918', 'fangraphs'), None)
+        self.assertEqual(resolve_mlbam_id('19755', 'fangraphs'), '660271')
+
+    def test_save_fills_integer_keys(self):
+        player = PlayerIdInfo.objects.create(key_mlbam='545361.0', key_fangraphs='10155')
+        self.assertEqual((player.key_mlbam, player.mlbam_id, player.fangraphs_id),
+                         ('545361', 545361, 10155))
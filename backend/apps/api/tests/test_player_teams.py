@@ -0,0 +1,78 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import Client, TestCase, override_settings
+from django.utils import timezone
+
+from apps.api import player_teams
+from apps.api.models import PlayerCurrentTeam, PlayerIdInfo
+
+
+def _response(payload):
+    response = MagicMock()
+    response.json.return_value = payload
+    return response
+
+
+class PlayerCurrentTeamTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch('apps.api.player_teams.http_client.get')
+    def test_refresh_command_replaces_the_table(self, mock_get):
+        PlayerCurrentTeam.objects.create(
+            player_mlbam_id=1, team_name='Old Team', updated_at=timezone.now() - timedelta(days=2)
+        )
+        payloads = {
+            player_teams.SEASON_PLAYERS_URL: {'people': [
+                {'id': 2, 'currentTeam': {'id': 147}},
+                {'id': 3, 'currentTeam': {'id': 121}},
+            ]},
+            player_teams.TEAMS_URL: {'teams': [
+                {'id': 147, 'name': 'New York Yankees'},
+                {'id': 121, 'name': 'New York Mets'},
+            ]},
+        }
+        mock_get.side_effect = lambda url, params, name: _response(payloads[url])
+
+        call_command('refresh_player_teams', season=2024, stdout=StringIO())
+
+        self.assertEqual(
+            dict(PlayerCurrentTeam.objects.values_list('player_mlbam_id', 'team_name')),
+            {2: 'New York Yankees', 3: 'New York Mets'},
+        )
+
+    @patch('apps.api.views.players.http_client.get')
+    def test_player_search_reads_teams_from_the_table(self, mock_get):
+        PlayerIdInfo.objects.create(key_mlbam='592450.0', name_first='Aaron', name_last='Judge')
+        PlayerCurrentTeam.objects.create(
+            player_mlbam_id=592450, team_name='New York Yankees', updated_at=timezone.now()
+        )
+
+        data = Client().get('/api/players/', {'q': 'judge'}).json()
+
+        self.assertEqual(data[0]['key_mlbam'], '592450')
+        self.assertEqual(data[0]['team_name'], 'New York Yankees')
+        mock_get.assert_not_called()
+
+    @override_settings(PLAYER_TEAM_OVERLAY={'ENABLED': True, 'TTL': 60, 'STALE_AFTER': 3600})
+    @patch('apps.api.player_teams.http_client.get')
+    def test_missing_players_are_filled_in_the_background(self, mock_get):
+        mock_get.return_value = _response({'people': [
+            {'id': 10, 'currentTeam': {'name': 'Boston Red Sox'}},
+        ]})
+
+        with patch.object(player_teams, '_schedule_overlay_refresh') as schedule:
+            self.assertEqual(player_teams.current_teams(['10', '11']), {'10': None, '11': None})
+        schedule.assert_called_once_with({10, 11})
+        mock_get.assert_not_called()
+
+        player_teams.refresh_overlay([10, 11])
+        self.assertEqual(mock_get.call_args.kwargs['name'], 'player_team_overlay')
+        with patch.object(player_teams, '_schedule_overlay_refresh') as schedule:
+            teams = player_teams.current_teams(['10', '11'])
+        self.assertEqual(teams, {'10': 'Boston Red Sox', '11': None})
+        schedule.assert_not_called()
@@ -324,3 +324,44 @@ class PlayerCareerStatsBatchApiTests(TestCase):
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(resp.json(), {'people': []})
         mock_client.fetch_career_stats_for_players.assert_called_once_with([1, 2])
+
+
+class PlayerSplitsFanOutApiTests(TestCase):
+    def setUp(self):
+        PlayerIdInfo.objects.create(
+            id=1, key_mlbam='123', name_first='Test', name_last='Player'
+        )
+
+    @patch('apps.api.views.players.http_client.get')
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_splits_returned_when_monthly_fails(self, mock_client_cls, mock_get):
+        mock_client = mock_client_cls.return_value
+        mock_client.fetch_batting_splits.return_value = [{'split': {'code': 'h'}}]
+        mock_client.fetch_pitching_splits.return_value = []
+        mock_get.side_effect = RuntimeError('timeout')
+
+        response = Client().get('/api/players/1/splits/?season=2025')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['batting'][0]['split']['code'], 'h')
+        self.assertEqual(data['monthly'], {'batting': [], 'pitching': []})
+        self.assertEqual(data['unavailable'], ['monthly'])
+        mock_client.fetch_batting_splits.assert_called_once_with(123, 2025)
+
+    @patch('apps.api.views.players.http_client.get')
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_monthly_splits_sorted(self, mock_client_cls, mock_get):
+        mock_client = mock_client_cls.return_value
+        mock_client.fetch_batting_splits.return_value = []
+        mock_client.fetch_pitching_splits.return_value = []
+        mock_get.return_value.json.return_value = {
+            'people': [{'stats': [{
+                'group': {'displayName': 'hitting'},
+                'splits': [{'month': 6}, {'month': 4}],
+            }]}]
+        }
+
+        data = Client().get('/api/players/1/splits/').json()
+        self.assertEqual([m['month'] for m in data['monthly']['batting']], [4, 6])
+        self.assertNotIn('unavailable', data)
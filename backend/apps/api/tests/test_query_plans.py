@@ -0,0 +1,58 @@
+"""Query-plan regression tests: the API's lookups must use their indexes."""
+
+from django.db import connection
+from django.db.models import Max, OuterRef, Subquery
+from django.test import TestCase
+
+from apps.api.models import HallOfFameVote, PlayerIdInfo, TeamIdInfo, Venue
+
+
+class LookupIndexTests(TestCase):
+    def setUp(self):
+        if connection.vendor == 'postgresql':
+            # Tiny test tables are cheaper to scan; ask for the index plan.
+            with connection.cursor() as cursor:
+                cursor.execute('SET enable_seqscan = off')
+        elif connection.vendor != 'sqlite':
+            self.skipTest(f'No query-plan expectations for {connection.vendor}')
+
+    def assertUsesIndex(self, queryset, index, count=1):
+        plan = queryset.explain()
+        self.assertGreaterEqual(plan.count(index), count, plan)
+
+    def test_player_key_lookups(self):
+        self.assertUsesIndex(
+            PlayerIdInfo.objects.filter(mlbam_id__in=[592450, 660271]), 'pidinfo_mlbam_id_uniq'
+        )
+        self.assertUsesIndex(
+            PlayerIdInfo.objects.filter(fangraphs_id=15640), 'pidinfo_fangraphs_id_idx'
+        )
+        self.assertUsesIndex(
+            PlayerIdInfo.objects.filter(key_bbref__in=['judgeaa01']), 'pidinfo_bbref_idx'
+        )
+        self.assertUsesIndex(
+            PlayerIdInfo.objects.filter(key_retro='judga001'), 'pidinfo_retro_idx'
+        )
+
+    def test_team_lookups(self):
+        self.assertUsesIndex(
+            TeamIdInfo.objects.filter(mlbam_team_id=147, active_to__isnull=True),
+            'teaminfo_mlbam_idx',
+        )
+        self.assertUsesIndex(TeamIdInfo.objects.filter(mlbam_team_id=147), 'teaminfo_mlbam_idx')
+
+    def test_venue_lookup(self):
+        self.assertUsesIndex(Venue.objects.filter(mlbam_id=3313), 'venue_mlbam_idx')
+
+    def test_hall_of_fame_latest_vote(self):
+        # The query hall_of_fame_players runs.
+        base_qs = HallOfFameVote.objects.filter(inducted=True, category='Player')
+        latest_vote = base_qs.filter(bbref_id=OuterRef('bbref_id')).order_by('-year')
+        self.assertUsesIndex(
+            base_qs.values('bbref_id').annotate(
+                year=Max('year'),
+                voted_by=Subquery(latest_vote.values('voted_by')[:1]),
+            ),
+            'hofvote_player_idx',
+            count=2,  # the grouping and the correlated subquery
+        )
@@ -0,0 +1,93 @@
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from apps.api import ranking
+from apps.api.models import PlayerIdInfo
+from apps.api.name_index import build_player_index
+from apps.api.search import player_prefix_search
+
+
+def _response(people):
+    response = MagicMock()
+    response.json.return_value = {'people': people}
+    return response
+
+
+class PlayerRankingTests(TestCase):
+    def setUp(self):
+        self.retired = PlayerIdInfo.objects.create(
+            key_mlbam='100', name_first='Al', name_last='Smith'
+        )
+        self.recent = PlayerIdInfo.objects.create(
+            key_mlbam='200.0', name_first='Bo', name_last='Smith'
+        )
+        self.active = PlayerIdInfo.objects.create(
+            key_mlbam='300', name_first='Cy', name_last='Smith'
+        )
+
+    @patch('apps.api.ranking.http_client.get')
+    def test_refresh_ranks_active_then_recent_players_first(self, mock_get):
+        seasons = {
+            2023: [{'id': 200, 'active': True}, {'id': 300, 'active': True}],
+            2024: [{'id': 300, 'active': True}, {'id': 200, 'active': False}],
+        }
+        mock_get.side_effect = lambda url, params, name: _response(seasons[params['season']])
+
+        call_command('refresh_player_ranking', season=2024, since=2023, stdout=StringIO())
+
+        self.active.refresh_from_db()
+        self.recent.refresh_from_db()
+        self.assertTrue(self.active.active)
+        self.assertFalse(self.recent.active)
+        self.assertEqual(self.recent.last_season, 2024)
+
+        names = list(
+            player_prefix_search(PlayerIdInfo.objects, 'smith')
+            .values_list('name_first', flat=True)
+        )
+        self.assertEqual(names, ['Cy', 'Bo', 'Al'])
+        self.assertEqual(
+            build_player_index().search('smi'),
+            [self.active.id, self.recent.id, self.retired.id],
+        )
+
+    def test_full_name_prefix_matches_rank_first(self):
+        PlayerIdInfo.objects.filter(pk=self.active.pk).update(search_score=10)
+        smithers = PlayerIdInfo.objects.create(name_first='Smith', name_last='Jones')
+        ids = list(
+            player_prefix_search(PlayerIdInfo.objects, 'smith').values_list('id', flat=True)
+        )
+        self.assertEqual(ids[:2], [smithers.id, self.active.id])
+
+    def test_index_and_database_rank_matches_alike(self):
+        PlayerIdInfo.objects.filter(pk=self.active.pk).update(search_score=10)
+        PlayerIdInfo.objects.filter(pk=self.recent.pk).update(search_score=5)
+        PlayerIdInfo.objects.create(name_first='Smith', name_last='Jones')
+        PlayerIdInfo.objects.create(name_first='Smitty', name_last='Brown', search_score=20)
+        PlayerIdInfo.objects.create(name_first='Cyrus', name_last='Smithson', search_score=30)
+        PlayerIdInfo.objects.create(name_first='Bob', name_last='Cyr')
+        index = build_player_index()
+
+        for query in ('s', 'sm', 'smith', 'smithson', 'cy', 'smith jo', 'bo', 'jones'):
+            for limit in (2, 10):
+                with self.subTest(query=query, limit=limit):
+                    expected = list(
+                        player_prefix_search(PlayerIdInfo.objects, query)
+                        .values_list('id', flat=True)[:limit]
+                    )
+                    self.assertEqual(index.search(query, limit), expected)
+
+    @override_settings(PLAYER_SEARCH_RANKING={'TRACK_POPULARITY': True, 'FLUSH_SIZE': 100})
+    def test_page_views_raise_the_score(self):
+        ranking.record_view(100)
+        ranking.record_view(100)
+        ranking.recompute_scores()
+
+        self.retired.refresh_from_db()
+        self.recent.refresh_from_db()
+        self.assertEqual(self.retired.search_hits, 2)
+        self.assertEqual(self.retired.search_score, 2)
+        self.assertEqual(self.recent.search_score, 0)
@@ -0,0 +1,66 @@
+import tempfile
+from unittest.mock import patch
+
+from django.test import Client, TestCase, override_settings
+
+from apps.api import http_client
+from apps.api.client_pool import reset_unified_clients
+from apps.api.models import PlayerIdInfo
+
+
+class ReplayTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        reset_unified_clients()
+        self.addCleanup(reset_unified_clients)
+        self.addCleanup(http_client.reset_sessions)
+
+    def _replay(self, mode):
+        return override_settings(
+            UPSTREAM_REPLAY={'MODE': mode, 'DIR': self.tmp.name, 'LATENCY': 0}
+        )
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_recorded_client_calls_replay_without_the_library(self, mock_client_cls):
+        mock_client_cls.return_value.fetch_player_info.return_value = {
+            'fullName': 'Test Player',
+        }
+        with self._replay('record'):
+            recorded = Client().get('/api/players/1/')
+        self.assertEqual(recorded.status_code, 200)
+
+        with self._replay('replay'), patch('apps.api.views.UnifiedDataClient', None):
+            replayed = Client().get('/api/players/1/')
+            missing = Client().get('/api/players/2/')
+
+        self.assertEqual(replayed.json(), recorded.json())
+        self.assertEqual(missing.status_code, 500)
+        mock_client_cls.return_value.fetch_player_info.assert_called_once_with(1)
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_recorded_http_responses_replay(self, mock_client_cls):
+        PlayerIdInfo.objects.create(
+            id=1, key_mlbam='123', name_first='Test', name_last='Player'
+        )
+        mock_client_cls.return_value.fetch_batting_splits.return_value = []
+        mock_client_cls.return_value.fetch_pitching_splits.return_value = []
+        body = b'{"people": [{"stats": [{"group": {"displayName": "hitting"}, "splits": [{"month": 5}]}]}]}'
+
+        with self._replay('record'), patch('requests.Session.get') as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.content = body
+            mock_get.return_value.headers = {'Content-Type': 'application/json'}
+            mock_get.return_value.json.return_value = {
+                'people': [{'stats': [{
+                    'group': {'displayName': 'hitting'}, 'splits': [{'month': 5}],
+                }]}]
+            }
+            Client().get('/api/players/1/splits/?season=2024')
+
+        with self._replay('replay'), patch('requests.Session.get') as mock_get:
+            data = Client().get('/api/players/1/splits/?season=2024').json()
+            mock_get.assert_not_called()
+
+        self.assertEqual(data['monthly']['batting'], [{'month': 5}])
+        self.assertNotIn('unavailable', data)
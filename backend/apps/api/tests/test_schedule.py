@@ -1,5 +1,11 @@
+from datetime import date
 from unittest.mock import patch
-from django.test import TestCase, Client
+
+from django.core.cache import cache
+from django.test import TestCase, Client, override_settings
+
+from apps.api import team_logos
+from apps.api.models import TeamIdInfo
 
 
 class ScheduleApiTests(TestCase):
@@ -20,12 +26,93 @@ class ScheduleApiTests(TestCase):
                 ]
             }
         ]
-        mock_client.fetch_team_spot_url.return_value = 'logo-url'
-
         response = self.client.get('/api/schedule/', {'date': '2025-08-18'})
         self.assertEqual(response.status_code, 200)
         data = response.json()
         self.assertEqual(len(data), 1)
         game = data[0]['games'][0]
-        self.assertEqual(game['teams']['home']['team']['logo_url'], 'logo-url')
-        self.assertEqual(game['teams']['away']['team']['logo_url'], 'logo-url')
+        self.assertEqual(
+            game['teams']['home']['team']['logo_url'],
+            'https://midfield.mlbstatic.com/v1/team/2/spots/32',
+        )
+        self.assertEqual(
+            game['teams']['away']['team']['logo_url'],
+            'https://midfield.mlbstatic.com/v1/team/1/spots/32',
+        )
+        mock_client.fetch_team_spot_url.assert_not_called()
+
+
+def _day(day, *states):
+    return {
+        'date': day,
+        'games': [{'status': {'abstractGameState': state}} for state in states],
+    }
+
+
+@override_settings(SCHEDULE_DAY_CACHE={'ENABLED': True, 'MAX_DAYS': 7})
+@patch('apps.api.schedule_days.schedule_today', return_value=date(2025, 8, 18))
+class ScheduleRangeApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_range_fetches_only_missing_days(self, mock_client_cls, _today):
+        fetch = mock_client_cls.return_value.fetch_schedule_for_date_range
+        fetch.return_value = [
+            _day('2025-08-16', 'Final', 'Final'),
+            _day('2025-08-18', 'Live'),
+        ]
+        params = {'start_date': '2025-08-16', 'end_date': '2025-08-18'}
+
+        data = self.client.get('/api/schedule/', params).json()
+        self.assertEqual([day['date'] for day in data], ['2025-08-16', '2025-08-18'])
+        fetch.assert_called_once_with(date(2025, 8, 16), date(2025, 8, 18))
+
+        # Final and game-less past days stay cached; only today is refetched.
+        cache.delete('schedule-day:2025-08-18')
+        fetch.reset_mock()
+        fetch.return_value = [_day('2025-08-18', 'Final')]
+        data = self.client.get('/api/schedule/', params).json()
+        fetch.assert_called_once_with(date(2025, 8, 18), date(2025, 8, 18))
+        self.assertEqual(data[1]['games'][0]['status']['abstractGameState'], 'Final')
+
+    def test_day_ttls(self, _today):
+        from apps.api.schedule_days import DEFAULT_DAY_CACHE_OPTIONS as options, day_ttl
+
+        today = date(2025, 8, 18)
+        self.assertEqual(day_ttl(date(2025, 8, 17), _day('', 'Final'), options, today),
+                         options['FINAL_TTL'])
+        self.assertEqual(day_ttl(date(2025, 8, 17), _day('', 'Final', 'Live'), options, today),
+                         options['PAST_TTL'])
+        self.assertEqual(day_ttl(today, _day('', 'Final'), options, today), options['TODAY_TTL'])
+        self.assertEqual(day_ttl(date(2025, 8, 19), {}, options, today), options['FUTURE_TTL'])
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_invalid_ranges(self, mock_client_cls, _today):
+        for params in (
+            {},
+            {'start_date': '2025-08-18', 'end_date': '2025-08-17'},
+            {'start_date': '2025-08-01', 'end_date': '2025-08-18'},
+            {'start_date': 'yesterday'},
+        ):
+            response = self.client.get('/api/schedule/', params)
+            self.assertEqual(response.status_code, 400, params)
+
+
+class TeamLogoMapTests(TestCase):
+    def setUp(self):
+        team_logos.reset()
+        self.addCleanup(team_logos.reset)
+
+    @override_settings(TEAM_LOGO_URL_TEMPLATE='https://logos.test/{team_id}-{size}.svg')
+    def test_logo_map_is_built_once_per_size(self):
+        TeamIdInfo.objects.create(mlbam_team_id=147, full_name='New York Yankees')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(team_logos.logo_urls(32), {147: 'https://logos.test/147-32.svg'})
+            self.assertEqual(team_logos.team_logo_url(147), 'https://logos.test/147-32.svg')
+            # Teams missing from team_id_infos are added on first use.
+            self.assertEqual(team_logos.team_logo_url(159), 'https://logos.test/159-32.svg')
+            self.assertIsNone(team_logos.team_logo_url(None))
+        with self.assertNumQueries(1):
+            self.assertEqual(team_logos.team_logo_url(147, 64), 'https://logos.test/147-64.svg')
@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.api.models import PlayerIdInfo, TeamIdInfo
+from apps.api.name_index import fill_normalized_names
+from apps.api.search import name_search, player_prefix_search
+
+
+class NameSearchTests(TestCase):
+    def setUp(self):
+        PlayerIdInfo.objects.create(name_first='Aaron', name_last='Judge')
+        PlayerIdInfo.objects.create(name_first='Judge', name_last='Jones')
+        PlayerIdInfo.objects.create(name_first='Mike', name_last='Trout')
+        TeamIdInfo.objects.create(full_name='New York Yankees', mlbam_team_id=147)
+        TeamIdInfo.objects.create(full_name='New York Mets', mlbam_team_id=121)
+
+    def _names(self, query):
+        return sorted(
+            name_search(PlayerIdInfo.objects, 'name_full', query)
+            .values_list('name_full', flat=True)
+        )
+
+    def test_substring_matches_like_icontains(self):
+        self.assertEqual(self._names('udg'), ['Aaron Judge', 'Judge Jones'])
+        self.assertEqual(self._names('MIKE T'), ['Mike Trout'])
+        self.assertEqual(self._names('tr'), ['Mike Trout'])
+        self.assertEqual(self._names('"x'), [])
+
+    def test_uses_the_fts_table_on_sqlite(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite only')
+        with CaptureQueriesContext(connection) as queries:
+            self._names('judge')
+        self.assertIn('player_id_infos_fts', queries[0]['sql'])
+
+    def test_index_follows_updates_and_deletes(self):
+        PlayerIdInfo.objects.filter(name_last='Trout').update(name_last='Fish')
+        self.assertEqual(self._names('trout'), [])
+        self.assertEqual(self._names('fish'), ['Mike Fish'])
+        PlayerIdInfo.objects.filter(name_last='Fish').delete()
+        self.assertEqual(self._names('fish'), [])
+
+    def test_team_search_endpoint(self):
+        data = self.client.get('/api/teams/', {'q': 'york'}, HTTP_HOST='localhost').json()
+        self.assertEqual(
+            [team['full_name'] for team in data], ['New York Mets', 'New York Yankees']
+        )
+
+
+class PlayerPrefixSearchTests(TestCase):
+    def _names(self, query):
+        return sorted(
+            player_prefix_search(PlayerIdInfo.objects, query)
+            .values_list('name_full', flat=True)
+        )
+
+    def test_accent_and_punctuation_insensitive(self):
+        PlayerIdInfo.objects.create(name_first='Ronald', name_last='Acuña')
+        PlayerIdInfo.objects.create(name_first='J.D.', name_last='Martinez')
+
+        self.assertEqual(self._names('Acuna'), ['Ronald Acuña'])
+        self.assertEqual(self._names('ronald ACU'), ['Ronald Acuña'])
+        self.assertEqual(self._names('jd martinez'), ['J.D. Martinez'])
+        self.assertEqual(self._names('J. D.'), ['J.D. Martinez'])
+        self.assertEqual(self._names('cuna'), [])
+        self.assertEqual(self._names('...'), [])
+
+    def test_player_search_endpoint_without_name_index(self):
+        PlayerIdInfo.objects.create(key_mlbam='1', name_first='Ronald', name_last='Acuña')
+        with patch('apps.api.views.players.http_client.get') as mock_get:
+            mock_get.return_value.ok = False
+            data = self.client.get('/api/players/', {'q': 'acuna'}, HTTP_HOST='localhost').json()
+        self.assertEqual([p['key_mlbam'] for p in data], ['1'])
+
+    def test_fill_normalized_names_after_bulk_load(self):
+        PlayerIdInfo.objects.bulk_create([
+            PlayerIdInfo(name_first='José', name_last='Ramírez'),
+            PlayerIdInfo(name_first='Ichiro', name_last=None),
+        ])
+        self.assertEqual(self._names('jose'), [])
+
+        self.assertEqual(fill_normalized_names(), 2)
+        self.assertEqual(self._names('ramirez'), ['José Ramírez'])
+        self.assertEqual(
+            PlayerIdInfo.objects.get(name_first='Ichiro').name_normalized, 'ichiro'
+        )
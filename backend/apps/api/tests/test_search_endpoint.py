@@ -0,0 +1,72 @@
+from django.test import Client, TestCase
+
+from apps.api.models import PlayerIdInfo, TeamIdInfo, Venue
+
+
+class CombinedSearchApiTests(TestCase):
+    def setUp(self):
+        self.client = Client(HTTP_HOST='localhost')
+        PlayerIdInfo.objects.create(key_mlbam='1', name_first='Newt', name_last='Allen')
+        PlayerIdInfo.objects.create(key_mlbam='2', name_first='Don', name_last='Newcombe')
+        TeamIdInfo.objects.create(full_name='New York Yankees', mlbam_team_id=147)
+        TeamIdInfo.objects.create(full_name='New York Mets', mlbam_team_id=121)
+        TeamIdInfo.objects.create(full_name='Boston Red Sox', mlbam_team_id=111)
+        Venue.objects.create(mlbam_id=3313, name='Yankee Stadium', season=2023)
+        Venue.objects.create(mlbam_id=3313, name='Yankee Stadium', season=2024)
+        Venue.objects.create(mlbam_id=3289, name='Citi Field', season=2024)
+
+    def test_groups_results_by_type(self):
+        data = self.client.get('/api/search/', {'q': 'new'}).json()
+
+        self.assertEqual(
+            [p['name_full'] for p in data['players']['results']],
+            ['Newt Allen', 'Don Newcombe'],
+        )
+        self.assertEqual(
+            [t['full_name'] for t in data['teams']['results']],
+            ['New York Mets', 'New York Yankees'],
+        )
+        self.assertEqual(data['venues'], {'results': [], 'next': None})
+
+    def test_types_and_venue_deduplication(self):
+        data = self.client.get('/api/search/', {'q': 'yankee', 'types': 'venues'}).json()
+        self.assertEqual(list(data), ['venues'])
+        self.assertEqual(data['venues']['results'], [{'mlbam_id': 3313, 'name': 'Yankee Stadium'}])
+
+        response = self.client.get('/api/search/', {'q': 'x', 'types': 'umpires'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_renamed_venues_show_their_latest_name(self):
+        Venue.objects.create(mlbam_id=5, name='Jacobs Field', season=2007)
+        Venue.objects.create(mlbam_id=5, name='Progressive Field', season=2008)
+        Venue.objects.create(mlbam_id=6, name='Field of Dreams', season=2021)
+
+        data = self.client.get('/api/search/', {'q': 'field', 'types': 'venues'}).json()
+        self.assertEqual(
+            data['venues']['results'],
+            [
+                {'mlbam_id': 6, 'name': 'Field of Dreams'},
+                {'mlbam_id': 3289, 'name': 'Citi Field'},
+                {'mlbam_id': 5, 'name': 'Progressive Field'},
+            ],
+        )
+
+    def test_cursor_pages_through_one_type(self):
+        first = self.client.get('/api/search/', {'q': 'new york', 'limit': 1}).json()
+        self.assertEqual(first['teams']['results'][0]['full_name'], 'New York Mets')
+        self.assertIsNone(first['players']['next'])
+
+        second = self.client.get(
+            '/api/search/', {'q': 'new york', 'limit': 1, 'cursor': first['teams']['next']}
+        ).json()
+        self.assertEqual(list(second), ['teams'])
+        self.assertEqual(second['teams']['results'][0]['full_name'], 'New York Yankees')
+        self.assertIsNone(second['teams']['next'])
+
+    def test_rejects_cursor_for_another_query(self):
+        first = self.client.get('/api/search/', {'q': 'new york', 'limit': 1}).json()
+        response = self.client.get(
+            '/api/search/', {'q': 'boston', 'cursor': first['teams']['next']}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.get('/api/search/', {'q': 'a', 'cursor': '!!'}).status_code, 400)
@@ -0,0 +1,175 @@
+from datetime import date, datetime, timezone as dt_timezone
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import Client, TestCase
+
+from apps.api import season_schedule
+from apps.api.models import ScheduledGame
+from apps.api.season_schedule import get_schedule, recent_schedule, store_days
+
+
+def _game(game_pk, game_date, home, away, state='Final', hour=23):
+    return {
+        'gamePk': game_pk,
+        'gameDate': f'{game_date}T{hour:02d}:05:00Z',
+        'season': game_date[:4],
+        'status': {'abstractGameState': state, 'detailedState': state},
+        'teams': {
+            'home': {'team': {'id': home}, 'score': 3},
+            'away': {'team': {'id': away}, 'score': 2},
+        },
+        'venue': {'id': 3313},
+    }
+
+
+def _days(*games):
+    days = {}
+    for game in games:
+        days.setdefault(game['gameDate'][:10], []).append(game)
+    return [{'date': day, 'games': day_games} for day, day_games in days.items()]
+
+
+def _response(payload):
+    response = MagicMock()
+    response.json.return_value = payload
+    return response
+
+
+# Noon in New York on 2025-08-18.
+NOW = datetime(2025, 8, 18, 16, 0, tzinfo=dt_timezone.utc)
+
+
+@patch('apps.api.season_schedule.timezone.now', return_value=NOW)
+@patch('apps.api.schedule_days.schedule_today', return_value=date(2025, 8, 18))
+@patch('apps.api.season_schedule.schedule_today', return_value=date(2025, 8, 18))
+class SeasonScheduleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        store_days(_days(
+            _game(1, '2025-08-16', 147, 111),
+            _game(2, '2025-08-17', 111, 147),
+            _game(3, '2025-08-18', 147, 121, state='Preview'),
+            _game(4, '2025-08-19', 121, 147, state='Preview'),
+            _game(5, '2025-08-17', 121, 110),
+        ), date(2025, 1, 1), date(2025, 12, 31))
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_stored_days_need_no_upstream_call(self, mock_client_cls, *_):
+        response = Client().get(
+            '/api/schedule/', {'start_date': '2025-08-16', 'end_date': '2025-08-19'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([day['date'] for day in data],
+                         ['2025-08-16', '2025-08-17', '2025-08-18', '2025-08-19'])
+        self.assertEqual([game['gamePk'] for game in data[1]['games']], [2, 5])
+        self.assertEqual(data[1]['totalGames'], 2)
+        self.assertEqual(
+            data[0]['games'][0]['teams']['home']['team']['logo_url'],
+            'https://midfield.mlbstatic.com/v1/team/147/spots/32',
+        )
+        mock_client_cls.return_value.fetch_schedule_for_date_range.assert_not_called()
+
+    def test_started_games_are_fetched_upstream(self, *_):
+        ScheduledGame.objects.filter(game_pk=3).update(
+            game_datetime=datetime(2025, 8, 18, 15, 0, tzinfo=dt_timezone.utc)
+        )
+        client = MagicMock()
+        client.fetch_schedule_for_date_range.return_value = _days(
+            _game(3, '2025-08-18', 147, 121, state='Live')
+        )
+
+        days = get_schedule(client, date(2025, 8, 17), date(2025, 8, 18))
+
+        client.fetch_schedule_for_date_range.assert_called_once_with(
+            date(2025, 8, 18), date(2025, 8, 18)
+        )
+        self.assertEqual(days[1]['games'][0]['status']['abstractGameState'], 'Live')
+        self.assertEqual(len(days[0]['games']), 2)
+
+    def test_unloaded_seasons_fall_back_to_upstream(self, *_):
+        client = MagicMock()
+        client.fetch_schedule_for_date_range.return_value = []
+
+        self.assertEqual(get_schedule(client, date(2024, 8, 17), date(2024, 8, 18)), [])
+        client.fetch_schedule_for_date_range.assert_called_once()
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_team_recent_schedule_is_served_locally(self, mock_client_cls, *_):
+        response = Client().get('/api/teams/147/recent_schedule/')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['id'], 147)
+        self.assertEqual(
+            [game['gamePk'] for day in data['previousGameSchedule']['dates'] for game in day['games']],
+            [1, 2],
+        )
+        self.assertEqual(
+            [day['date'] for day in data['nextGameSchedule']['dates']],
+            ['2025-08-18', '2025-08-19'],
+        )
+        mock_client_cls.return_value.fetch_recent_schedule_for_team.assert_not_called()
+
+    def test_recent_schedule_defers_to_upstream_while_a_game_may_be_live(self, *_):
+        ScheduledGame.objects.filter(game_pk=3).update(status='Live')
+
+        self.assertIsNone(recent_schedule(147))
+        self.assertIsNotNone(recent_schedule(110))
+
+    @patch('apps.api.views.UnifiedDataClient')
+    def test_prediction_reads_teams_from_the_store(self, mock_client_cls, *_):
+        mock_client = mock_client_cls.return_value
+        mock_client.fetch_standings_data.return_value = [{'teamRecords': [
+            {'team': {'id': 147}, 'winningPercentage': '.600'},
+            {'team': {'id': 121}, 'winningPercentage': '.400'},
+        ]}]
+
+        response = Client().get('/api/games/3/prediction/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertAlmostEqual(response.json()['home'], 0.6)
+        mock_client.fetch_game_live_feed.assert_not_called()
+
+
+class LoadSeasonScheduleCommandTests(TestCase):
+    @patch('apps.api.season_schedule.http_client.get')
+    def test_load_replaces_moved_games(self, mock_get):
+        ScheduledGame.objects.create(
+            game_pk=9, game_date=date(2024, 5, 1), season=2024, payload={},
+            updated_at=datetime(2024, 1, 1, tzinfo=dt_timezone.utc),
+        )
+        mock_get.return_value = _response({'dates': _days(
+            _game(9, '2024-05-02', 147, 111), _game(10, '2024-05-02', 121, 110),
+        )})
+
+        call_command('load_season_schedule', season=[2024], stdout=StringIO())
+
+        mock_get.assert_called_once_with(
+            season_schedule.SCHEDULE_URL, params={'sportId': 1, 'season': 2024},
+            name='season_schedule',
+        )
+        self.assertEqual(
+            list(ScheduledGame.objects.order_by('game_pk').values_list(
+                'game_pk', 'game_date', 'home_team_id', 'status', 'home_score'
+            )),
+            [(9, date(2024, 5, 2), 147, 'Final', 3), (10, date(2024, 5, 2), 121, 'Final', 3)],
+        )
+
+    @patch('apps.api.season_schedule.http_client.get')
+    @patch('apps.api.management.commands.load_season_schedule.schedule_today',
+           return_value=date(2025, 8, 18))
+    def test_recent_refreshes_dates_around_today(self, _today, mock_get):
+        mock_get.return_value = _response({'dates': []})
+
+        call_command('load_season_schedule', '--recent', '--days-ahead=2', stdout=StringIO())
+
+        mock_get.assert_called_once_with(
+            season_schedule.SCHEDULE_URL,
+            params={'sportId': 1, 'startDate': '2025-08-17', 'endDate': '2025-08-20'},
+            name='season_schedule',
+        )
@@ -0,0 +1,74 @@
+import threading
+import time
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from apps.api.singleflight import SingleFlight
+
+
+class SingleFlightTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _run_concurrently(self, flight, key, fn, count=8, check=None):
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do(key, fn, check=check)))
+            for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_callers_share_one_fetch(self):
+        flight = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return {'standings': []}
+
+        results = self._run_concurrently(flight, 'standings:2025', fetch)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(r == {'standings': []} for r in results))
+        self.assertFalse(flight.in_flight('standings:2025'))
+
+    def test_errors_propagate_to_waiters(self):
+        flight = SingleFlight()
+
+        def fetch():
+            time.sleep(0.05)
+            raise RuntimeError('upstream down')
+
+        errors = []
+
+        def call():
+            try:
+                flight.do('k', fetch)
+            except RuntimeError as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(errors), 4)
+
+    @override_settings(UPSTREAM_SINGLE_FLIGHT_DISTRIBUTED=True)
+    def test_distributed_lock_waits_for_other_worker(self):
+        flight = SingleFlight()
+        cache.add('singleflight:k', 1, 30)  # held by another worker
+
+        def publish():
+            time.sleep(0.1)
+            cache.set('value:k', 'from-other-worker')
+
+        threading.Thread(target=publish).start()
+        result = flight.do('k', lambda: 'fetched', check=lambda: cache.get('value:k'))
+        self.assertEqual(result, 'from-other-worker')
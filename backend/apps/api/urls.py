@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 
 from .views import (
@@ -12,6 +13,7 @@ from .views.players import (
     player_info,
     player_stats,
     player_career_stats_batch,
+    player_id_translate,
     player_splits,
     player_gamelog,
     player_headshot,
@@ -32,11 +34,29 @@ from .views.teams import (
 from .views.halloffame import (
     hall_of_fame_players
 )
+from .views.monitoring import metrics, upstream_health
+from .views.search import search
+
+if getattr(settings, 'API_ASYNC_VIEWS', False):
+    # Serve the upstream-bound endpoints from coroutine views (run under ASGI).
+    from .views.async_views import (  # noqa: F811
+        schedule,
+        game_data,
+        player_info,
+        player_stats,
+        player_splits,
+        player_gamelog,
+        team_record,
+        team_roster,
+    )
 
 urlpatterns = [
     path('endpoints/', list_api_endpoints, name='api-endpoints'),
+    path('health/upstreams/', upstream_health, name='api-upstream-health'),
+    path('metrics/', metrics, name='api-metrics'),
     path('unified/methods/', unified_client_methods, name='api-unified-methods'),
     path('unified/<str:method_name>/', unified_client_call, name='api-unified-call'),
+    path('search/', search, name='api-search'),
     path('schedule/', schedule, name='api-schedule'),
     path('games/<int:game_pk>/', game_data, name='api-game-data'),
     path('games/<int:game_pk>/prediction/', predict_game, name='api-game-prediction'),
@@ -46,6 +66,7 @@ urlpatterns = [
     path('players/<int:player_id>/', player_info, name='api-player-info'),
     path('players/<int:player_id>/stats/', player_stats, name='api-player-stats'),
     path('players/career_stats/', player_career_stats_batch, name='api-player-career-stats'),
+    path('players/ids/', player_id_translate, name='api-player-ids'),
     path('players/<int:player_id>/splits/', player_splits, name='api-player-splits'),
     path('players/<int:player_id>/gamelog/', player_gamelog, name='api-player-gamelog'),
     path('players/<int:player_id>/statcast/batter/', player_statcast_batter_data, name='api-player-statcast-batter'),
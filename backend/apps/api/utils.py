@@ -1,36 +1,166 @@
 """Utility helpers for API views."""
 
+import asyncio
+import contextvars
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import wraps
+from django.conf import settings
+from django.db import connections
 from django.http import JsonResponse
 
+from .caching import wrap_client
+from .client_pool import client_registry
+from .replay import client_class
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_ASYNC_THREADS = 64
+
+_upstream_executor = None
+_upstream_executor_lock = threading.Lock()
+
+
+class FailedResponse(Exception):
+    """Raised inside :func:`pooled_client` to report a 5xx view response."""
+
+    def __init__(self, response):
+        super().__init__(getattr(response, "status_code", None))
+        self.response = response
+
+
+@contextmanager
+def pooled_client(client_cls, request=None):
+    """Borrow this thread's pooled ``client_cls`` instance, wrapped for caching.
+
+    Leaving the block with an exception counts as a failure of the instance
+    and a client that keeps failing is rebuilt (see
+    :meth:`~apps.api.client_pool.ClientRegistry.report_failure`); leaving it
+    normally resets the failure count.  In record or replay mode
+    ``client_cls`` is swapped for its :mod:`~apps.api.replay` stand-in.
+    """
+    client_cls = client_class(client_cls)
+    raw = client_registry.get(client_cls)
+    try:
+        yield wrap_client(raw, request, client_cls)
+    except Exception:
+        client_registry.report_failure(raw)
+        raise
+    client_registry.report_success(raw)
+
 
 def require_unified_client(view_func):
     """Ensure ``UnifiedDataClient`` is available and provide an instance.
 
     The decorated view must accept a ``client`` positional argument which will
-    be an instance of ``UnifiedDataClient``. If the client library is missing or
-    the client fails to instantiate, a standardized JSON error response is
-    returned.
+    be an instance of ``UnifiedDataClient``. Instances come from
+    :func:`pooled_client`, so connections and client-side caches are reused
+    across requests and cacheable calls are served from ``django.core.cache``.
+    Views report upstream errors as 5xx responses, which count as failures of
+    the pooled client. If the client library is missing or the client fails to
+    instantiate, a standardized JSON error response is returned.
     """
 
     @wraps(view_func)
     def _wrapped(request, *args, **kwargs):
         from . import views as api_views  # Local import to avoid circular deps
 
-        client_cls = getattr(api_views, "UnifiedDataClient", None)
+        client_cls = client_class(getattr(api_views, "UnifiedDataClient", None))
         if client_cls is None:
             return JsonResponse(
                 {"error": "baseball-data-lab library is not installed"}, status=500
             )
         try:
-            client = client_cls()
+            client_registry.get(client_cls)
         except Exception as exc:  # pragma: no cover - defensive
             logger.error("Failed to instantiate UnifiedDataClient: %s", exc)
             return JsonResponse({"error": str(exc)}, status=500)
-        return view_func(request, client, *args, **kwargs)
+        try:
+            with pooled_client(client_cls, request) as client:
+                response = view_func(request, client, *args, **kwargs)
+                if getattr(response, "status_code", 200) >= 500:
+                    raise FailedResponse(response)
+        except FailedResponse as failed:
+            return failed.response
+        return response
 
     return _wrapped
 
+
+def _get_upstream_executor():
+    global _upstream_executor
+    if _upstream_executor is None:
+        with _upstream_executor_lock:
+            if _upstream_executor is None:
+                workers = getattr(settings, "UPSTREAM_ASYNC_THREADS", DEFAULT_ASYNC_THREADS)
+                _upstream_executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="upstream-async"
+                )
+    return _upstream_executor
+
+
+async def run_upstream(fn, *args):
+    """Run the blocking callable ``fn(*args)`` on the upstream thread pool."""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(_get_upstream_executor(), context.run, fn, *args)
+
+
+class AsyncUnifiedClient:
+    """Awaitable facade over the pooled ``UnifiedDataClient``.
+
+    The client library is synchronous, so every call runs on the upstream
+    thread pool against that thread's own :func:`pooled_client`; the event
+    loop only waits on the result.  ``await client.fetch_player_info(1)``
+    performs one call and ``await client.run(fn)`` runs ``fn(client)`` with
+    several calls on a single thread.  ``fn`` may also query the database;
+    the thread's connections are closed afterwards, as in
+    :func:`~apps.api.fanout.fan_out`.
+    """
+
+    def __init__(self, client_cls, request=None):
+        self._client_cls = client_cls
+        self._request = request
+
+    def _run_sync(self, fn):
+        try:
+            with pooled_client(self._client_cls, self._request) as client:
+                return fn(client)
+        finally:
+            connections.close_all()
+
+    async def run(self, fn):
+        return await run_upstream(self._run_sync, fn)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        async def _call(*args, **kwargs):
+            return await self.run(lambda client: getattr(client, name)(*args, **kwargs))
+
+        return _call
+
+
+def require_unified_client_async(view_func):
+    """Async counterpart of :func:`require_unified_client`.
+
+    The decorated coroutine receives an :class:`AsyncUnifiedClient` as its
+    ``client`` argument.
+    """
+
+    @wraps(view_func)
+    async def _wrapped(request, *args, **kwargs):
+        from . import views as api_views  # Local import to avoid circular deps
+
+        client_cls = client_class(getattr(api_views, "UnifiedDataClient", None))
+        if client_cls is None:
+            return JsonResponse(
+                {"error": "baseball-data-lab library is not installed"}, status=500
+            )
+        client = AsyncUnifiedClient(client_cls, request)
+        return await view_func(request, client, *args, **kwargs)
+
+    return _wrapped
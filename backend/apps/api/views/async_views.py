@@ -0,0 +1,222 @@
+"""Async variants of the upstream-bound API views.
+
+These coroutine views replace their synchronous counterparts in
+``apps.api.urls`` when ``API_ASYNC_VIEWS`` is enabled.  Run the project under
+an ASGI server (``uvicorn baseball_data_lab_web.asgi:application``) so a
+single worker process can keep many upstream requests in flight: direct
+statsapi requests go through :func:`apps.api.http_client.async_get` and
+``UnifiedDataClient`` calls are awaited on the upstream thread pool (see
+:class:`apps.api.utils.AsyncUnifiedClient`).  Responses match the
+synchronous views.
+"""
+
+import asyncio
+from datetime import datetime
+import logging
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+from rest_framework.utils.encoders import JSONEncoder
+
+from .. import http_client
+from ..player_ids import aresolve_mlbam_id
+from ..ranking import record_view
+from ..request_state import current_state, deadline_expired
+from ..schedule_days import parse_schedule_range
+from ..season_schedule import get_schedule
+from ..team_logos import attach_game_logos, attach_schedule_logos
+from ..utils import require_unified_client_async
+from .players import (
+    SPLITS_TIMEOUTS,
+    _monthly_splits_url,
+    _parse_monthly_splits,
+    _player_info_payload,
+    _replace_non_finite,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _json(data, status=200):
+    return JsonResponse(data, status=status, safe=False, encoder=JSONEncoder)
+
+
+def _season_param(request):
+    season_param = request.GET.get('season')
+    try:
+        return int(season_param) if season_param else datetime.now().year
+    except (TypeError, ValueError):
+        return datetime.now().year
+
+
+async def _fetch_monthly_splits(key_mlbam, season):
+    monthly_url = _monthly_splits_url(key_mlbam, season)
+    logger.info("Fetching monthly splits, url=%s", monthly_url)
+    resp = await http_client.async_get(monthly_url, name="player_splits_monthly")
+    return _parse_monthly_splits(resp.json())
+
+
+@require_GET
+@require_unified_client_async
+async def schedule(request, client):
+    """Return schedule data for a date or a ``start_date``..``end_date`` range."""
+    try:
+        start, end = parse_schedule_range(request.GET)
+    except ValueError as exc:
+        return _json({'error': str(exc)}, status=400)
+    try:
+        schedule_data = await client.run(lambda c: get_schedule(c, start, end))
+        await sync_to_async(attach_schedule_logos)(schedule_data)
+        return _json(schedule_data)
+    except Exception as exc:  # pragma: no cover - defensive
+        return _json({'error': str(exc)}, status=500)
+
+
+@require_GET
+@require_unified_client_async
+async def game_data(request, client, game_pk: int):
+    """Return detailed data for a single game."""
+    try:
+        data = await client.fetch_game_live_feed(game_pk)
+        logger.info("Fetched game data for game_pk=%s", game_pk)
+        await sync_to_async(attach_game_logos)(data)
+        return _json(data)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.error("Error fetching game data for game_pk=%s: %s", game_pk, exc)
+        return _json({'error': str(exc)}, status=500)
+
+
+@require_GET
+@require_unified_client_async
+async def player_info(request, client, player_id: int):
+    """Return basic information about a player."""
+    record_view(player_id)
+    try:
+        info = await client.fetch_player_info(int(player_id))
+        return _json(_player_info_payload(info))
+    except Exception as exc:  # pragma: no cover - defensive
+        return _json({'error': str(exc)}, status=500)
+
+
+@require_GET
+@require_unified_client_async
+async def player_stats(request, client, player_id: int):
+    """Return career statistics for a player."""
+    key_mlbam = await aresolve_mlbam_id(player_id)
+    try:
+        data = await client.fetch_player_stats_career(int(key_mlbam))
+        return _json(data)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.error(
+            "Error fetching career stats for player_id=%s, key_mlbam=%s: %s",
+            player_id,
+            key_mlbam,
+            exc,
+        )
+        return _json({'error': str(exc)}, status=500)
+
+
+@require_GET
+@require_unified_client_async
+async def player_splits(request, client, player_id: int):
+    """Return batting and pitching splits for a player.
+
+    Branches are awaited concurrently with the per-branch timeouts of the
+    synchronous view and degrade the same way.
+    """
+    season = _season_param(request)
+    key_mlbam = await aresolve_mlbam_id(player_id)
+    branches = {
+        "batting": client.fetch_batting_splits(int(key_mlbam), season),
+        "pitching": client.fetch_pitching_splits(int(key_mlbam), season),
+        "monthly": _fetch_monthly_splits(key_mlbam, season),
+    }
+    deadline_left = current_state().remaining()
+    outcomes = await asyncio.gather(
+        *(
+            asyncio.wait_for(
+                coro,
+                SPLITS_TIMEOUTS[name] if deadline_left is None
+                else min(SPLITS_TIMEOUTS[name], deadline_left),
+            )
+            for name, coro in branches.items()
+        ),
+        return_exceptions=True,
+    )
+
+    results, errors = {}, {}
+    for name, outcome in zip(branches, outcomes):
+        if isinstance(outcome, asyncio.TimeoutError):
+            logger.warning("Upstream branch %s timed out", name)
+            deadline_expired()
+            errors[name] = TimeoutError(f"{name} timed out")
+        elif isinstance(outcome, Exception):
+            logger.error("Upstream branch %s failed: %s", name, outcome)
+            errors[name] = outcome
+        else:
+            results[name] = outcome
+
+    if "batting" in errors and "pitching" in errors:
+        logger.error(
+            "Error fetching splits for player_id=%s, key_mlbam=%s: %s",
+            player_id,
+            key_mlbam,
+            errors["batting"],
+        )
+        return _json({"error": str(errors["batting"])}, status=500)
+
+    monthly_bat, monthly_pit = results.get("monthly") or ([], [])
+    data = {
+        "batting": results.get("batting"),
+        "pitching": results.get("pitching"),
+        "monthly": {"batting": monthly_bat, "pitching": monthly_pit},
+    }
+    if errors:
+        data["unavailable"] = sorted(errors)
+    return _json(_replace_non_finite(data))
+
+
+@require_GET
+@require_unified_client_async
+async def player_gamelog(request, client, player_id: int):
+    """Return game log data for a player."""
+    stat_type = request.GET.get('stat_type', 'hitting')
+    season = _season_param(request)
+    key_mlbam = await aresolve_mlbam_id(player_id)
+    try:
+        data = await client.fetch_player_gamelog(int(key_mlbam), stat_type, season)
+        return _json(data)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.error(
+            "Error fetching game log for player_id=%s, key_mlbam=%s: %s",
+            player_id,
+            key_mlbam,
+            exc,
+        )
+        return _json({'error': str(exc)}, status=500)
+
+
+@require_GET
+@require_unified_client_async
+async def team_record(request, client, team_id: int):
+    """Return a team's record for a given season."""
+    season = datetime.now().year
+    try:
+        record = await client.fetch_team_record_for_season(season, int(team_id))
+        return _json(record)
+    except Exception as exc:  # pragma: no cover - defensive
+        return _json({'error': str(exc)}, status=500)
+
+
+@require_GET
+@require_unified_client_async
+async def team_roster(request, client, team_id: int):
+    """Return the current roster for a team."""
+    season = datetime.now().year
+    try:
+        roster = await client.fetch_active_roster(int(team_id), season)
+        return _json(roster)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.error("Unexpected error in team_roster: %s", exc)
+        return _json({'error': str(exc)}, status=500)
@@ -7,6 +7,7 @@ import pandas as pd
 
 from ..models import HallOfFameVote
 from ..models import PlayerIdInfo
+from ..request_state import DeadlineExceeded, current_state, deadline_expired
 from ..utils import require_unified_client
 
 PLAYER_INFO_CACHE_TIMEOUT = 60 * 60  # one hour
@@ -31,19 +32,22 @@ def hall_of_fame_players(request, client):  # noqa: F841 - hall_of_fame unused
     bbref_ids = [p['bbref_id'] for p in players if p['bbref_id']]
     info_map = {
         bbref: {
-            'mlbam_id': mlbam,
+            'mlbam_id': str(mlbam) if mlbam is not None else None,
             'name': name,
             'first_name': first,
             'last_name': last,
         }
         for bbref, mlbam, name, first, last in PlayerIdInfo.objects
         .filter(key_bbref__in=bbref_ids)
-        .values_list('key_bbref', 'key_mlbam', 'name_full', 'name_first', 'name_last')
+        .values_list('key_bbref', 'mlbam_id', 'name_full', 'name_first', 'name_last')
     }
 
     for p in players:
         info = info_map.get(p['bbref_id'])
-        if not info:
+        if not info and deadline_expired():
+            # Out of time: leave the remaining players unenriched.
+            info = {}
+        elif not info:
             # Fall back to a reverse lookup using the player's bbref ID.
             try:
                 df = client.playerid_reverse_lookup(p['bbref_id'], key_type='bbref')
@@ -86,14 +90,15 @@ def hall_of_fame_players(request, client):  # noqa: F841 - hall_of_fame unused
             missing_ids.append(mid)
 
     for mid in missing_ids:
+        if deadline_expired():
+            break
         position = None
         try:
-            mid_str = str(mid).strip()
-            if mid_str.endswith('.0'):
-                mid_str = mid_str[:-2]
-            data = client.fetch_player_info(int(mid_str)) or {}
+            data = client.fetch_player_info(int(mid)) or {}
             pos = data.get('primaryPosition') or {}
             position = pos.get('name')
+        except DeadlineExceeded:
+            break
         except Exception:  # pragma: no cover - defensive
             position = None
         positions[mid] = position
@@ -103,4 +108,7 @@ def hall_of_fame_players(request, client):  # noqa: F841 - hall_of_fame unused
         mlbam_id = p.get('mlbam_id')
         p['position'] = positions.get(mlbam_id)
 
-    return Response({'players': players})
+    body = {'players': players}
+    if current_state().partial:
+        body['partial'] = True
+    return Response(body)
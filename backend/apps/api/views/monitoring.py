@@ -0,0 +1,39 @@
+"""Monitoring endpoints for upstream health and metrics."""
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.types import OpenApiTypes
+
+from .. import metrics as api_metrics
+from ..circuit import STATE_CLOSED, breaker_states
+
+
+@extend_schema(responses=OpenApiTypes.OBJECT)
+@api_view(['GET'])
+def upstream_health(request):
+    """Return the state of every upstream circuit breaker.
+
+    Responds with ``503`` while any breaker is not closed so load balancers
+    and uptime checks can alert on it.
+    """
+    breakers = breaker_states()
+    healthy = all(b['state'] == STATE_CLOSED for b in breakers)
+    return Response(
+        {'healthy': healthy, 'breakers': breakers},
+        status=200 if healthy else 503,
+    )
+
+
+@require_GET
+def metrics(request):
+    """Return upstream, cache and request metrics in Prometheus text format."""
+    if not getattr(settings, 'API_METRICS_ENABLED', True):
+        raise Http404
+    return HttpResponse(
+        api_metrics.render(),
+        content_type='text/plain; version=0.0.4; charset=utf-8',
+    )
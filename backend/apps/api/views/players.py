@@ -2,20 +2,30 @@
 """Player-related API views."""
 
 from datetime import datetime
+from itertools import islice
+import json
 import logging
 import math
 import re
-import requests
 
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 from drf_spectacular.types import OpenApiTypes
 
+from .. import http_client
+from ..fanout import fan_out
 from ..models import PlayerIdInfo
+from ..name_index import search_player_ids
+from ..player_ids import resolve_mlbam_id, translate_ids
+from ..player_teams import current_teams
+from ..ranking import record_view
+from ..search import player_prefix_search
 from ..utils import require_unified_client
 from ..serializers import (
+    PlayerIdTranslateResponseSerializer,
+    PlayerIdTranslateSerializer,
     PlayerSearchQuerySerializer,
     PlayerSearchResultSerializer,
     PlayerInfoSerializer,
@@ -24,6 +34,9 @@ from ..serializers import (
 
 logger = logging.getLogger(__name__)
 
+# Per-branch timeouts (seconds) for the concurrent fetches in player_splits.
+SPLITS_TIMEOUTS = {"batting": 15, "pitching": 15, "monthly": 10}
+
 
 def _replace_non_finite(obj):
     """Recursively replace NaN and infinite floats with ``None``.
@@ -43,34 +56,33 @@ def _replace_non_finite(obj):
     return obj
 
 
-@extend_schema(
-    parameters=[PlayerSearchQuerySerializer],
-    responses=PlayerSearchResultSerializer(many=True),
-)
-@api_view(['GET'])
-def player_search(request):
-    """Search for players by name."""
-    query = request.GET.get('q', '').strip()
-    if not query:
-        return Response([])
+def player_search_results(query, limit, offset=0):
+    """Return ranked player search results for ``query``.
 
-    rows = (
-        PlayerIdInfo.objects
-        .filter(name_full__icontains=query)
-        .order_by('name_full')
-        .values('id', 'name_full', 'key_mlbam')[:10]
-    )
+    Served by the in-process name index when enabled, otherwise by an
+    indexed prefix search; current teams come from the database.
+    """
+    ids = search_player_ids(query, limit=offset + limit)
+    if ids is None:
+        rows = (
+            player_prefix_search(PlayerIdInfo.objects, query)
+            .values('id', 'name_full', 'mlbam_id')[offset:offset + limit]
+        )
+    else:
+        ids = ids[offset:]
+        by_id = {
+            row['id']: row
+            for row in PlayerIdInfo.objects
+            .filter(id__in=ids)
+            .values('id', 'name_full', 'mlbam_id')
+        }
+        rows = [by_id[pk] for pk in ids if pk in by_id]
 
-    # Gather MLBAM ids to fetch team data in a single API call
     mlbam_ids = []
     normalized_rows = []
     for row in rows:
-        key_mlbam = row.get('key_mlbam')
-        logger.info("Processing player: %s (MLBAM ID: %s)", row['name_full'], key_mlbam)
+        key_mlbam = str(row['mlbam_id']) if row['mlbam_id'] is not None else None
         if key_mlbam is not None:
-            key_mlbam = str(key_mlbam)
-            if key_mlbam.endswith('.0'):
-                key_mlbam = key_mlbam[:-2]
             mlbam_ids.append(key_mlbam)
         normalized_rows.append({
             "id": row['id'],
@@ -78,30 +90,9 @@ def player_search(request):
             "key_mlbam": key_mlbam,
         })
 
-    team_lookup = {}
-    if mlbam_ids:
-        logger.info("Fetching team data for MLBAM IDs: %s", mlbam_ids)
-        try:
-            resp = requests.get(
-                            "https://statsapi.mlb.com/api/v1/people",
-                            params={
-                                "personIds": ",".join(mlbam_ids),
-                                "hydrate": "currentTeam",
-                            },
-                            timeout=5,
-                        )
-            if resp.ok:
-                people = resp.json().get("people") or []
-                for person in people:
-                    pid = str(person.get("id"))
-                    team = (person.get("currentTeam") or {}).get("name")
-                    team_lookup[pid] = team
-                    logger.info("Found team for MLBAM ID %s: %s", pid, team)
-        except Exception:  # pragma: no cover - network failure
-            logger.exception("Error fetching team data for player search")
-            pass
-
-    
+    # Answered from the database; see apps.api.player_teams.
+    team_lookup = current_teams(mlbam_ids)
+
     results = []
     for row in normalized_rows:
         results.append({
@@ -110,8 +101,62 @@ def player_search(request):
             "key_mlbam": row["key_mlbam"],
             "team_name": team_lookup.get(row["key_mlbam"]),
         })
+    return results
+
+
+@extend_schema(
+    parameters=[PlayerSearchQuerySerializer],
+    responses=PlayerSearchResultSerializer(many=True),
+)
+@api_view(['GET'])
+def player_search(request):
+    """Search for players by name."""
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return Response([])
+
+    return Response(player_search_results(query, limit=10))
+
+
+# Translated ids written to the response per chunk of output.
+TRANSLATE_WRITE_SIZE = 500
+
+
+def _translation_chunks(values, key_type):
+    """Yield the JSON body of a translation response in pieces."""
+    yield f'{{"key_type": {json.dumps(key_type)}, "results": {{'
+    results = translate_ids(values, key_type)
+    separator = ''
+    while True:
+        batch = list(islice(results, TRANSLATE_WRITE_SIZE))
+        if not batch:
+            break
+        yield separator + ', '.join(
+            f'{json.dumps(value)}: {json.dumps(keys)}' for value, keys in batch
+        )
+        separator = ', '
+    yield '}}'
+
+
+@extend_schema(
+    request=PlayerIdTranslateSerializer,
+    responses=PlayerIdTranslateResponseSerializer,
+)
+@api_view(['POST'])
+def player_id_translate(request):
+    """Translate a batch of player ids of one key type to all known keys.
 
-    return Response(results)
+    Ids are looked up with chunked, indexed ``IN`` queries and the response
+    is streamed; unknown ids map to ``null``.
+    """
+    params = PlayerIdTranslateSerializer(data=request.data)
+    params.is_valid(raise_exception=True)
+    return StreamingHttpResponse(
+        _translation_chunks(
+            params.validated_data['ids'], params.validated_data['key_type']
+        ),
+        content_type='application/json',
+    )
 
 
 @extend_schema(responses={(200, 'image/png'): OpenApiTypes.BINARY})
@@ -120,23 +165,7 @@ def player_search(request):
 def player_headshot(request, client, player_id: int):
     """Return a player's headshot image."""
 
-    key_mlbam = (
-        PlayerIdInfo.objects.filter(id=player_id)
-        .values_list("key_mlbam", flat=True)
-        .first()
-    )
-    if key_mlbam is None:
-        key_mlbam = (
-            PlayerIdInfo.objects.filter(key_mlbam=str(player_id))
-            .values_list("key_mlbam", flat=True)
-            .first()
-        )
-        if key_mlbam is None:
-            key_mlbam = str(player_id)
-
-    key_mlbam = str(key_mlbam)
-    if key_mlbam.endswith('.0'):
-        key_mlbam = key_mlbam[:-2]
+    key_mlbam = resolve_mlbam_id(player_id)
 
     try:
         image_bytes = client.fetch_player_headshot(int(key_mlbam))
@@ -146,64 +175,70 @@ def player_headshot(request, client, player_id: int):
         return Response({'error': str(exc)}, status=500)
 
 
+def _player_info_payload(info):
+    """Flatten the ``fetch_player_info`` result into the player info payload."""
+    team = info.get("currentTeam", {}) or {}
+    pos = info.get("primaryPosition", {}) or {}
+    bat = info.get("batSide", {}) or {}
+    throw = info.get("pitchHand", {}) or {}
+
+    drafts = info.get("drafts") or []
+    draft = {}
+    if isinstance(drafts, list) and drafts:
+        first = drafts[0] or {}
+        if isinstance(first, dict):
+            draft = first
+
+    draft_team = draft.get("team") or {}
+    draft_data = {
+        "year": draft.get("year"),
+        "round": draft.get("pickRound"),
+        "pick": draft.get("roundPickNumber"),
+        "overall": draft.get("pickNumber"),
+        "team_id": draft_team.get("id"),
+        "team_name": draft_team.get("name"),
+        "school": draft.get("school"),
+    } if draft else None
+
+    birth_city = info.get("birthCity")
+    birth_state = info.get("birthStateProvince")
+    birth_country = info.get("birthCountry")
+    birth_place_parts = [
+        part
+        for part in [birth_city, birth_state, birth_country]
+        if part
+    ]
+    birth_place = ", ".join(birth_place_parts) if birth_place_parts else None
+    mlb_debut_date = info.get("mlbDebutDate")
+
+    data = {
+        "team_id": team.get("id"),
+        "team_name": team.get("name"),
+        "position": pos.get("name"),
+        "name": info.get("fullName"),
+        "full_name": info.get("fullFMLName"),
+        "birth_date": info.get("birthDate"),
+        "birth_place": birth_place,
+        "height": info.get("height"),
+        "weight": info.get("weight"),
+        "bat_side": bat.get("description"),
+        "throw_side": throw.get("description"),
+        "draft": draft_data,
+        "mlb_debut_date": mlb_debut_date,
+    }
+    return data
+
+
 @extend_schema(responses=PlayerInfoSerializer)
 @api_view(['GET'])
 @require_unified_client
 def player_info(request, client, player_id: int):
     """Return basic information about a player."""
 
+    record_view(player_id)
     try:
         info = client.fetch_player_info(int(player_id))
-        team = info.get("currentTeam", {}) or {}
-        pos = info.get("primaryPosition", {}) or {}
-        bat = info.get("batSide", {}) or {}
-        throw = info.get("pitchHand", {}) or {}
-
-        drafts = info.get("drafts") or []
-        draft = {}
-        if isinstance(drafts, list) and drafts:
-            first = drafts[0] or {}
-            if isinstance(first, dict):
-                draft = first
-
-        draft_team = draft.get("team") or {}
-        draft_data = {
-            "year": draft.get("year"),
-            "round": draft.get("pickRound"),
-            "pick": draft.get("roundPickNumber"),
-            "overall": draft.get("pickNumber"),
-            "team_id": draft_team.get("id"),
-            "team_name": draft_team.get("name"),
-            "school": draft.get("school"),
-        } if draft else None
-
-
-        birth_city = info.get("birthCity")
-        birth_state = info.get("birthStateProvince")
-        birth_country = info.get("birthCountry")
-        birth_place_parts = [
-            part
-            for part in [birth_city, birth_state, birth_country]
-            if part
-        ]
-        birth_place = ", ".join(birth_place_parts) if birth_place_parts else None
-        mlb_debut_date = info.get("mlbDebutDate")
-
-        data = {
-            "team_id": team.get("id"),
-            "team_name": team.get("name"),
-            "position": pos.get("name"),
-            "name": info.get("fullName"),
-            "full_name": info.get("fullFMLName"),
-            "birth_date": info.get("birthDate"),
-            "birth_place": birth_place,
-            "height": info.get("height"),
-            "weight": info.get("weight"),
-            "bat_side": bat.get("description"),
-            "throw_side": throw.get("description"),
-            "draft": draft_data,
-            "mlb_debut_date": mlb_debut_date,
-        }
+        data = _player_info_payload(info)
         return Response(data)
     except Exception as exc:  # pragma: no cover - defensive
         return Response({'error': str(exc)}, status=500)
@@ -215,23 +250,7 @@ def player_info(request, client, player_id: int):
 def player_stats(request, client, player_id: int):
     """Return career statistics for a player."""
 
-    key_mlbam = (
-        PlayerIdInfo.objects.filter(id=player_id)
-        .values_list("key_mlbam", flat=True)
-        .first()
-    )
-    if key_mlbam is None:
-        key_mlbam = (
-            PlayerIdInfo.objects.filter(key_mlbam=str(player_id))
-            .values_list("key_mlbam", flat=True)
-            .first()
-        )
-        if key_mlbam is None:
-            key_mlbam = str(player_id)
-
-    key_mlbam = str(key_mlbam)
-    if key_mlbam.endswith('.0'):
-        key_mlbam = key_mlbam[:-2]
+    key_mlbam = resolve_mlbam_id(player_id)
 
     try:
         data = client.fetch_player_stats_career(int(key_mlbam))
@@ -273,11 +292,48 @@ def player_career_stats_batch(request, client):
         return Response({'error': str(exc)}, status=500)
 
 
+def _monthly_splits_url(key_mlbam, season):
+    return (
+        f"https://statsapi.mlb.com/api/v1/people/{key_mlbam}"
+        f"?hydrate=stats(group=[hitting,pitching],type=byMonth,season={season})"
+    )
+
+
+def _parse_monthly_splits(payload):
+    """Return ``(batting, pitching)`` month-by-month splits from a people payload."""
+    stats = payload.get("people", [{}])[0].get("stats", [])
+    monthly_bat = []
+    monthly_pit = []
+    for group in stats:
+        display = group.get("group", {}).get("displayName")
+        splits = group.get("splits", [])
+        if display == "hitting":
+            monthly_bat = splits
+        elif display == "pitching":
+            monthly_pit = splits
+    monthly_bat.sort(key=lambda s: int(s.get("month", 0)))
+    monthly_pit.sort(key=lambda s: int(s.get("month", 0)))
+    return monthly_bat, monthly_pit
+
+
+def _fetch_monthly_splits(key_mlbam, season):
+    """Return ``(batting, pitching)`` month-by-month splits from statsapi."""
+    monthly_url = _monthly_splits_url(key_mlbam, season)
+    logger.info("Fetching monthly splits, url=%s", monthly_url)
+    resp = http_client.get(monthly_url, name="player_splits_monthly")
+    return _parse_monthly_splits(resp.json())
+
+
 @extend_schema(responses=OpenApiTypes.OBJECT)
 @api_view(['GET'])
 @require_unified_client
 def player_splits(request, client, player_id: int):
-    """Return batting and pitching splits for a player."""
+    """Return batting and pitching splits for a player.
+
+    The batting, pitching and monthly fetches run concurrently.  Branches that
+    fail or time out are listed under ``unavailable`` and the remaining data
+    is still returned; the request only fails when both splits are missing.
+    """
     logger.info("Fetching splits for player_id=%s", player_id)
     season_param = request.GET.get('season')
     try:
@@ -285,23 +341,7 @@ def player_splits(request, client, player_id: int):
     except (TypeError, ValueError):
         season = datetime.now().year
 
-    key_mlbam = (
-        PlayerIdInfo.objects.filter(id=player_id)
-        .values_list("key_mlbam", flat=True)
-        .first()
-    )
-    if key_mlbam is None:
-        key_mlbam = (
-            PlayerIdInfo.objects.filter(key_mlbam=str(player_id))
-            .values_list("key_mlbam", flat=True)
-            .first()
-        )
-        if key_mlbam is None:
-            key_mlbam = str(player_id)
-
-    key_mlbam = str(key_mlbam)
-    if key_mlbam.endswith('.0'):
-        key_mlbam = key_mlbam[:-2]
+    key_mlbam = resolve_mlbam_id(player_id)
 
     # def _df_to_records(df):
     #     try:
@@ -316,44 +356,28 @@ def player_splits(request, client, player_id: int):
 
     try:
         logger.info(
-            "Fetching batting splits for player_id=%s, key_mlbam=%s", player_id, key_mlbam
+            "Fetching splits for player_id=%s, key_mlbam=%s", player_id, key_mlbam
+        )
+        branches = fan_out(
+            {
+                "batting": lambda c: c.fetch_batting_splits(int(key_mlbam), season),
+                "pitching": lambda c: c.fetch_pitching_splits(int(key_mlbam), season),
+                "monthly": lambda c: _fetch_monthly_splits(key_mlbam, season),
+            },
+            client=client,
+            timeouts=SPLITS_TIMEOUTS,
         )
-        bat_json = client.fetch_batting_splits(int(key_mlbam), season)
-        logger.info("Fetching pitching splits for player_id=%s", player_id)
-        pit_json = client.fetch_pitching_splits(int(key_mlbam), season)
-
-        monthly_bat = []
-        monthly_pit = []
-        try:
-            monthly_url = (
-                f"https://statsapi.mlb.com/api/v1/people/{key_mlbam}"
-                f"?hydrate=stats(group=[hitting,pitching],type=byMonth,season={season})"
-            )
-            logger.info(
-                "Fetching monthly splits for player_id=%s, url=%s", player_id, monthly_url
-            )
-            resp = requests.get(monthly_url, timeout=10)
-            stats = resp.json().get("people", [{}])[0].get("stats", [])
-            for group in stats:
-                display = group.get("group", {}).get("displayName")
-                splits = group.get("splits", [])
-                if display == "hitting":
-                    monthly_bat = splits
-                elif display == "pitching":
-                    monthly_pit = splits
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.error(
-                "Error fetching monthly splits for player_id=%s: %s", player_id, exc
-            )
-
-        monthly_bat.sort(key=lambda s: int(s.get("month", 0)))
-        monthly_pit.sort(key=lambda s: int(s.get("month", 0)))
+        if "batting" in branches.errors and "pitching" in branches.errors:
+            branches.raise_first("batting", "pitching")
 
+        monthly_bat, monthly_pit = branches.get("monthly") or ([], [])
         data = {
-            "batting": bat_json,
-            "pitching": pit_json,
+            "batting": branches.get("batting"),
+            "pitching": branches.get("pitching"),
             "monthly": {"batting": monthly_bat, "pitching": monthly_pit},
         }
+        if branches.failed:
+            data["unavailable"] = branches.failed
         data = _replace_non_finite(data)
         logger.info(
             "Fetched splits for player_id=%s, key_mlbam=%s", player_id, key_mlbam
@@ -383,23 +407,7 @@ def player_gamelog(request, client, player_id: int):
     except (TypeError, ValueError):
         season = datetime.now().year
 
-    key_mlbam = (
-        PlayerIdInfo.objects.filter(id=player_id)
-        .values_list("key_mlbam", flat=True)
-        .first()
-    )
-    if key_mlbam is None:
-        key_mlbam = (
-            PlayerIdInfo.objects.filter(key_mlbam=str(player_id))
-            .values_list("key_mlbam", flat=True)
-            .first()
-        )
-        if key_mlbam is None:
-            key_mlbam = str(player_id)
-
-    key_mlbam = str(key_mlbam)
-    if key_mlbam.endswith('.0'):
-        key_mlbam = key_mlbam[:-2]
+    key_mlbam = resolve_mlbam_id(player_id)
 
     try:
         data = client.fetch_player_gamelog(int(key_mlbam), stat_type, season)
@@ -472,23 +480,7 @@ def player_statcast_pitcher_data(request, client, player_id: int):
     if not start_date or not end_date:
         return Response({'error': 'start_date and end_date are required'}, status=400)
 
-    key_mlbam = (
-        PlayerIdInfo.objects.filter(id=player_id)
-        .values_list("key_mlbam", flat=True)
-        .first()
-    )
-    if key_mlbam is None:
-        key_mlbam = (
-            PlayerIdInfo.objects.filter(key_mlbam=str(player_id))
-            .values_list("key_mlbam", flat=True)
-            .first()
-        )
-        if key_mlbam is None:
-            key_mlbam = str(player_id)
-
-    key_mlbam = str(key_mlbam)
-    if key_mlbam.endswith('.0'):
-        key_mlbam = key_mlbam[:-2]
+    key_mlbam = resolve_mlbam_id(player_id)
 
     try:
         data = client.fetch_statcast_pitcher_data(
@@ -505,6 +497,19 @@ def player_statcast_pitcher_data(request, client, player_id: int):
         return Response({'error': str(exc)}, status=500)
 
 
+def fetch_leaderboards(client, season):
+    """Fetch the batting and pitching leaderboards concurrently."""
+    branches = fan_out(
+        {
+            "batting": lambda c: c.fetch_batting_leaderboards(season),
+            "pitching": lambda c: c.fetch_pitching_leaderboards(season),
+        },
+        client=client,
+    )
+    branches.raise_first("batting", "pitching")
+    return branches.get("batting"), branches.get("pitching")
+
+
 @extend_schema(responses=LeagueLeadersSerializer)
 @api_view(['GET'])
 @require_unified_client
@@ -514,8 +519,7 @@ def league_leaders(request, client):
     season = datetime.now().year
 
     try:
-        bat_df = client.fetch_batting_leaderboards(season)
-        pit_df = client.fetch_pitching_leaderboards(season)
+        bat_df, pit_df = fetch_leaderboards(client, season)
     except Exception as exc:  # pragma: no cover - defensive
         logger.error("Error fetching leaderboards: %s", exc)
         return Response({'error': str(exc)}, status=500)
@@ -3,80 +3,71 @@
 from datetime import datetime
 import logging
 
-from django.core.cache import cache
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
+from ..caching import cached_fetch, thread_client
+from ..schedule_days import parse_schedule_range
+from ..season_schedule import game_teams, get_schedule
+from ..team_logos import attach_game_logos, attach_schedule_logos
 from ..utils import require_unified_client
 
 logger = logging.getLogger(__name__)
 
 STANDINGS_CACHE_TIMEOUT = 60 * 60  # one hour
+STANDINGS_STALE_TIMEOUT = 6 * 60 * 60  # serve stale for six more hours
 
 
 def _get_cached_standings(client, season, league_ids="103,104"):
-    """Return standings data using cache to avoid redundant API calls."""
+    """Return standings data using cache to avoid redundant API calls.
+
+    Expired standings are served stale while a background refresh runs, so
+    only a cold cache makes the request wait on upstream.
+    """
     logger.info("Fetching standings for season=%s, league_ids=%s", season, league_ids)
     cache_key = f"standings:{season}:{league_ids}"
-    data = cache.get(cache_key)
-    if data is None:
-        # The UnifiedDataClient exposes ``fetch_standings_data``. Using the wrong
-        # method name meant the mock in tests wasn't triggered, leading to an
-        # Internal Server Error. Invoke the correct method so the provided
-        # standings data is returned during testing and in production.
-        data = client.fetch_standings_data(season=season, league_ids=league_ids)
-        cache.set(cache_key, data, STANDINGS_CACHE_TIMEOUT)
-    return data
+    # The UnifiedDataClient exposes ``fetch_standings_data``. Using the wrong
+    # method name meant the mock in tests wasn't triggered, leading to an
+    # Internal Server Error. Invoke the correct method so the provided
+    # standings data is returned during testing and in production.
+    return cached_fetch(
+        cache_key,
+        lambda: client.fetch_standings_data(season=season, league_ids=league_ids),
+        STANDINGS_CACHE_TIMEOUT,
+        STANDINGS_STALE_TIMEOUT,
+        refresh=lambda: thread_client(client).fetch_standings_data(
+            season=season, league_ids=league_ids
+        ),
+    )
 
 
 @extend_schema(
     parameters=[
         OpenApiParameter('date', OpenApiTypes.DATE, OpenApiParameter.QUERY),
+        OpenApiParameter('start_date', OpenApiTypes.DATE, OpenApiParameter.QUERY),
+        OpenApiParameter('end_date', OpenApiTypes.DATE, OpenApiParameter.QUERY),
     ],
     responses=OpenApiTypes.OBJECT,
 )
 @api_view(['GET'])
 @require_unified_client
 def schedule(request, client):
-    """Return schedule data for a given date."""
-    date_str = request.GET.get('date')
-    if not date_str:
-        return Response({'error': 'date parameter is required'}, status=400)
+    """Return schedule data for a date or a ``start_date``..``end_date`` range.
+
+    Loaded seasons are answered from the stored schedule (see
+    :mod:`apps.api.season_schedule`); other days are cached individually (see
+    :mod:`apps.api.schedule_days`), so only days missing from the cache are
+    fetched upstream, in one call.
+    """
     try:
-        schedule_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-    except ValueError:
-        return Response({'error': 'Invalid date format'}, status=400)
+        start, end = parse_schedule_range(request.GET)
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=400)
     try:
-        # Retrieve the day's schedule. The UnifiedDataClient exposes a
-        # ``fetch_schedule_for_date_range`` helper which returns a list of
-        # days, each containing the scheduled games. The previous
-        # implementation attempted to call a misspelled
-        # ``fetc_schedule_for_date_range`` method which does not exist,
-        # resulting in a ``MagicMock`` being returned during tests and a
-        # subsequent failure when serialising the response. Use the correct
-        # method so that the mocked data provided by the tests is utilised
-        # properly.
-        schedule_data = client.fetch_schedule_for_date_range(schedule_date, schedule_date)
-        for day in schedule_data:
-            for game in day.get('games', []):
-                teams = game.get('teams', {})
-                for side in ('home', 'away'):
-                    team = teams.get(side, {}).get('team')
-                    team_id = team.get('id') if team else None
-                    if team_id:
-                        try:
-                            # ``UnifiedDataClient`` exposes a
-                            # ``get_team_spot_url`` method which returns the
-                            # URL for a team's logo. The previous code called
-                            # ``fetch_team_spot_url`` which isn't patched in
-                            # the tests and therefore returned an arbitrary
-                            # ``MagicMock`` object that isn't JSON
-                            # serialisable. Use the correct method name.
-                            team['logo_url'] = client.fetch_team_spot_url(team_id, 32)
-                        except Exception:  # pragma: no cover - defensive
-                            team['logo_url'] = None
+        schedule_data = get_schedule(client, start, end)
+        attach_schedule_logos(schedule_data)
         return Response(schedule_data)
     except Exception as exc:  # pragma: no cover - defensive
         return Response({'error': str(exc)}, status=500)
@@ -93,23 +84,7 @@ def game_data(request, client, game_pk: int):
         logger.info("Fetched game data for game_pk=%s", game_pk)
         logger.info("away team id: %s",  data.get('gameData').get('teams').get('away').get('id'))
 
-        home_id = data.get('gameData', {}).get('teams', {}).get('home', {}).get('id')
-        away_id = data.get('gameData', {}).get('teams', {}).get('away', {}).get('id')
-
-        try:
-            if home_id:
-                logger.info("Fetching logo for home team id=%s", home_id)
-                data['gameData']['teams']['home']['logo_url'] = client.fetch_team_spot_url(
-                    home_id, 32
-                )
-            if away_id:
-                logger.info("Fetching logo for away team id=%s", away_id)
-                data['gameData']['teams']['away']['logo_url'] = client.fetch_team_spot_url(
-                    away_id, 32
-                )
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.error("Error fetching team logo: %s", exc)
-        
+        attach_game_logos(data)
 
         return Response(data)
     except Exception as exc:  # pragma: no cover - defensive
@@ -124,10 +99,13 @@ def predict_game(request, client, game_pk: int):
     """Estimate win probabilities for a single game."""
 
     try:
-        game_data = client.fetch_game_live_feed(game_pk)
-
-        home_id = game_data.get('home_team_data', {}).get('id')
-        away_id = game_data.get('away_team_data', {}).get('id')
+        teams = game_teams(game_pk)
+        if teams is not None:
+            home_id, away_id = teams
+        else:
+            game_data = client.fetch_game_live_feed(game_pk)
+            home_id = game_data.get('home_team_data', {}).get('id')
+            away_id = game_data.get('away_team_data', {}).get('id')
 
         season = datetime.now().year
         standings = _get_cached_standings(client, season, "103,104")
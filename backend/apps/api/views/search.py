@@ -0,0 +1,131 @@
+"""Combined player, team and venue search."""
+
+import base64
+import binascii
+import json
+
+from django.db.models import Case, IntegerField, Value, When
+from drf_spectacular.utils import extend_schema
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from ..models import TeamIdInfo, Venue
+from ..search import name_search
+from ..serializers import SearchQuerySerializer, SearchResponseSerializer
+from .players import player_search_results
+
+SEARCH_TYPES = ('players', 'teams', 'venues')
+DEFAULT_LIMIT = 5
+
+
+def _encode_cursor(search_type, query, offset):
+    payload = json.dumps({'t': search_type, 'q': query, 'o': offset}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def _decode_cursor(cursor, query):
+    """Return ``(type, offset)`` from a cursor, or ``None`` if it is invalid."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        search_type, offset = payload['t'], int(payload['o'])
+        cursor_query = payload['q']
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        return None
+    if search_type not in SEARCH_TYPES or offset < 0 or cursor_query != query:
+        return None
+    return search_type, offset
+
+
+def _prefix_first(field, query):
+    return Case(
+        When(**{f'{field}__istartswith': query}, then=Value(0)),
+        default=Value(1),
+        output_field=IntegerField(),
+    )
+
+
+def _team_results(query, limit, offset):
+    rows = (
+        name_search(TeamIdInfo.objects, 'full_name', query)
+        .order_by(_prefix_first('full_name', query), 'full_name')
+        .values('id', 'full_name', 'mlbam_team_id')[offset:offset + limit]
+    )
+    return [
+        {
+            'id': row['id'],
+            'full_name': row['full_name'],
+            'mlbam_team_id': (
+                str(row['mlbam_team_id']) if row['mlbam_team_id'] is not None else None
+            ),
+        }
+        for row in rows
+    ]
+
+
+def _venue_results(query, limit, offset):
+    # Venues have one row per season; keep the latest matching row of each
+    # venue, then rank the venues like teams.
+    rows = (
+        name_search(Venue.objects, 'name', query)
+        .annotate(prefix=_prefix_first('name', query))
+        .order_by('mlbam_id', '-season')
+        .values('mlbam_id', 'name', 'prefix')
+    )
+    latest = {}
+    for row in rows:
+        key = row['mlbam_id'] if row['mlbam_id'] is not None else row['name']
+        latest.setdefault(key, row)
+    ranked = sorted(latest.values(), key=lambda row: (row['prefix'], row['name'] or ''))
+    return [
+        {'mlbam_id': row['mlbam_id'], 'name': row['name']}
+        for row in ranked[offset:offset + limit]
+    ]
+
+
+SEARCHERS = {
+    'players': player_search_results,
+    'teams': _team_results,
+    'venues': _venue_results,
+}
+
+
+@extend_schema(parameters=[SearchQuerySerializer], responses=SearchResponseSerializer)
+@api_view(['GET'])
+def search(request):
+    """Search players, teams and venues in one request.
+
+    Each requested type is returned as its own ranked group with a ``next``
+    cursor.  Passing that cursor back returns the next page of that type only.
+    """
+    params = SearchQuerySerializer(data=request.GET)
+    params.is_valid(raise_exception=True)
+    query = params.validated_data['q'].strip()
+    limit = params.validated_data.get('limit', DEFAULT_LIMIT)
+
+    offsets = {}
+    cursor = params.validated_data.get('cursor')
+    if cursor:
+        decoded = _decode_cursor(cursor, query)
+        if decoded is None:
+            return Response({'error': 'Invalid cursor'}, status=400)
+        search_type, offset = decoded
+        offsets[search_type] = offset
+    else:
+        types = params.validated_data.get('types')
+        requested = [t.strip() for t in types.split(',')] if types else SEARCH_TYPES
+        unknown = sorted(set(requested) - set(SEARCH_TYPES))
+        if unknown:
+            return Response({'error': f"Unknown types: {', '.join(unknown)}"}, status=400)
+        offsets = {search_type: 0 for search_type in SEARCH_TYPES if search_type in requested}
+
+    body = {}
+    for search_type, offset in offsets.items():
+        # One extra row tells whether there is a next page.
+        results = SEARCHERS[search_type](query, limit + 1, offset)
+        more = len(results) > limit
+        body[search_type] = {
+            'results': results[:limit],
+            'next': _encode_cursor(search_type, query, offset + limit) if more else None,
+        }
+    return Response(body)
@@ -11,8 +11,11 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiRespon
 from drf_spectacular.types import OpenApiTypes
 
 from ..models import TeamIdInfo, Venue
-from ..utils import require_unified_client
+from ..search import name_search
+from ..season_schedule import recent_schedule
+from ..utils import pooled_client, require_unified_client
 from ..serializers import TeamSearchResultSerializer, TeamInfoSerializer
+from .players import fetch_leaderboards
 
 logger = logging.getLogger(__name__)
 
@@ -29,8 +32,7 @@ def team_search(request):
         return Response([])
 
     rows = (
-        TeamIdInfo.objects
-        .filter(full_name__icontains=query)
+        name_search(TeamIdInfo.objects, 'full_name', query)
         .order_by('full_name')
         .values('id', 'full_name', 'mlbam_team_id')[:10]
     )
@@ -72,8 +74,8 @@ def team_info(request, mlbam_team_id: int):
     from . import UnifiedDataClient as _UnifiedDataClient
     if _UnifiedDataClient is not None:
         try:
-            client = _UnifiedDataClient()
-            team_data = client.fetch_team(int(mlbam_team_id_value))
+            with pooled_client(_UnifiedDataClient, request) as client:
+                team_data = client.fetch_team(int(mlbam_team_id_value))
             venue = team_data.get('venue') or {}
             venue_id = venue.get('id')
         except Exception:  # pragma: no cover - defensive
@@ -133,9 +135,16 @@ def team_record(request, client, team_id: int):
 @api_view(['GET'])
 @require_unified_client
 def team_recent_schedule(request, client, team_id: int):
-    """Return the previous and next five games for a team."""
+    """Return the previous and next five games for a team.
+
+    Answered from the stored season schedule when possible (see
+    :mod:`apps.api.season_schedule`).
+    """
 
     try:
+        schedule = recent_schedule(int(team_id))
+        if schedule is not None:
+            return Response(schedule)
         logger.info("Fetching recent schedule for mlbam_team_id=%s", team_id)
         schedule = client.fetch_recent_schedule_for_team(int(team_id))
         return Response(schedule)
@@ -182,8 +191,7 @@ def team_leaders(request, client, mlbam_team_id: int):
     season = datetime.now().year
     logger.info("Using team abbrev=%s for mlbam_team_id=%s", abbrev, mlbam_team_id)
     try:
-        bat_df = client.fetch_batting_leaderboards(season)
-        pit_df = client.fetch_pitching_leaderboards(season)
+        bat_df, pit_df = fetch_leaderboards(client, season)
     except Exception as exc:  # pragma: no cover - defensive
         logger.error("Error fetching leaderboards: %s", exc)
         return Response({'error': str(exc)}, status=500)
@@ -19,7 +19,6 @@ class HomeViewTests(TestCase):
                 ]
             }
         ]
-        mock_client.fetch_team_spot_url.return_value = 'logo-url'
         client = Client()
         response = client.get('/')
         self.assertEqual(response.status_code, 200)
@@ -27,4 +26,4 @@ class HomeViewTests(TestCase):
         self.assertContains(response, 'id="vue-app"')
         # self.assertContains(response, 'Away Team')
         # self.assertContains(response, 'Home Team')
-        # self.assertContains(response, 'logo-url')
+        # self.assertContains(response, 'midfield.mlbstatic.com')
@@ -2,6 +2,9 @@ from datetime import date, datetime
 from zoneinfo import ZoneInfo
 from django.shortcuts import render
 import logging
+
+from apps.api.utils import pooled_client
+from apps.api.team_logos import attach_schedule_logos
 logger = logging.getLogger(__name__)
 
 try:
@@ -22,30 +25,18 @@ def schedule(request):
             f"Using baseball-data-lab UnifiedDataClient to fetch today's schedule. "
         )
         try:
-            client = UnifiedDataClient()
-            try:
-                today = datetime.now(ZoneInfo("America/New_York")).date()
-            except Exception:  # Fallback if zoneinfo unavailable
-                today = date.today()
-            schedule = client.fetch_schedule_for_date_range(today, today)
+            with pooled_client(UnifiedDataClient, request) as client:
+                try:
+                    today = datetime.now(ZoneInfo("America/New_York")).date()
+                except Exception:  # Fallback if zoneinfo unavailable
+                    today = date.today()
+                schedule = client.fetch_schedule_for_date_range(today, today)
 
-            # Attach team logo URLs for home and away teams
-            try:
-                for day in schedule:
-                    for game in day.get("games", []):
-                        teams = game.get("teams", {})
-                        for side in ("home", "away"):
-                            team = teams.get(side, {}).get("team")
-                            team_id = team.get("id") if team else None
-                            if team_id:
-                                try:
-                                    team["logo_url"] = client.fetch_team_spot_url(
-                                        team_id, 32
-                                    )
-                                except Exception:  # pragma: no cover - defensive
-                                    team["logo_url"] = None
-            except Exception:  # pragma: no cover - defensive
-                pass
+                # Attach team logo URLs for home and away teams
+                try:
+                    attach_schedule_logos(schedule)
+                except Exception:  # pragma: no cover - defensive
+                    pass
         except Exception as exc:  # pragma: no cover - defensive
             schedule = [f"Error fetching schedule: {exc}"]
     elif _bdl_error:
@@ -4,10 +4,13 @@ import shlex
 import subprocess
 from pathlib import Path
 
+from django.core.management import call_command
 from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
 from django.db import connections
 
+from apps.api import name_index
+
 class Command(BaseCommand):
     help = "Seed the database with CSVs (runs client-side psql \\COPY)."
 
@@ -72,7 +75,7 @@ class Command(BaseCommand):
 
         for p in (teams_csv, venues_csv, people_csv):
             if not p.exists():
-                if p is people_csv and opts["skip-people"]:
+                if p is people_csv and opts["skip_people"]:
                     # allowed to skip
                     continue
                 raise CommandError(f"CSV not found: {p}")
@@ -107,7 +110,7 @@ class Command(BaseCommand):
         )
 
         # player_id_infos
-        if not opts["skip-people"]:
+        if not opts["skip_people"]:
             # Your CSV has an extra 'key_npb' column you want to ignore.
             # Two approaches:
             # (A) If the CSV header order matches but includes key_npb, you can stage & insert.
@@ -172,4 +175,11 @@ FROM player_id_infos_staging;
             except subprocess.CalledProcessError as e:
                 raise CommandError(f"Seeding failed while running COPY.\nError code: {e.returncode}") from e
 
+        # COPY bypasses PlayerIdInfo.save() and model signals: fill the
+        # normalized name and key columns and tell running servers to rebuild.
+        if not opts["skip_people"]:
+            call_command("normalize_player_names", database=alias, stdout=self.stdout)
+            call_command("normalize_player_keys", database=alias, stdout=self.stdout)
+        name_index.invalidate()
+
         self.stdout.write(self.style.SUCCESS(f"✅ Seed complete against {name}@{host}:{port} (alias: {alias})"))
@@ -1,6 +1,7 @@
+import os
 from pathlib import Path
 
-from .env import SECRET_KEY, DATABASES
+from .env import SECRET_KEY, DATABASES, CACHES
 
 #BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -30,6 +31,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'apps.api.middleware.request_metrics_middleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -37,6 +39,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'apps.api.middleware.upstream_state_middleware',
 ]
 
 ROOT_URLCONF = 'baseball_data_lab_web.urls'
@@ -96,6 +99,145 @@ SPECTACULAR_SETTINGS = {
     'VERSION': '1.0.0',
 }
 
+# Seconds a pooled ``UnifiedDataClient`` is reused before being rebuilt.
+UNIFIED_CLIENT_MAX_AGE = 60 * 60
+# Consecutive failed requests (5xx or raised errors) before it is rebuilt.
+UNIFIED_CLIENT_MAX_FAILURES = 3
+
+# Pooled sessions used for direct statsapi requests (see apps.api.http_client).
+UPSTREAM_HTTP = {
+    'POOL_MAXSIZE': 10,
+    'RETRIES': 2,
+    'TIMEOUT': 5,
+    'TIMEOUTS': {
+        'player_splits_monthly': 10,
+    },
+    'RETRY_OVERRIDES': {},
+}
+
+# Cache UnifiedDataClient calls per apps.api.caching.DEFAULT_CACHE_POLICY.
+# Override individual TTLs (seconds) with UNIFIED_CLIENT_CACHE_TTLS.
+UNIFIED_CLIENT_CACHE_ENABLED = True
+UNIFIED_CLIENT_CACHE_TTLS = {}
+# Honour the X-Upstream-Cache: bypass|refresh header for every caller. It is
+# otherwise limited to staff users and DEBUG.
+UNIFIED_CLIENT_CACHE_HEADER_ENABLED = False
+
+# Coalesce concurrent identical upstream fetches (apps.api.singleflight).
+# The distributed lock is used when worker processes share a Redis cache.
+UPSTREAM_SINGLE_FLIGHT_DISTRIBUTED = bool(os.environ.get('REDIS_URL'))
+UPSTREAM_SINGLE_FLIGHT_LOCK_TIMEOUT = 30
+UPSTREAM_SINGLE_FLIGHT_WAIT = 15
+
+# Extra seconds cached client results may be served stale while a background
+# thread refreshes them (see apps.api.caching.DEFAULT_STALE_POLICY).
+UNIFIED_CLIENT_STALE_TTLS = {}
+UPSTREAM_REFRESH_WORKERS = 4
+
+# Thread pool used to run independent upstream fetches concurrently
+# (apps.api.fanout) and the default per-branch timeout in seconds.
+UPSTREAM_FANOUT_WORKERS = 16
+UPSTREAM_FANOUT_TIMEOUT = 15
+
+# Route the upstream-bound API endpoints to the async views in
+# apps.api.views.async_views; only useful under an ASGI server.
+API_ASYNC_VIEWS = os.environ.get('DJANGO_API_ASYNC_VIEWS', '') == '1'
+# Threads async views use to await blocking UnifiedDataClient calls.
+UPSTREAM_ASYNC_THREADS = 64
+
+# Per-upstream circuit breakers (apps.api.circuit); state is reported at
+# /api/health/upstreams/. While a breaker is open, cacheable client calls
+# serve their last known good result, kept for UPSTREAM_LAST_GOOD_TTL seconds.
+# SLOW_CALL_SECONDS is left unset: unified_client calls such as statcast
+# queries are legitimately slow, so only errors trip its breaker.
+UPSTREAM_CIRCUIT_BREAKER = {
+    'FAILURE_THRESHOLD': 5,
+    'RECOVERY_TIMEOUT': 30,
+    'HALF_OPEN_MAX_CALLS': 1,
+    'OVERRIDES': {},
+}
+UPSTREAM_LAST_GOOD_TTL = 7 * 24 * 60 * 60
+
+# Wall-time budget in seconds per request, keyed by URL name with a 'default'
+# entry (apps.api.middleware). Upstream calls only get the time left; once it
+# runs out enrichment is skipped or served from cache and the response carries
+# X-Partial-Response. Clients can ask for another budget with an
+# X-Request-Deadline header, capped at API_REQUEST_DEADLINE_MAX.
+API_REQUEST_DEADLINES = {
+    'default': 30,
+    'api-player-search': 5,
+    'api-hall-of-fame-search': 10,
+    'api-schedule': 15,
+}
+API_REQUEST_DEADLINE_MAX = 60
+
+# In-process token-prefix index used by player search (apps.api.name_index).
+# WARM_ON_STARTUP builds it in the background when the WSGI/ASGI app loads.
+# Each process checks the index version in the database every
+# VERSION_CHECK_SECONDS and rebuilds after a change.
+PLAYER_NAME_INDEX = {
+    'ENABLED': True,
+    'WARM_ON_STARTUP': True,
+    'VERSION_CHECK_SECONDS': 5,
+}
 
+# Entries of the per-process LRU mapping player ids to MLBAM ids
+# (apps.api.player_ids). 0 disables it.
+PLAYER_ID_CACHE_SIZE = 10000
+# Most ids accepted by one POST to /api/players/ids/.
+PLAYER_ID_TRANSLATE_MAX_IDS = 10000
+
+# Per-day schedule cache behind /api/schedule/ (apps.api.schedule_days): TTLs
+# in seconds for past days whose games are all final, other past days, today
+# and future days, and the longest start_date..end_date range accepted.
+SCHEDULE_DAY_CACHE = {
+    'ENABLED': True,
+    'FINAL_TTL': 30 * 24 * 60 * 60,
+    'PAST_TTL': 10 * 60,
+    'TODAY_TTL': 60,
+    'FUTURE_TTL': 60 * 60,
+    'MAX_DAYS': 62,
+}
+
+# Team logo URL by team id and pixel size, used to add logo_url to schedules
+# and game feeds without upstream calls (apps.api.team_logos).
+TEAM_LOGO_URL_TEMPLATE = 'https://midfield.mlbstatic.com/v1/team/{team_id}/spots/{size}'
+
+# Player search ranking (apps.api.ranking): score = active * ACTIVE_WEIGHT +
+# seasons since 1871 of the last season played * SEASON_WEIGHT + page views *
+# POPULARITY_WEIGHT. Recomputed by the refresh_player_ranking command.
+PLAYER_SEARCH_RANKING = {
+    'ACTIVE_WEIGHT': 100000,
+    'SEASON_WEIGHT': 100,
+    'POPULARITY_WEIGHT': 1,
+    'TRACK_POPULARITY': True,
+}
 
+# Current teams shown by player search come from the player_current_teams
+# table (refresh_player_teams command). Missing or stale players are fetched
+# in the background and cached for TTL seconds (apps.api.player_teams).
+PLAYER_TEAM_OVERLAY = {
+    'ENABLED': True,
+    'TTL': 10 * 60,
+    'STALE_AFTER': 24 * 60 * 60,
+}
 
+# Prometheus-text metrics at /api/metrics/ (apps.api.metrics). Payload sizes
+# serialize each upstream result once; disable them if that shows up in
+# profiles.
+API_METRICS_ENABLED = True
+API_METRICS_PAYLOAD_SIZES = True
+
+# Record upstream responses to fixture files or replay them offline with
+# injected latency (apps.api.replay). Modes: off, record, replay.
+UPSTREAM_REPLAY = {
+    'MODE': os.environ.get('DJANGO_UPSTREAM_REPLAY', 'off'),
+    'DIR': BASE_DIR / 'upstream_fixtures',
+    'LATENCY': 0.05,
+    'LATENCY_JITTER': 0.02,
+    'LATENCY_OVERRIDES': {
+        'fetch_game_live_feed': 0.25,
+        'fetch_statcast_batter_data': 1.0,
+        'fetch_statcast_pitcher_data': 1.0,
+    },
+}
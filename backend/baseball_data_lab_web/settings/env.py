@@ -45,3 +45,23 @@ else:
         }
     }
 
+
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ.get("REDIS_URL"),
+            "KEY_PREFIX": "bdl",
+        }
+    }
+else:
+    # Per-process memory cache for development and tests.  Production must
+    # set REDIS_URL: cached client calls, last known good payloads, schedule
+    # days and single-flight markers are meant to be shared by every worker,
+    # and the default 300 entries would evict each other constantly.
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "OPTIONS": {"MAX_ENTRIES": 50000},
+        }
+    }
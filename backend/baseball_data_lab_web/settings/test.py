@@ -4,3 +4,27 @@ from .env import DATABASES as ENV_DATABASES
 DEBUG = False
 
 DATABASES = ENV_DATABASES
+
+# Tests never share a cache with a running server, even when REDIS_URL is set.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {'MAX_ENTRIES': 50000},
+    }
+}
+UPSTREAM_SINGLE_FLIGHT_DISTRIBUTED = False
+
+# Mocked clients differ per test, so cached client calls must not leak
+# between tests. Tests exercising the cache enable it explicitly.
+UNIFIED_CLIENT_CACHE_ENABLED = False
+SCHEDULE_DAY_CACHE = {'ENABLED': False}
+
+# Test transactions roll back without signals, which would leave the player
+# name index out of date; tests exercising it enable it explicitly.
+PLAYER_NAME_INDEX = {'ENABLED': False}
+PLAYER_ID_CACHE_SIZE = 0
+
+# Page-view counts and missing player teams are handled in background
+# threads.
+PLAYER_SEARCH_RANKING = {'TRACK_POPULARITY': False}
+PLAYER_TEAM_OVERLAY = {'ENABLED': False}
@@ -4,3 +4,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'baseball_data_lab_web.settings.dev')
 
 application = get_wsgi_application()
+
+from apps.api.name_index import warm_in_background  # noqa: E402
+
+warm_in_background()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Measure how many concurrent API requests a running backend sustains.
+
+Fires ``--requests`` GET requests at each path with ``--concurrency`` requests
+in flight and prints throughput and latency percentiles as JSON.  Run it once
+against the WSGI setup and once against the ASGI setup to compare them:
+
+  # WSGI (current setup)
+  cd backend && python manage.py runserver 8000
+  python scripts/measure_concurrency.py http://localhost:8000 --concurrency 200
+
+  # ASGI with the async API views
+  cd backend && DJANGO_API_ASYNC_VIEWS=1 \\
+      uvicorn baseball_data_lab_web.asgi:application --port 8001
+  python scripts/measure_concurrency.py http://localhost:8001 --concurrency 200
+
+Only the standard library is required.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_PATHS = [
+    "/api/schedule/?date=2024-07-04",
+    "/api/players/660271/",
+    "/api/players/660271/splits/?season=2024",
+    "/api/teams/147/roster/",
+    "/api/teams/147/record/",
+]
+
+
+def fetch(url: str, timeout: float):
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            resp.read()
+            status = resp.status
+    except urllib.error.HTTPError as exc:
+        status = exc.code
+    except Exception:
+        status = None
+    return status, time.perf_counter() - started
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(base_url: str, path: str, total: int, concurrency: int, timeout: float):
+    url = base_url.rstrip("/") + path
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda _: fetch(url, timeout), range(total)))
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for status, latency in results if status == 200]
+    return {
+        "path": path,
+        "requests": total,
+        "concurrency": concurrency,
+        "ok": len(latencies),
+        "errors": total - len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 1) if elapsed else None,
+        "p50_ms": round(statistics.median(latencies) * 1000, 1) if latencies else None,
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1) if latencies else None,
+        "max_ms": round(max(latencies) * 1000, 1) if latencies else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("base_url", help="e.g. http://localhost:8000")
+    parser.add_argument("--path", action="append", dest="paths",
+                        help="path to request (repeatable)")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args(argv)
+
+    report = [
+        measure(args.base_url, path, args.requests, args.concurrency, args.timeout)
+        for path in args.paths or DEFAULT_PATHS
+    ]
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()